@@ -5,8 +5,26 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import AsyncIterator, List, Optional
 from app.models.job_posting_dto import JobPostingDTO, ScrapeRequest
+from app.services.executor import run_blocking
+
+
+@dataclass
+class ScrapeStats:
+    """
+    单次抓取的统计信息（由适配器在抓取过程中填充）
+
+    用于流式响应的结尾行、日志等，不影响返回的职位数据
+    """
+
+    pages: int = 0  # 成功获取的页数
+    fetched: int = 0  # 上游返回的原始职位数
+    transform_failures: int = 0  # 转换失败（跳过）的职位数
+    duplicates_removed: int = 0  # 去重移除的职位数
+    errors: List[str] = field(default_factory=list)  # 非致命错误（如单页失败）
+    truncated: bool = False  # 截止时间用尽，提前停止
 
 
 class BaseJobAdapter(ABC):
@@ -59,6 +77,63 @@ class BaseJobAdapter(ABC):
         """
         pass
 
+    async def scrape_async(self, request: ScrapeRequest) -> List[JobPostingDTO]:
+        """
+        异步抓取职位数据（子类可选实现）
+
+        默认实现：在平台专用线程池中运行同步的 scrape()，不阻塞事件循环。
+        有原生异步客户端的平台（如 SEEK）应覆盖此方法。
+
+        Args:
+            request: 爬取请求参数
+
+        Returns:
+            标准化的职位数据列表
+        """
+        return await run_blocking(self.platform_name, self.scrape, request)
+
+    async def iter_pages(
+        self,
+        request: ScrapeRequest,
+        stats: Optional[ScrapeStats] = None
+    ) -> AsyncIterator[List[JobPostingDTO]]:
+        """
+        逐页产出职位数据（子类可选实现）
+
+        默认实现：把 scrape_async() 的全部结果作为一页产出。
+        支持分页的平台（如 SEEK）应覆盖此方法，边抓取边产出，
+        调用方（如流式端点）无需在内存中保留全部结果。
+
+        Args:
+            request: 爬取请求参数
+            stats: 统计信息（可选，抓取过程中填充）
+
+        Yields:
+            List[JobPostingDTO]: 每页的职位
+        """
+        jobs = await self.scrape_async(request)
+        if stats is not None:
+            stats.pages += 1
+            stats.fetched += len(jobs)
+        yield jobs
+
+    async def warmup(self):
+        """
+        预热适配器（子类可选实现，应用启动时调用）
+
+        用于把首个请求才会发生的初始化提前到启动阶段：
+        - 导入重量级依赖
+        - 创建 HTTP 客户端
+        - 用样例数据跑一遍转换逻辑（不访问上游）
+        """
+        pass
+
+    async def aclose(self):
+        """
+        释放适配器资源（子类可选实现，应用关闭时调用）
+        """
+        pass
+
     @property
     @abstractmethod
     def platform_name(self) -> str:
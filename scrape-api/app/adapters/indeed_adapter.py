@@ -4,22 +4,47 @@ Indeed 平台适配器
 使用 JobSpy 库抓取 Indeed 职位数据并转换为统一的 JobPostingDTO 格式
 """
 
-from typing import List
+import asyncio
+import json
+import time
+from typing import Any, Dict, Iterable, List, Tuple
 from datetime import datetime, timezone
 from loguru import logger
 
-try:
-    from jobspy import scrape_jobs
-except ImportError:
-    logger.warning("JobSpy library not installed. Indeed scraping will not work.")
-    scrape_jobs = None
-
 from app.adapters.base_adapter import BaseJobAdapter, ScraperException
 from app.models.job_posting_dto import JobPostingDTO, ScrapeRequest, PlatformEnum
 from app.utils.location_parser import parse_location
 from app.utils.trade_extractor import extract_trade
 from app.utils.employment_type import normalize_employment_type
 from app.config.settings import settings
+from app.exceptions import CircuitOpenError, DeadlineExceededError, RequestCancelledError
+from app.services import deadline, metrics, tracing
+from app.services.cancellation import check_cancelled
+from app.services.circuit_breaker import guarded_sync
+from app.services.page_cache import get_page_cache, params_key
+from app.services.process_pool import get_indeed_process_pool, scrape_jobs_serialized
+from app.services.rate_limiter import throttle_sync
+
+# JobSpy（连同 pandas）导入很慢，只在 API 进程内首次抓取时加载；启用进程池时 API 进程不导入它们
+scrape_jobs = None
+
+
+def _load_scrape_jobs():
+    """
+    按需导入 JobSpy 的 scrape_jobs
+
+    Returns:
+        scrape_jobs 函数；JobSpy 未安装时返回 None
+    """
+    global scrape_jobs
+    if scrape_jobs is None:
+        try:
+            from jobspy import scrape_jobs as loaded
+        except ImportError:
+            logger.warning("JobSpy library not installed. Indeed scraping will not work.")
+            return None
+        scrape_jobs = loaded
+    return scrape_jobs
 
 
 class IndeedAdapter(BaseJobAdapter):
@@ -34,6 +59,27 @@ class IndeedAdapter(BaseJobAdapter):
         """平台名称"""
         return "indeed"
 
+    async def warmup(self):
+        """
+        预热：启动 JobSpy 进程池，并用样例数据跑一遍转换逻辑（不访问 Indeed）
+
+        进程池的 worker 启动时导入 JobSpy 和 pandas；未启用进程池时在线程中导入到 API 进程
+        """
+        pool = get_indeed_process_pool()
+        if pool is not None:
+            await asyncio.to_thread(pool.warmup)
+        else:
+            await asyncio.to_thread(_load_scrape_jobs)
+
+        self._transform_job({
+            "id": "warmup",
+            "title": "Tiler",
+            "company": "Warmup Pty Ltd",
+            "location": "Adelaide, SA",
+            "job_type": "fulltime",
+            "date_posted": "2025-12-20T10:00:00Z",
+        })
+
     def _deduplicate_by_source_id(self, jobs: List[JobPostingDTO]) -> List[JobPostingDTO]:
         """
         基于 source_id 去重
@@ -72,39 +118,48 @@ class IndeedAdapter(BaseJobAdapter):
         # 验证请求参数
         self.validate_request(request)
 
-        # 检查 JobSpy 是否可用
-        if scrape_jobs is None:
-            raise ScraperException("JobSpy library is not installed. Please run: pip install python-jobspy")
-
         logger.info(f"Starting Indeed scrape: keywords='{request.keywords}', location='{request.location}', max_results={request.max_results}")
 
+        query = {
+            "site_name": ['indeed'],
+            "search_term": request.keywords,
+            "location": request.location,
+            "results_wanted": request.max_results,
+            "country_indeed": settings.indeed_country,
+            "hours_old": None,  # 不限制发布时间
+        }
+
         try:
-            # 调用 JobSpy 抓取数据
-            df = scrape_jobs(
-                site_name=['indeed'],
-                search_term=request.keywords,
-                location=request.location,
-                results_wanted=request.max_results,
-                country_indeed=settings.indeed_country,
-                hours_old=None,  # 不限制发布时间
-            )
-
-            logger.info(f"JobSpy returned {len(df)} results")
-
-            # 转换数据
+            try:
+                rows = self._fetch_rows(query)
+            except DeadlineExceededError:
+                # JobSpy 没有超时参数：截止时间只能在调用前、进程池等待时和转换时生效
+                logger.warning("Indeed scrape stopped: request deadline exceeded before JobSpy returned")
+                return []
+
+            # 转换数据（调用方断开或截止时间用尽后不再转换剩余的行）
             jobs = []
-            for idx, row in df.iterrows():
+            for idx, row in rows:
+                check_cancelled(self.platform_name)
+                if deadline.out_of_time():
+                    logger.warning(f"Indeed transform stopped at row {idx}: request deadline exceeded")
+                    break
+                start = time.perf_counter()
                 try:
                     job = self._transform_job(row)
+                    metrics.record_transform(self.platform_name, time.perf_counter() - start)
                     jobs.append(job)
                 except Exception as e:
+                    metrics.record_transform_failure(self.platform_name, e)
                     logger.warning(f"Failed to transform job at index {idx}: {e}")
                     continue
 
             # 🔧 FIX: 去重 - 基于 source_id
             original_count = len(jobs)
-            jobs = self._deduplicate_by_source_id(jobs)
+            with metrics.timed(metrics.DEDUP_SECONDS, self.platform_name):
+                jobs = self._deduplicate_by_source_id(jobs)
             duplicates_removed = original_count - len(jobs)
+            metrics.record_duplicates(self.platform_name, duplicates_removed)
 
             if duplicates_removed > 0:
                 logger.warning(f"移除了 {duplicates_removed} 个重复职位（基于 source_id）")
@@ -127,10 +182,87 @@ class IndeedAdapter(BaseJobAdapter):
             logger.info(f"Successfully transformed {len(jobs)} jobs (after deduplication)")
             return jobs
 
+        except (CircuitOpenError, RequestCancelledError):
+            raise
         except Exception as e:
             logger.error(f"Indeed scraping failed: {e}")
             raise ScraperException(f"Failed to scrape Indeed: {str(e)}")
 
+    def _fetch_rows(self, query: Dict[str, Any]) -> Iterable[Tuple[Any, Any]]:
+        """
+        获取 JobSpy 原始结果（优先读取页面缓存）
+
+        启用进程池时在 worker 进程中调用 JobSpy；缓存和进程池都以 JSON records 传递 DataFrame，
+        此时返回 dict 行（_transform_job 对 dict 和 DataFrame 行通用）
+
+        Args:
+            query: scrape_jobs() 参数
+
+        Returns:
+            Iterable[Tuple[Any, Any]]: (索引, 行) 序列
+
+        Raises:
+            ScraperException: JobSpy 未安装，或 worker 进程异常退出
+            ScraperTimeoutError: worker 进程抓取超时
+            DeadlineExceededError: 请求的截止时间已过
+            CircuitOpenError: Indeed 熔断器打开
+        """
+        cache = get_page_cache()
+        key = params_key(query)
+
+        if cache is not None:
+            payload = cache.get(self.platform_name, key, 1)
+            if payload is not None:
+                try:
+                    with metrics.timed(metrics.VALIDATION_SECONDS, self.platform_name):
+                        records = json.loads(payload)
+                    logger.info(f"Indeed page cache hit: {len(records)} results")
+                    return enumerate(records)
+                except ValueError:
+                    logger.warning("Indeed 页面缓存内容不是有效的 JSON，忽略")
+
+        # 整个 scrape_jobs() 调用计为一次上游请求
+        # JobSpy 的异常没有分类，全部计入熔断失败率
+        throttle_sync(self.platform_name)
+        check_cancelled(self.platform_name)  # 限流等待期间调用方可能已断开
+        deadline.check(self.platform_name)
+
+        pool = get_indeed_process_pool()
+        if pool is not None:
+            # 在 worker 进程中抓取，结果以 JSON records 返回（与页面缓存格式相同）
+            with metrics.timed(metrics.UPSTREAM_FETCH_SECONDS, self.platform_name), \
+                    tracing.span("indeed.jobspy", process_pool=True):
+                payload = guarded_sync(
+                    self.platform_name,
+                    lambda: pool.call(scrape_jobs_serialized, query),
+                    is_failure=lambda error: True
+                )
+            metrics.record_upstream_bytes(self.platform_name, len(payload))
+            with metrics.timed(metrics.VALIDATION_SECONDS, self.platform_name):
+                records = json.loads(payload)
+            logger.info(f"JobSpy worker returned {len(records)} results")
+
+            if cache is not None:
+                cache.set(self.platform_name, key, 1, payload)
+
+            return enumerate(records)
+
+        # 检查 JobSpy 是否可用
+        scrape = _load_scrape_jobs()
+        if scrape is None:
+            raise ScraperException("JobSpy library is not installed. Please run: pip install python-jobspy")
+
+        # 进程内调用时 JobSpy 不暴露响应字节数，只记录耗时
+        with metrics.timed(metrics.UPSTREAM_FETCH_SECONDS, self.platform_name), \
+                tracing.span("indeed.jobspy", process_pool=False):
+            df = guarded_sync(self.platform_name, lambda: scrape(**query), is_failure=lambda error: True)
+        logger.info(f"JobSpy returned {len(df)} results")
+
+        if cache is not None:
+            cache.set(self.platform_name, key, 1, df.to_json(orient="records", date_format="iso"))
+
+        return df.iterrows()
+
     def _transform_job(self, row) -> JobPostingDTO:
         """
         将 JobSpy 返回的 DataFrame 行转换为 JobPostingDTO
@@ -143,11 +275,13 @@ class IndeedAdapter(BaseJobAdapter):
         """
         # 解析地点
         location_str = row.get('location', '')
-        state, suburb = parse_location(location_str) if location_str else (None, None)
+        with tracing.span("utils.parse_location"):
+            state, suburb = parse_location(location_str) if location_str else (None, None)
 
         # 提取 trade
         title = row.get('title', '')
-        trade = extract_trade(title) if title else None
+        with tracing.span("utils.extract_trade"):
+            trade = extract_trade(title) if title else None
 
         # 标准化工作类型
         job_type = row.get('job_type')
@@ -0,0 +1,130 @@
+"""
+适配器注册表
+
+进程内每个平台只有一个适配器实例：
+1. 自动发现：扫描 app.adapters 包，收集 BaseJobAdapter 的所有具体子类
+2. 启动预热：应用启动时实例化并调用 warmup()，首个请求不再承担初始化成本
+3. 统一关闭：应用关闭时调用每个适配器的 aclose()
+
+新增平台只需在 app/adapters/ 下添加继承 BaseJobAdapter 的模块
+"""
+
+import importlib
+import inspect
+import pkgutil
+import time
+from typing import Dict, List, Type
+
+from loguru import logger
+
+import app.adapters as adapters_package
+from app.adapters.base_adapter import BaseJobAdapter
+from app.exceptions import ScraperConfigurationError
+
+
+def discover_adapter_classes() -> List[Type[BaseJobAdapter]]:
+    """
+    发现所有具体的适配器类
+
+    导入 app.adapters 下的所有模块，然后递归收集 BaseJobAdapter 的非抽象子类
+
+    Returns:
+        List[Type[BaseJobAdapter]]: 适配器类列表
+    """
+    for module_info in pkgutil.iter_modules(adapters_package.__path__):
+        importlib.import_module(f"{adapters_package.__name__}.{module_info.name}")
+
+    classes = []
+    pending = list(BaseJobAdapter.__subclasses__())
+    while pending:
+        cls = pending.pop(0)
+        pending.extend(cls.__subclasses__())
+        if not inspect.isabstract(cls) and cls.__module__.startswith(adapters_package.__name__):
+            classes.append(cls)
+    return classes
+
+
+class AdapterRegistry:
+    """
+    平台名称 → 适配器实例
+
+    未调用 startup() 时（脚本、测试），get() 会按需发现并实例化适配器
+    """
+
+    def __init__(self):
+        self._adapters: Dict[str, BaseJobAdapter] = {}
+        self._started = False
+
+    def _load(self):
+        """实例化所有发现的适配器（每个平台一个实例）"""
+        for cls in discover_adapter_classes():
+            adapter = cls()
+            if adapter.platform_name in self._adapters:
+                continue
+            self._adapters[adapter.platform_name] = adapter
+        self._started = True
+
+    def register(self, adapter: BaseJobAdapter):
+        """
+        手动注册适配器（覆盖同平台的已有实例）
+
+        Args:
+            adapter: 适配器实例
+        """
+        self._adapters[adapter.platform_name] = adapter
+
+    def get(self, platform: str) -> BaseJobAdapter:
+        """
+        获取平台适配器
+
+        Args:
+            platform: 平台名称（seek, indeed）
+
+        Returns:
+            BaseJobAdapter: 该平台的共享适配器实例
+
+        Raises:
+            ScraperConfigurationError: 不支持的平台
+        """
+        if not self._started:
+            self._load()
+
+        platform = getattr(platform, "value", platform)
+        adapter = self._adapters.get(platform)
+        if adapter is None:
+            raise ScraperConfigurationError(f"Unsupported platform: {platform}", platform=platform)
+        return adapter
+
+    @property
+    def platforms(self) -> List[str]:
+        """已注册的平台名称"""
+        if not self._started:
+            self._load()
+        return list(self._adapters)
+
+    async def startup(self):
+        """实例化并预热所有适配器（预热失败只记录警告，不阻止启动）"""
+        if not self._started:
+            self._load()
+
+        for platform, adapter in self._adapters.items():
+            start = time.perf_counter()
+            try:
+                await adapter.warmup()
+                logger.info(f"Warmed up {platform} adapter in {(time.perf_counter() - start) * 1000:.0f}ms")
+            except Exception as e:
+                logger.warning(f"Warm-up of {platform} adapter failed: {e}")
+
+    async def shutdown(self):
+        """关闭所有适配器并清空注册表"""
+        for platform, adapter in self._adapters.items():
+            try:
+                await adapter.aclose()
+            except Exception as e:
+                logger.warning(f"Closing {platform} adapter failed: {e}")
+        self._adapters.clear()
+        self._started = False
+
+
+# 全局注册表实例
+adapter_registry = AdapterRegistry()
@@ -4,25 +4,44 @@ SEEK 职位数据适配器
 使用 SEEK 内部 GraphQL API 获取职位数据
 """
 
+import asyncio
+import json
 import logging
+import math
+import time
+from collections import deque
+
+import httpx
 import requests
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any, Set, Tuple
 from datetime import datetime, timezone
 
 from app.models.job_posting_dto import JobPostingDTO, ScrapeRequest, PlatformEnum
-from app.adapters.base_adapter import BaseJobAdapter
+from app.adapters.base_adapter import BaseJobAdapter, ScrapeStats
+from app.config.settings import settings
+from app.services.http_client import get_http_client
+from app.services import deadline, metrics, tracing
+from app.services.cancellation import check_cancelled
+from app.services.circuit_breaker import guarded, guarded_sync
+from app.services.page_cache import PageCache, get_page_cache, params_key
+from app.services.rate_limiter import throttle, throttle_sync
+from app.services.retry import parse_retry_after, retrier
 from app.utils.location_parser import parse_location
 from app.utils.trade_extractor import extract_trade
 from app.utils.employment_type import normalize_employment_type
 from app.utils.salary_parser import parse_salary_range
 from app.utils.html_cleaner import clean_html
 from app.exceptions import (
+    CircuitOpenError,
+    ScraperException,
     ScraperNetworkError,
     ScraperTimeoutError,
     ScraperDataError,
     ScraperValidationError,
     ScraperParsingError,
     PlatformException,
+    DeadlineExceededError,
+    RequestCancelledError,
     classify_http_error
 )
 
@@ -37,7 +56,11 @@ class SeekAdapter(BaseJobAdapter):
     使用 SEEK 内部 GraphQL API 获取职位数据
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        http_client: Optional[httpx.AsyncClient] = None,
+        page_cache: Optional[PageCache] = None
+    ):
         """
         初始化 SEEK 适配器
 
@@ -45,9 +68,16 @@ class SeekAdapter(BaseJobAdapter):
             - API 端点: SEEK GraphQL API
             - Headers: 必需的请求头（User-Agent, seek-request-brand 等）
             - GraphQL Query: 职位搜索查询模板
+
+        Args:
+            http_client: 异步 HTTP 客户端（默认使用全局共享连接池）
+            page_cache: 原始页面磁盘缓存（默认使用全局页面缓存）
         """
         super().__init__()
 
+        self._http_client = http_client
+        self._page_cache = page_cache
+
         # SEEK REST API 端点（内部 API）
         self.api_url = "https://www.seek.com.au/api/jobsearch/v5/search"
 
@@ -64,9 +94,29 @@ class SeekAdapter(BaseJobAdapter):
         """平台名称"""
         return "seek"
 
+    async def warmup(self):
+        """
+        预热：创建共享连接池，并用样例职位跑一遍转换逻辑
+
+        不访问 SEEK，只把 BeautifulSoup / 解析器 / pydantic 的首次调用开销提前到启动阶段
+        """
+        if self._http_client is None:
+            get_http_client()
+
+        self._transform_job({
+            "id": "warmup",
+            "title": "Plumber",
+            "advertiser": {"description": "Warmup Pty Ltd"},
+            "locations": [{"label": "Sydney, NSW"}],
+            "teaser": "<p>Warm-up probe</p>",
+            "salaryLabel": "$70,000 - $80,000",
+            "workTypes": ["Full time"],
+            "listingDate": "2025-12-20T10:00:00Z"
+        })
+
     def scrape(self, request: ScrapeRequest) -> List[JobPostingDTO]:
         """
-        抓取 SEEK 职位数据
+        抓取 SEEK 职位数据（同步版本，使用 requests，逐页顺序抓取）
 
         Args:
             request: 爬取请求参数（包含 keywords, location, max_results）
@@ -76,7 +126,180 @@ class SeekAdapter(BaseJobAdapter):
 
         Raises:
             ValueError: 参数无效
-            requests.RequestException: API 调用失败
+            ScraperException: API 调用失败
+        """
+        keywords, location, results_wanted = self._prepare_request(request)
+        page_size, max_pages = self._plan_pages(results_wanted)
+
+        try:
+            seen_ids = set()
+
+            # 第 1 页失败是致命错误（截止时间用尽时返回空的截断结果）
+            try:
+                first = self._call_seek_api(self._build_params(keywords, page_size, location, page=1))
+            except DeadlineExceededError:
+                return []
+            last_page = self._last_page(first, page_size, max_pages)
+            jobs = self._process_response(first, seen_ids)
+
+            for page in range(2, last_page + 1):
+                if len(jobs) >= results_wanted:
+                    break
+                check_cancelled(self.platform_name)
+                if deadline.out_of_time():
+                    break
+                try:
+                    data = self._call_seek_api(self._build_params(keywords, page_size, location, page=page))
+                except DeadlineExceededError:
+                    break
+                except (CircuitOpenError, RequestCancelledError):
+                    # 熔断打开或请求取消时剩余页都不会成功，不能当作单页失败跳过
+                    raise
+                except ScraperException as e:
+                    logger.warning(f"SEEK 第 {page} 页抓取失败，跳过: {e}")
+                    continue
+                if not data.get("data"):
+                    break
+                jobs.extend(self._process_response(data, seen_ids))
+
+            return jobs[:results_wanted]
+        except (ScraperNetworkError, ScraperTimeoutError, ScraperDataError, PlatformException, CircuitOpenError,
+                RequestCancelledError):
+            # 这些是致命错误，直接向上传递
+            raise
+        except Exception as e:
+            logger.error(f"SEEK 抓取失败（未知错误）: {e}")
+            raise ScraperException(
+                message=f"SEEK 抓取失败: {str(e)}",
+                platform=self.platform_name,
+                original_error=e
+            )
+
+    async def scrape_async(self, request: ScrapeRequest) -> List[JobPostingDTO]:
+        """
+        抓取 SEEK 职位数据（异步版本，使用共享的 httpx 连接池）
+
+        与 scrape() 的参数、返回值和异常完全一致，
+        但不占用线程，连接在请求之间复用（keep-alive / HTTP/2），
+        第 2 页起在有界窗口内并发抓取（见 iter_pages）
+
+        Args:
+            request: 爬取请求参数
+
+        Returns:
+            List[JobPostingDTO]: 标准化的职位列表
+        """
+        try:
+            jobs = []
+            async for page_jobs in self.iter_pages(request):
+                jobs.extend(page_jobs)
+            return jobs
+        except (ScraperNetworkError, ScraperTimeoutError, ScraperDataError, PlatformException, CircuitOpenError,
+                RequestCancelledError, DeadlineExceededError):
+            raise
+        except Exception as e:
+            logger.error(f"SEEK 抓取失败（未知错误）: {e}")
+            raise ScraperException(
+                message=f"SEEK 抓取失败: {str(e)}",
+                platform=self.platform_name,
+                original_error=e
+            )
+
+    async def iter_pages(
+        self,
+        request: ScrapeRequest,
+        stats: Optional[ScrapeStats] = None
+    ) -> AsyncIterator[List[JobPostingDTO]]:
+        """
+        按页码顺序逐页产出转换、去重后的职位
+
+        流程:
+            1. 抓取第 1 页，根据 totalCount 计算实际需要的页数（提前停止）
+            2. 第 2 页起并发抓取，同时在途的请求不超过 seek_page_concurrency
+            3. 按页码顺序合并，跨页共享 seen_ids 做流式去重
+            4. 凑够 max_results、遇到空页或截止时间用尽时停止，取消剩余请求
+
+        第 1 页失败直接抛出；后续单页失败只记录警告并跳过（记录到 stats.errors），
+        熔断打开或请求取消时直接抛出。
+        截止时间用尽时停止并保留已产出的页（第 1 页也未取得时不产出任何页）
+
+        Args:
+            request: 爬取请求参数
+            stats: 统计信息（可选，抓取过程中填充）
+
+        Yields:
+            List[JobPostingDTO]: 每页的职位（总数不超过 max_results）
+        """
+        keywords, location, results_wanted = self._prepare_request(request)
+        page_size, max_pages = self._plan_pages(results_wanted)
+        stats = stats if stats is not None else ScrapeStats()
+        seen_ids = set()
+        remaining = results_wanted
+
+        try:
+            first = await self._call_seek_api_async(self._build_params(keywords, page_size, location, page=1))
+        except DeadlineExceededError:
+            return
+        last_page = self._last_page(first, page_size, max_pages)
+        page_jobs = self._process_response(first, seen_ids, stats)[:remaining]
+        remaining -= len(page_jobs)
+        yield page_jobs
+
+        pending = deque()
+        next_page = 2
+        try:
+            while remaining > 0 and (pending or next_page <= last_page):
+                if deadline.out_of_time():
+                    break
+
+                # 填满并发窗口
+                while next_page <= last_page and len(pending) < max(1, settings.seek_page_concurrency):
+                    params = self._build_params(keywords, page_size, location, page=next_page)
+                    pending.append((next_page, asyncio.ensure_future(self._call_seek_api_async(params))))
+                    next_page += 1
+
+                # 按页码顺序等待窗口头部
+                page, task = pending.popleft()
+                try:
+                    data = await task
+                except DeadlineExceededError:
+                    break
+                except (CircuitOpenError, RequestCancelledError):
+                    # 熔断打开或请求取消时剩余页都不会成功，不能当作单页失败跳过
+                    raise
+                except ScraperException as e:
+                    logger.warning(f"SEEK 第 {page} 页抓取失败，跳过: {e}")
+                    stats.errors.append(f"page {page}: {e}")
+                    continue
+
+                if not data.get("data"):
+                    break
+
+                page_jobs = self._process_response(data, seen_ids, stats)[:remaining]
+                remaining -= len(page_jobs)
+                yield page_jobs
+        finally:
+            self._cancel_pending(pending)
+
+    @staticmethod
+    def _cancel_pending(pending):
+        """取消尚未使用的分页请求（已完成的请求读取异常，避免 "never retrieved" 警告）"""
+        for _, task in pending:
+            if task.done():
+                if not task.cancelled():
+                    task.exception()
+            else:
+                task.cancel()
+
+    def _prepare_request(self, request: ScrapeRequest) -> Tuple[str, str, int]:
+        """
+        验证请求并提取参数（同步 / 异步共用）
+
+        Args:
+            request: 爬取请求参数
+
+        Returns:
+            tuple: (keywords, location, results_wanted)
         """
         # 验证请求
         self.validate_request(request)
@@ -86,91 +309,153 @@ class SeekAdapter(BaseJobAdapter):
         location = request.location
         results_wanted = request.max_results if request.max_results else 50
 
-        if results_wanted < 1 or results_wanted > 50:
-            logger.warning(f"results_wanted={results_wanted} 超出范围，调整为 50")
-            results_wanted = 50
-
         logger.info(f"开始抓取 SEEK 职位: keywords={keywords}, location={location}, results_wanted={results_wanted}")
 
-        try:
-            # 1. 构建 URL 参数
-            params = self._build_params(keywords, location, results_wanted)
+        return keywords, location, results_wanted
 
-            # 2. 调用 SEEK API
-            data = self._call_seek_api(params)
+    def _plan_pages(self, results_wanted: int) -> Tuple[int, int]:
+        """
+        计算每页大小和最多抓取的页数
 
-            # 3. 提取职位列表
-            jobs_data = data.get("data", [])
-            total_count = data.get("totalCount", len(jobs_data))
+        Args:
+            results_wanted: 期望结果数量
 
-            logger.info(f"SEEK API 返回 {len(jobs_data)} 个职位（总计 {total_count}）")
+        Returns:
+            tuple: (page_size, max_pages)
 
-            # 4. 转换每个职位
-            jobs = []
-            failed_count = 0
-            validation_errors = 0
-            parsing_errors = 0
+        Example:
+            >>> adapter._plan_pages(200)   # seek_page_size=50
+            (50, 4)
+            >>> adapter._plan_pages(20)
+            (20, 1)
+        """
+        page_size = max(1, min(results_wanted, settings.seek_page_size))
+        pages_needed = math.ceil(results_wanted / page_size)
+        max_pages = max(1, min(pages_needed, settings.seek_max_pages))
+
+        if max_pages < pages_needed:
+            logger.warning(
+                f"results_wanted={results_wanted} 需要 {pages_needed} 页，"
+                f"受 seek_max_pages 限制只抓取 {max_pages} 页"
+            )
 
-            for job_data in jobs_data:
-                try:
-                    job_dto = self._transform_job(job_data)
-                    if job_dto:
-                        jobs.append(job_dto)
-                except ScraperValidationError as e:
-                    # 验证错误（缺少必需字段）- 跳过该职位
-                    validation_errors += 1
-                    failed_count += 1
-                    job_id = job_data.get("id", "unknown")
-                    logger.warning(f"职位 {job_id} 验证失败: {e.message}")
-                except ScraperParsingError as e:
-                    # 解析错误（数据转换失败）- 跳过该职位
-                    parsing_errors += 1
-                    failed_count += 1
-                    job_id = job_data.get("id", "unknown")
-                    logger.warning(f"职位 {job_id} 解析失败: {e.message}")
-                except Exception as e:
-                    # 未知错误 - 跳过该职位
-                    failed_count += 1
-                    job_id = job_data.get("id", "unknown")
-                    logger.warning(f"职位 {job_id} 转换失败（未知错误）: {e}")
-
-            if failed_count > 0:
-                logger.warning(
-                    f"{failed_count} 个职位转换失败 "
-                    f"(验证错误: {validation_errors}, 解析错误: {parsing_errors}, "
-                    f"其他: {failed_count - validation_errors - parsing_errors})"
-                )
+        return page_size, max_pages
+
+    def _last_page(self, first_page: dict, page_size: int, max_pages: int) -> int:
+        """
+        根据第 1 页的 totalCount 计算最后一页的页码（提前停止）
 
-            # 🔧 FIX: 去重 - 基于 source_id
-            original_count = len(jobs)
-            jobs = self._deduplicate_by_source_id(jobs)
-            duplicates_removed = original_count - len(jobs)
+        Args:
+            first_page: 第 1 页的 API 响应
+            page_size: 每页大小
+            max_pages: 计划的最大页数
 
-            if duplicates_removed > 0:
-                logger.warning(f"移除了 {duplicates_removed} 个重复职位（基于 source_id）")
+        Returns:
+            int: 最后一页的页码
+        """
+        total_count = first_page.get("totalCount")
+        if not isinstance(total_count, int):
+            return max_pages
+        return max(1, min(max_pages, math.ceil(total_count / page_size)))
+
+    def _process_response(
+        self,
+        data: dict,
+        seen_ids: Optional[Set[str]] = None,
+        stats: Optional[ScrapeStats] = None
+    ) -> List[JobPostingDTO]:
+        """
+        将 API 响应转换为去重后的 JobPostingDTO 列表（同步 / 异步共用）
 
-            logger.info(f"成功转换 {len(jobs)} 个职位（去重后）")
-            return jobs
+        Args:
+            data: SEEK API 响应数据
+            seen_ids: 跨页共享的已见 source_id 集合（流式去重）
+            stats: 统计信息（可选，累加页数、转换失败数、去重数）
 
-        except (ScraperNetworkError, ScraperTimeoutError, ScraperDataError, PlatformException):
-            # 这些是致命错误，直接向上传递
-            raise
-        except Exception as e:
-            logger.error(f"SEEK 抓取失败（未知错误）: {e}")
-            raise ScraperException(
-                message=f"SEEK 抓取失败: {str(e)}",
-                platform=self.platform_name,
-                original_error=e
+        Returns:
+            List[JobPostingDTO]: 标准化、去重后的职位列表
+        """
+        # 提取职位列表
+        jobs_data = data.get("data", [])
+        total_count = data.get("totalCount", len(jobs_data))
+
+        logger.info(f"SEEK API 返回 {len(jobs_data)} 个职位（总计 {total_count}）")
+
+        # 转换每个职位
+        jobs = []
+        failed_count = 0
+        validation_errors = 0
+        parsing_errors = 0
+
+        for job_data in jobs_data:
+            start = time.perf_counter()
+            try:
+                job_dto = self._transform_job(job_data)
+                metrics.record_transform(self.platform_name, time.perf_counter() - start)
+                if job_dto:
+                    jobs.append(job_dto)
+            except ScraperValidationError as e:
+                # 验证错误（缺少必需字段）- 跳过该职位
+                validation_errors += 1
+                failed_count += 1
+                metrics.record_transform_failure(self.platform_name, e)
+                job_id = job_data.get("id", "unknown")
+                logger.warning(f"职位 {job_id} 验证失败: {e.message}")
+            except ScraperParsingError as e:
+                # 解析错误（数据转换失败）- 跳过该职位
+                parsing_errors += 1
+                failed_count += 1
+                metrics.record_transform_failure(self.platform_name, e)
+                job_id = job_data.get("id", "unknown")
+                logger.warning(f"职位 {job_id} 解析失败: {e.message}")
+            except Exception as e:
+                # 未知错误 - 跳过该职位
+                failed_count += 1
+                metrics.record_transform_failure(self.platform_name, e)
+                job_id = job_data.get("id", "unknown")
+                logger.warning(f"职位 {job_id} 转换失败（未知错误）: {e}")
+
+        if failed_count > 0:
+            logger.warning(
+                f"{failed_count} 个职位转换失败 "
+                f"(验证错误: {validation_errors}, 解析错误: {parsing_errors}, "
+                f"其他: {failed_count - validation_errors - parsing_errors})"
             )
 
-    def _build_params(self, keywords: str, location: str, results_wanted: int) -> dict:
+        # 🔧 FIX: 去重 - 基于 source_id
+        original_count = len(jobs)
+        with metrics.timed(metrics.DEDUP_SECONDS, self.platform_name):
+            jobs = self._deduplicate_by_source_id(jobs, seen_ids)
+        duplicates_removed = original_count - len(jobs)
+        metrics.record_duplicates(self.platform_name, duplicates_removed)
+
+        if duplicates_removed > 0:
+            logger.warning(f"移除了 {duplicates_removed} 个重复职位（基于 source_id）")
+
+        if stats is not None:
+            stats.pages += 1
+            stats.fetched += len(jobs_data)
+            stats.transform_failures += failed_count
+            stats.duplicates_removed += duplicates_removed
+
+        logger.info(f"成功转换 {len(jobs)} 个职位（去重后）")
+        return jobs
+
+    def _build_params(
+        self,
+        keywords: str,
+        results_wanted: int,
+        location: Optional[str] = None,
+        page: int = 1
+    ) -> dict:
         """
         构建 SEEK REST API URL 参数
 
         Args:
             keywords: 搜索关键词
-            location: 地点（如 Sydney, Melbourne）
-            results_wanted: 期望结果数量
+            results_wanted: 每页结果数量（pageSize）
+            location: 地点（如 Sydney, Melbourne），为空时搜索全澳
+            page: 页码（从 1 开始）
 
         Returns:
             dict: URL 查询参数
@@ -181,9 +466,9 @@ class SeekAdapter(BaseJobAdapter):
         # 测试结果：Sydney 搜索 100% 返回 NSW 职位
         params = {
             "siteKey": "AU-Main",
-            "where": location,  # 使用用户指定的地点（修复后）
+            "where": location or "All Australia",  # 使用用户指定的地点（修复后）
             "keywords": keywords,
-            "page": 1,
+            "page": page,
             "pageSize": results_wanted,
             "locale": "en-AU"
         }
@@ -194,6 +479,9 @@ class SeekAdapter(BaseJobAdapter):
         """
         调用 SEEK REST API
 
+        依次经过页面缓存 → 重试 → 熔断器 → 限流令牌 → 上游请求
+        （熔断器打开时抛出 CircuitOpenError，不再重试）
+
         Args:
             params: URL 查询参数
 
@@ -206,42 +494,63 @@ class SeekAdapter(BaseJobAdapter):
             PlatformException: API 返回错误状态码
             ScraperDataError: 响应格式错误
         """
-        try:
-            response = requests.get(
-                url=self.api_url,
-                params=params,
-                headers=self.headers,
-                timeout=30  # 30 秒超时
-            )
+        cache, key, page = self._page_cache_slot(params)
+        if cache is not None:
+            cached = self._load_cached_page(cache.get(self.platform_name, key, page))
+            if cached is not None:
+                return cached
+
+        response = retrier.call_sync(
+            self.platform_name,
+            lambda: guarded_sync(self.platform_name, lambda: self._send(params))
+        )
+
+        data = self._parse_payload(response)
+        if cache is not None:
+            cache.set(self.platform_name, key, page, response.content)
+        return data
+
+    def _send(self, params: dict) -> requests.Response:
+        """
+        发送一次 SEEK API 请求（取限流令牌后）
 
-            # 检查 HTTP 状态码
-            response.raise_for_status()
+        Args:
+            params: URL 查询参数
 
-            # 解析 JSON
-            try:
-                response_data = response.json()
-            except ValueError as e:
-                logger.error(f"SEEK API 响应不是有效的 JSON: {e}")
-                raise ScraperDataError(
-                    message="API 响应不是有效的 JSON",
-                    platform=self.platform_name,
-                    original_error=e
-                )
+        Returns:
+            requests.Response: 状态码为 2xx 的响应
 
-            # 验证响应格式
-            if "data" not in response_data:
-                logger.error("SEEK API 响应缺少 'data' 字段")
-                raise ScraperDataError(
-                    message="API 响应缺少 'data' 字段",
-                    platform=self.platform_name
+        Raises:
+            ScraperTimeoutError: 请求超时
+            ScraperNetworkError: 网络错误
+            PlatformException: API 返回错误状态码
+        """
+        throttle_sync(self.platform_name)
+        # 超时不超过请求剩余的时间预算（预算已用尽时抛出 DeadlineExceededError）
+        timeout = deadline.timeout(settings.http_timeout, self.platform_name)
+
+        try:
+            with metrics.timed(metrics.UPSTREAM_FETCH_SECONDS, self.platform_name), \
+                    tracing.span("seek.http", page=params.get("page")) as span:
+                response = requests.get(
+                    url=self.api_url,
+                    params=params,
+                    headers=self.headers,
+                    timeout=timeout
                 )
+                span.set(status_code=response.status_code, bytes=len(response.content))
+            metrics.record_upstream_bytes(self.platform_name, len(response.content))
 
-            return response_data
+            # 检查 HTTP 状态码
+            response.raise_for_status()
+
+            return response
 
         except requests.Timeout as e:
+            deadline.check(self.platform_name)  # 截止时间导致的超时：返回部分结果，不重试
             logger.error(f"SEEK API 超时: {e}")
             raise ScraperTimeoutError(
-                message="SEEK API 请求超时（30秒）",
+                message=f"SEEK API 请求超时（{timeout:g}秒）",
                 platform=self.platform_name,
                 original_error=e
             )
@@ -250,7 +559,8 @@ class SeekAdapter(BaseJobAdapter):
             raise classify_http_error(
                 status_code=response.status_code,
                 platform=self.platform_name,
-                message=f"SEEK API 返回错误: {response.status_code}"
+                message=f"SEEK API 返回错误: {response.status_code}",
+                retry_after=parse_retry_after(response.headers.get("Retry-After"))
             )
         except requests.ConnectionError as e:
             logger.error(f"SEEK API 连接错误: {e}")
@@ -267,7 +577,183 @@ class SeekAdapter(BaseJobAdapter):
                 original_error=e
             )
 
-    def _deduplicate_by_source_id(self, jobs: List[JobPostingDTO]) -> List[JobPostingDTO]:
+    async def _call_seek_api_async(self, params: dict) -> dict:
+        """
+        调用 SEEK REST API（异步版本，复用共享连接池）
+
+        处理流程和异常分类与 _call_seek_api() 完全一致
+
+        Args:
+            params: URL 查询参数
+
+        Returns:
+            dict: API 响应数据
+
+        Raises:
+            ScraperTimeoutError: 请求超时
+            ScraperNetworkError: 网络错误
+            PlatformException: API 返回错误状态码
+            ScraperDataError: 响应格式错误
+        """
+        cache, key, page = self._page_cache_slot(params)
+        if cache is not None:
+            cached = self._load_cached_page(await cache.aget(self.platform_name, key, page))
+            if cached is not None:
+                return cached
+
+        response = await retrier.call(
+            self.platform_name,
+            lambda: guarded(self.platform_name, lambda: self._send_async(params))
+        )
+
+        data = self._parse_payload(response)
+        if cache is not None:
+            await cache.aset(self.platform_name, key, page, response.content)
+        return data
+
+    async def _send_async(self, params: dict) -> httpx.Response:
+        """
+        发送一次 SEEK API 请求（异步版本，取限流令牌后）
+
+        Args:
+            params: URL 查询参数
+
+        Returns:
+            httpx.Response: 状态码为 2xx 的响应
+
+        Raises:
+            ScraperTimeoutError: 请求超时
+            ScraperNetworkError: 网络错误
+            PlatformException: API 返回错误状态码
+        """
+        await throttle(self.platform_name)
+        client = self._http_client or get_http_client()
+        # 超时不超过请求剩余的时间预算（预算已用尽时抛出 DeadlineExceededError）
+        timeout = deadline.timeout(settings.http_timeout, self.platform_name)
+
+        try:
+            with metrics.timed(metrics.UPSTREAM_FETCH_SECONDS, self.platform_name), \
+                    tracing.span("seek.http", page=params.get("page")) as span:
+                response = await client.get(
+                    self.api_url,
+                    params=params,
+                    headers=self.headers,
+                    timeout=timeout
+                )
+                span.set(status_code=response.status_code, bytes=len(response.content))
+        except httpx.TimeoutException as e:
+            deadline.check(self.platform_name)  # 截止时间导致的超时：返回部分结果，不重试
+            logger.error(f"SEEK API 超时: {e}")
+            raise ScraperTimeoutError(
+                message=f"SEEK API 请求超时（{timeout:g}秒）",
+                platform=self.platform_name,
+                original_error=e
+            )
+        except httpx.ConnectError as e:
+            logger.error(f"SEEK API 连接错误: {e}")
+            raise ScraperNetworkError(
+                message="无法连接到 SEEK API",
+                platform=self.platform_name,
+                original_error=e
+            )
+        except httpx.HTTPError as e:
+            logger.error(f"SEEK API 请求失败: {e}")
+            raise ScraperNetworkError(
+                message=f"SEEK API 请求失败: {str(e)}",
+                platform=self.platform_name,
+                original_error=e
+            )
+        metrics.record_upstream_bytes(self.platform_name, len(response.content))
+
+        # 检查 HTTP 状态码
+        if response.is_error:
+            logger.error(f"SEEK API HTTP 错误: {response.status_code}")
+            raise classify_http_error(
+                status_code=response.status_code,
+                platform=self.platform_name,
+                message=f"SEEK API 返回错误: {response.status_code}",
+                retry_after=parse_retry_after(response.headers.get("Retry-After"))
+            )
+
+        return response
+
+    def _page_cache_slot(self, params: dict) -> Tuple[Optional[PageCache], str, int]:
+        """
+        返回页面缓存及该请求的缓存键
+
+        Args:
+            params: URL 查询参数
+
+        Returns:
+            tuple: (page_cache, key, page)；未启用页面缓存时 page_cache 为 None
+        """
+        cache = self._page_cache or get_page_cache()
+        if cache is None:
+            return None, "", 0
+        query = {name: value for name, value in params.items() if name != "page"}
+        return cache, params_key(query), int(params.get("page", 1))
+
+    def _load_cached_page(self, payload: Optional[bytes]) -> Optional[dict]:
+        """
+        解析缓存中的原始页面
+
+        Args:
+            payload: 缓存内容（未命中时为 None）
+
+        Returns:
+            dict: API 响应数据；未命中或内容无效时返回 None（回退到访问上游）
+        """
+        if payload is None:
+            return None
+        try:
+            data = json.loads(payload)
+        except ValueError:
+            logger.warning("SEEK 页面缓存内容不是有效的 JSON，忽略")
+            return None
+        if not isinstance(data, dict) or "data" not in data:
+            return None
+        return data
+
+    def _parse_payload(self, response) -> dict:
+        """
+        解析并验证 API 响应体（requests / httpx 响应通用）
+
+        Args:
+            response: HTTP 响应对象（需支持 .json()）
+
+        Returns:
+            dict: API 响应数据
+
+        Raises:
+            ScraperDataError: 响应不是 JSON 或缺少 'data' 字段
+        """
+        with metrics.timed(metrics.VALIDATION_SECONDS, self.platform_name):
+            # 解析 JSON
+            try:
+                response_data = response.json()
+            except ValueError as e:
+                logger.error(f"SEEK API 响应不是有效的 JSON: {e}")
+                raise ScraperDataError(
+                    message="API 响应不是有效的 JSON",
+                    platform=self.platform_name,
+                    original_error=e
+                )
+
+            # 验证响应格式
+            if "data" not in response_data:
+                logger.error("SEEK API 响应缺少 'data' 字段")
+                raise ScraperDataError(
+                    message="API 响应缺少 'data' 字段",
+                    platform=self.platform_name
+                )
+
+            return response_data
+
+    def _deduplicate_by_source_id(
+        self,
+        jobs: List[JobPostingDTO],
+        seen_ids: Optional[Set[str]] = None
+    ) -> List[JobPostingDTO]:
         """
         基于 source_id 去重
 
@@ -279,13 +765,17 @@ class SeekAdapter(BaseJobAdapter):
         - Python 层：防止单次抓取中的重复（性能优化）
         - 数据库层：防止多次抓取间的重复（数据完整性）
 
+        分页抓取时传入跨页共享的 seen_ids，逐页流式去重
+
         Args:
             jobs: 职位列表
+            seen_ids: 已见的 source_id 集合（会被原地更新）
 
         Returns:
             List[JobPostingDTO]: 去重后的职位列表
         """
-        seen_ids = set()
+        if seen_ids is None:
+            seen_ids = set()
         unique_jobs = []
 
         for job in jobs:
@@ -315,7 +805,8 @@ class SeekAdapter(BaseJobAdapter):
         # 尝试提取 teaser
         teaser = job_data.get("teaser")
         if teaser:
-            description = clean_html(teaser)
+            with tracing.span("utils.clean_html"):
+                description = clean_html(teaser)
             if description and len(description) > 500:
                 description = description[:500] + "..."
             return description
@@ -375,14 +866,16 @@ class SeekAdapter(BaseJobAdapter):
             location_label = ""
             if locations and len(locations) > 0:
                 location_label = locations[0].get("label", "")
-            state, suburb = parse_location(location_label)  # parse_location 返回 (state, suburb)
+            with tracing.span("utils.parse_location"):
+                state, suburb = parse_location(location_label)  # parse_location 返回 (state, suburb)
 
             # 提取描述
             description = self._extract_description(job_data)
 
             # 解析薪资范围（salaryLabel 字符串）
             salary_str = job_data.get("salaryLabel")
-            min_amount, max_amount = parse_salary_range(salary_str)
+            with tracing.span("utils.parse_salary_range"):
+                min_amount, max_amount = parse_salary_range(salary_str)
 
             # 提取工作类型（workTypes 数组的第一个元素）
             work_types = job_data.get("workTypes", [])
@@ -390,7 +883,8 @@ class SeekAdapter(BaseJobAdapter):
             job_type = normalize_employment_type(work_type)
 
             # 提取 trade
-            trade = extract_trade(title)
+            with tracing.span("utils.extract_trade"):
+                trade = extract_trade(title)
 
             # 提取发布时间（listingDate）
             created_at = job_data.get("listingDate")
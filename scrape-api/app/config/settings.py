@@ -25,14 +25,110 @@ class Settings(BaseSettings):
     # Indeed 配置
     indeed_country: str = "Australia"
     indeed_max_results: int = 50
-    indeed_request_delay: int = 2  # 秒
+    indeed_request_delay: float = 2  # 平均请求间隔（秒），0 表示不限流
+    indeed_rate_limit_burst: int = 1  # 允许的突发请求数
 
     # SEEK 配置
     seek_base_url: str = "https://www.seek.com.au/api/jobsearch/v5/search"
     seek_site_key: str = "AU-Main"
     seek_locale: str = "en-AU"
-    seek_request_delay: int = 2  # 秒
+    seek_request_delay: float = 2  # 平均请求间隔（秒），0 表示不限流
+    seek_rate_limit_burst: int = 3  # 允许的突发请求数（分页并发时的首批请求）
     seek_max_pages: int = 10
+    seek_page_size: int = 50  # 每页最多职位数
+    seek_page_concurrency: int = 3  # 同时在途的分页请求数
+
+    # 限流配置（按平台的令牌桶，速率由 {platform}_request_delay 决定）
+    rate_limit_enabled: bool = True
+
+    # 重试配置（上游单次调用的指数退避重试，尝试次数含第一次）
+    retry_enabled: bool = True
+    retry_timeout_attempts: int = 2
+    retry_network_attempts: int = 3
+    retry_server_error_attempts: int = 3  # 5xx
+    retry_rate_limit_attempts: int = 3  # 429，至少等待 Retry-After
+    retry_base_delay: float = 0.5  # 秒
+    retry_max_delay: float = 8.0  # 单次等待上限（秒，不限制 Retry-After）
+    retry_budget_seconds: float = 45.0  # 单次调用的总时间预算（含各次尝试耗时）
+
+    # 熔断配置（按平台，滑动窗口失败率）
+    circuit_breaker_enabled: bool = True
+    circuit_failure_rate_threshold: float = 0.5  # 触发熔断的失败率
+    circuit_window_size: int = 20  # 统计最近多少次调用
+    circuit_min_calls: int = 5  # 窗口内至少多少次调用才判断
+    circuit_open_seconds: float = 30.0  # 熔断持续时间（秒），之后进入半开探测
+    circuit_half_open_max_calls: int = 1  # 半开状态同时允许的探测请求数
+
+    # 执行器配置（阻塞的适配器调用在线程池中运行，不占用事件循环）
+    seek_executor_workers: int = 4
+    indeed_executor_workers: int = 2
+    default_executor_workers: int = 4
+
+    # Indeed 进程池配置（JobSpy + pandas 在独立进程中运行，启动时导入一次）
+    indeed_process_workers: int = 2  # 进程数，0 表示在 API 进程内调用 JobSpy
+    indeed_process_max_jobs: int = 50  # 每个进程平均执行多少次抓取后回收，0 表示不回收
+    indeed_process_timeout: float = 120.0  # 单次抓取超时（秒）
+
+    # 请求合并配置（相同的并发抓取请求只执行一次）
+    coalesce_enabled: bool = True
+
+    # 结果缓存配置（进程内 TTL / LRU）
+    result_cache_enabled: bool = True
+    result_cache_max_entries: int = 256
+    result_cache_max_bytes: int = 64 * 1024 * 1024  # 64 MB（估算值）
+    seek_cache_ttl: float = 300.0  # 秒
+    indeed_cache_ttl: float = 900.0  # 秒
+    default_cache_ttl: float = 300.0  # 秒
+    result_cache_stale_ttl: float = 60.0  # 过期后仍可返回旧数据并后台刷新的窗口（秒），0 表示禁用
+
+    # 页面缓存配置（上游原始页面的 SQLite 磁盘缓存，多 worker 共享，重启后保留）
+    page_cache_enabled: bool = True
+    page_cache_path: str = "data/page_cache.sqlite3"  # 容器中应挂载到持久卷
+    page_cache_max_bytes: int = 256 * 1024 * 1024  # 256 MB
+    # 不应超过对应的结果缓存 TTL，否则结果缓存过期后重新抓取仍会拿到更旧的页面
+    seek_page_cache_ttl: float = 300.0  # 秒
+    indeed_page_cache_ttl: float = 900.0  # 秒
+    default_page_cache_ttl: float = 300.0  # 秒
+
+    # 批量抓取配置（/scrape/batch）
+    batch_max_specs: int = 200  # 单次请求最多任务数
+    batch_max_concurrency: int = 8  # 全局并发上限
+    seek_batch_concurrency: int = 4  # SEEK 并发上限
+    indeed_batch_concurrency: int = 2  # Indeed 并发上限
+
+    # 异步任务配置（POST /jobs）
+    job_workers: int = 2  # 同时执行的任务数
+    job_max_pending: int = 100  # 排队 + 执行中的任务数上限
+    job_result_ttl: float = 3600.0  # 完成的任务保留时间（秒）
+
+    # 链路追踪配置（采样的 span 写入本地 JSON lines 文件）
+    tracing_enabled: bool = True
+    trace_sample_rate: float = 0.01  # 采样率（0-1）；调用方 traceparent 标记为已采样时总是采样
+    trace_max_spans: int = 2000  # 单个请求最多记录的 span 数
+    trace_file_path: str = "data/traces.jsonl"
+    trace_file_max_bytes: int = 20 * 1024 * 1024  # 20 MB，超过后轮转
+    trace_file_backups: int = 5  # 保留的轮转文件数
+
+    # 响应压缩配置（按 Accept-Encoding 协商 zstd / gzip）
+    compression_enabled: bool = True
+    compression_min_size: int = 1024  # 小于该字节数的响应不压缩（流式响应总是压缩）
+    gzip_level: int = 5  # 1-9
+    zstd_level: int = 3  # 1-22，需要安装 zstandard
+
+    # 管理端点配置（/admin/*，请求头 X-Admin-Token 须与 admin_token 一致）
+    admin_token: str = ""  # 为空时禁用管理端点
+    profile_sample_interval: float = 0.005  # 采样剖析间隔（秒）
+    profile_max_seconds: float = 60.0  # 单次剖析最长时间（秒）
+
+    # 冷启动配置（python -m app.services.import_timing 和 tests/test_import_timing.py 检查）
+    import_time_budget_ms: float = 2000.0  # 导入 app.main 的耗时上限（毫秒）
+
+    # HTTP 客户端配置（异步适配器共享的连接池）
+    http_max_connections: int = 20
+    http_max_keepalive_connections: int = 10
+    http_keepalive_expiry: float = 30.0  # 秒
+    http_timeout: float = 30.0  # 秒
+    http2_enabled: bool = False  # 需要安装 h2
 
     # User-Agent 配置
     user_agent: str = (
@@ -202,6 +202,51 @@ class ScraperNotFoundError(PlatformException):
     pass
 
 
+class CircuitOpenError(ScraperException):
+    """
+    熔断异常
+
+    用于:
+    - 平台熔断器打开，请求未发送到上游（快速失败）
+    """
+
+    def __init__(
+        self,
+        message: str,
+        platform: Optional[str] = None,
+        retry_after: Optional[int] = None,
+        original_error: Optional[Exception] = None
+    ):
+        """
+        Args:
+            retry_after: 熔断器预计恢复探测的剩余时间（秒）
+        """
+        super().__init__(message, platform, original_error)
+        self.retry_after = retry_after
+
+
+class RequestCancelledError(ScraperException):
+    """
+    请求取消异常
+
+    用于:
+    - 调用方已断开连接，抓取被取消（结果无人读取）
+    - 线程中的同步抓取在检查点发现所属的异步调用已取消
+    """
+    pass
+
+
+class DeadlineExceededError(ScraperException):
+    """
+    截止时间异常
+
+    用于:
+    - 调用方传入的时间预算（X-Request-Deadline / deadline_ms）已用尽
+      （不重试、不计入熔断失败率，适配器返回已抓取的部分结果）
+    """
+    pass
+
+
 # ========================================
 # 配置相关异常
 # ========================================
@@ -222,7 +267,12 @@ class ScraperConfigurationError(ScraperException):
 # 辅助函数
 # ========================================
 
-def classify_http_error(status_code: int, platform: str, message: str = None) -> PlatformException:
+def classify_http_error(
+    status_code: int,
+    platform: str,
+    message: str = None,
+    retry_after: Optional[int] = None
+) -> PlatformException:
     """
     根据 HTTP 状态码分类异常
 
@@ -230,6 +280,7 @@ def classify_http_error(status_code: int, platform: str, message: str = None) ->
         status_code: HTTP 状态码
         platform: 平台名称
         message: 自定义错误消息
+        retry_after: 429 响应的 Retry-After（秒）
 
     Returns:
         对应的异常对象
@@ -257,7 +308,8 @@ def classify_http_error(status_code: int, platform: str, message: str = None) ->
     elif status_code == 429:
         return RateLimitException(
             message=message or "Rate limit exceeded",
-            platform=platform
+            platform=platform,
+            retry_after=retry_after
         )
     elif 400 <= status_code < 500:
         return PlatformException(
@@ -4,15 +4,45 @@ FastAPI 应用入口
 提供爬虫 API 服务
 """
 
-from fastapi import FastAPI, HTTPException, status
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from loguru import logger
+from typing import Literal, Optional, Union
+import asyncio
+import secrets
 import sys
+import time
 
+from app.adapters.base_adapter import ScrapeStats
+from app.adapters.registry import adapter_registry
 from app.config.settings import settings
+from app.services import deadline, metrics, scrape_service, wire_formats
+from app.services.batch import batch_scheduler
+from app.services.executor import platform_executors
+from app.services.http_client import close_http_client
+from app.services.job_queue import KIND_BATCH, KIND_SCRAPE, JobQueueFullError, job_queue
+from app.exceptions import CircuitOpenError, RequestCancelledError
+from app.services.cancellation import run_until_disconnect
+from app.services.circuit_breaker import OPEN, circuit_breakers
+from app.services.columnar import COLUMNAR_FORMAT, encode_columnar
+from app.services.compression import CompressionMiddleware, compression_stats
+from app.services.page_cache import close_page_cache, get_page_cache
+from app.services.profiler import MODE_CPROFILE, ProfilerBusyError, ProfileSession, validate_options
+from app.services.process_pool import get_indeed_process_pool, shutdown_indeed_process_pool
+from app.services.rate_limiter import rate_limiters
+from app.services.retry import retrier
+from app.services.serialization import ModelJSONResponse, dump_json
+from app.services.streaming import NDJSON_MEDIA_TYPE, ndjson_lines
+from app.services.timings import server_timing
+from app.services.tracing import TraceMiddleware, exporter as trace_exporter
 from app.models.job_posting_dto import (
+    BatchScrapeRequest,
+    BatchScrapeResponse,
+    BatchScrapeSpec,
     HealthResponse,
+    JobStatusResponse,
+    JobSubmitResponse,
     ScrapeRequest,
     ScrapeResponse,
     PlatformEnum
@@ -45,6 +75,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 链路追踪（根 span + X-Trace-Id 响应头）
+app.add_middleware(TraceMiddleware)
+
+# 响应压缩（最外层，按 Accept-Encoding 协商 zstd / gzip）
+app.add_middleware(CompressionMiddleware)
+
 
 # ============================================================================
 # 健康检查端点
@@ -66,11 +102,14 @@ async def health_check():
     - API 版本
     - 当前时间
     - 支持的平台列表
+    - 各平台熔断器状态（任一平台熔断时 status 为 degraded，HTTP 状态码仍为 200）
     """
+    circuits = circuit_breakers.states()
     return HealthResponse(
-        status="ok",
+        status="degraded" if OPEN in circuits.values() else "ok",
         version=settings.app_version,
-        platforms=settings.supported_platforms
+        platforms=settings.supported_platforms,
+        circuits=circuits
     )
 
 
@@ -90,6 +129,166 @@ async def root():
     }
 
 
+@app.get(
+    "/stats",
+    tags=["System"],
+    summary="运行时统计",
+    description="返回请求合并、执行器等运行时统计"
+)
+async def runtime_stats():
+    """
+    运行时统计
+
+    返回：
+    - coalescing: 请求合并命中 / 未命中次数
+    - result_cache: 结果缓存命中率、条目数、字节数
+    - page_cache: 磁盘页面缓存命中次数、页数、字节数（未启用时为 null）
+    - rate_limiter: 各平台令牌桶的等待次数和等待时间
+    - retry: 各平台按异常类别的重试次数、重试后成功 / 放弃的调用数
+    - circuit_breaker: 各平台熔断器状态、窗口失败率、拒绝次数
+    - jobs: 异步任务队列中各状态的任务数
+    - executors: 各平台线程池状态
+    - indeed_process_pool: Indeed 进程池的代数、调用数、回收次数（未启用时为 null）
+    - compression: 各编码压缩的响应数、压缩前后字节数
+    """
+    page_cache = get_page_cache()
+    indeed_pool = get_indeed_process_pool()
+    return {
+        "coalescing": scrape_service.scrape_flights.stats(),
+        "result_cache": scrape_service.result_cache.stats(),
+        "page_cache": await asyncio.to_thread(page_cache.stats) if page_cache else None,
+        "rate_limiter": rate_limiters.stats(),
+        "retry": retrier.stats(),
+        "circuit_breaker": circuit_breakers.stats(),
+        "jobs": job_queue.stats(),
+        "executors": platform_executors.stats(),
+        "indeed_process_pool": indeed_pool.stats() if indeed_pool else None,
+        "compression": compression_stats.stats(),
+    }
+
+
+@app.get(
+    "/metrics",
+    tags=["System"],
+    summary="Prometheus 指标",
+    description="Prometheus 文本格式的请求数、各阶段耗时直方图和数据量计数（按 platform 标注）",
+    response_class=Response
+)
+async def prometheus_metrics():
+    """
+    Prometheus 指标
+
+    返回：
+    - scrape_requests_total / scrape_request_duration_seconds: 按 platform、endpoint 的请求数和耗时
+    - scrape_upstream_fetch_seconds / scrape_upstream_bytes_total: 单次上游请求耗时和响应字节数
+    - scrape_rate_limit_wait_seconds: 限流等待时间
+    - scrape_validation_seconds / scrape_transform_seconds / scrape_serialization_seconds: 响应解析校验、
+      单个职位转换、响应序列化耗时
+    - scrape_jobs_returned_total / scrape_duplicates_removed_total / scrape_transform_failures_total:
+      返回的职位数、去重移除数、转换失败数（按异常类型）
+    """
+    content, content_type = metrics.render()
+    return Response(content=content, media_type=content_type)
+
+
+def circuit_open_http_error(error: CircuitOpenError) -> HTTPException:
+    """
+    熔断快速失败 → HTTP 503（带 Retry-After，调用方可以推迟重试）
+
+    Args:
+        error: 熔断异常
+
+    Returns:
+        HTTPException: 503 异常
+    """
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=f"Scraping unavailable: {error}",
+        headers={"Retry-After": str(error.retry_after or 1)}
+    )
+
+
+def scrape_response(
+    response: ScrapeResponse,
+    outcome: scrape_service.ScrapeOutcome,
+    timer: metrics.RequestTimer,
+    accept: Optional[str] = None,
+    fmt: str = "json"
+) -> Response:
+    """
+    按 Accept 头序列化抓取响应，附带耗时分解（Server-Timing 头；JSON 另有 timings 字段）
+
+    JSON 的 timings 在其余字段序列化之后拼接到末尾，serialize_ms 不包含 timings 本身；
+    Arrow / MessagePack 见 wire_formats.py，fmt="columnar" 时为列式 JSON（见 columnar.py，忽略 Accept）
+
+    Args:
+        response: 抓取响应（timings 为空）
+        outcome: 抓取结果（提供上游阶段的耗时）
+        timer: 请求计时器（提供总耗时）
+        accept: 请求的 Accept 头
+        fmt: JSON 布局（json / columnar）
+
+    Returns:
+        Response: 协商后格式的响应（带 Vary: Accept）
+    """
+    columnar = fmt == COLUMNAR_FORMAT
+    media_type = wire_formats.JSON_MEDIA_TYPE if columnar else wire_formats.negotiate(accept)
+    start = time.perf_counter()
+    with metrics.timed(metrics.SERIALIZATION_SECONDS, response.platform, endpoint="scrape"):
+        if columnar:
+            body = encode_columnar(response)
+        elif media_type == wire_formats.JSON_MEDIA_TYPE:
+            body = dump_json(response, exclude={"timings"})
+        else:
+            body = wire_formats.encode(response, media_type)
+
+    timings = outcome.timings.to_model(timer.elapsed(), serialize_seconds=time.perf_counter() - start)
+    if media_type == wire_formats.JSON_MEDIA_TYPE:
+        body = body[:-1] + b',"timings":' + timings.model_dump_json().encode("utf-8") + b"}"
+
+    return ModelJSONResponse(
+        content=body,
+        media_type=media_type,
+        headers={"Server-Timing": server_timing(timings, outcome.cache_hit), "Vary": "Accept"}
+    )
+
+
+# 调用方断开连接、抓取被取消时记录的状态码（nginx 的 499 Client Closed Request，调用方不会收到）
+CLIENT_CLOSED_REQUEST = 499
+
+
+def cancelled_response(timer: metrics.RequestTimer) -> Response:
+    """调用方已断开：记录取消并返回空的 499 响应"""
+    timer.finish(metrics.CANCELLED)
+    logger.info(f"{timer.platform} {timer.endpoint} cancelled: client disconnected")
+    return Response(status_code=CLIENT_CLOSED_REQUEST)
+
+
+def parse_deadline_header(x_request_deadline: Optional[str] = Header(None)) -> Optional[deadline.Deadline]:
+    """
+    解析 X-Request-Deadline 请求头（剩余的时间预算，毫秒），见 deadline.py
+
+    Returns:
+        Optional[Deadline]: 未设置时为 None
+
+    Raises:
+        HTTPException: 不是正数时 400
+    """
+    try:
+        return deadline.parse_header(x_request_deadline)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid {deadline.DEADLINE_HEADER} header: {e}"
+        )
+
+
+# 抓取端点可协商的响应格式（OpenAPI 文档）
+SCRAPE_RESPONSE_FORMATS = {
+    200: {"content": {wire_formats.ARROW_MEDIA_TYPE: {}, wire_formats.MSGPACK_MEDIA_TYPE: {}}}
+}
+
+
 # ============================================================================
 # Indeed 爬虫端点
 # ============================================================================
@@ -97,11 +296,19 @@ async def root():
 @app.post(
     "/scrape/indeed",
     response_model=ScrapeResponse,
+    response_class=ModelJSONResponse,
+    responses=SCRAPE_RESPONSE_FORMATS,
     tags=["Scraper"],
     summary="抓取 Indeed 职位",
     description="使用 JobSpy 库抓取 Indeed 平台的职位数据"
 )
-async def scrape_indeed(request: ScrapeRequest):
+async def scrape_indeed(
+    request: ScrapeRequest,
+    raw_request: Request,
+    accept: Optional[str] = Header(None),
+    fmt: Literal["json", "columnar"] = Query("json", alias="format", description="columnar: 列式紧凑 JSON"),
+    request_deadline: Optional[deadline.Deadline] = Depends(parse_deadline_header)
+):
     """
     抓取 Indeed 职位
 
@@ -112,27 +319,46 @@ async def scrape_indeed(request: ScrapeRequest):
 
     返回：
     - 标准化的职位数据列表
+    - Accept 为 application/vnd.apache.arrow.stream / application/msgpack 时返回对应格式（默认 JSON）
+    - format=columnar 时返回列式紧凑 JSON（重复取值字典编码，省略默认值列）
+    - 请求头 X-Request-Deadline 或 deadline_ms 用尽时返回已抓取的职位，truncated 为 True
     """
+    timer = metrics.RequestTimer(PlatformEnum.INDEED, "scrape")
     try:
-        from app.adapters.indeed_adapter import IndeedAdapter
-        from datetime import datetime
-
         logger.info(f"Scraping Indeed: keywords={request.keywords}, location={request.location}")
 
-        # 使用 Indeed 适配器
-        adapter = IndeedAdapter()
-        jobs = adapter.scrape(request)
+        # JobSpy + pandas 是同步阻塞调用，scrape_async 在 Indeed 专用线程池执行；调用方断开时取消抓取
+        with deadline.scope(request_deadline):
+            outcome = await run_until_disconnect(
+                raw_request, scrape_service.fetch(PlatformEnum.INDEED, request), PlatformEnum.INDEED.value
+            )
+        jobs = outcome.jobs
 
-        logger.info(f"Successfully scraped {len(jobs)} jobs from Indeed")
+        logger.info(f"Successfully scraped {len(jobs)} jobs from Indeed (cache_hit={outcome.cache_hit})")
 
-        return ScrapeResponse(
+        # 职位已由适配器校验，直接组装响应
+        response = scrape_response(ScrapeResponse.model_construct(
             platform=PlatformEnum.INDEED,
             jobs=jobs,
             count=len(jobs),
-            scraped_at=datetime.utcnow()
-        )
+            scraped_at=outcome.scraped_at,
+            cache_hit=outcome.cache_hit,
+            cache_age_seconds=outcome.cache_age_seconds,
+            truncated=outcome.truncated
+        ), outcome, timer, accept, fmt)
+        timer.finish(metrics.SUCCESS, len(jobs))
+        return response
+
+    except CircuitOpenError as e:
+        timer.finish(metrics.REJECTED)
+        logger.warning(f"Indeed scraping rejected: {e}")
+        raise circuit_open_http_error(e)
+
+    except RequestCancelledError:
+        return cancelled_response(timer)
 
     except Exception as e:
+        timer.finish(metrics.ERROR)
         logger.error(f"Indeed scraping failed: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -147,11 +373,19 @@ async def scrape_indeed(request: ScrapeRequest):
 @app.post(
     "/scrape/seek",
     response_model=ScrapeResponse,
+    response_class=ModelJSONResponse,
+    responses=SCRAPE_RESPONSE_FORMATS,
     tags=["Scraper"],
     summary="抓取 SEEK 职位",
     description="使用 SEEK 内部 API 抓取职位数据"
 )
-async def scrape_seek(request: ScrapeRequest):
+async def scrape_seek(
+    request: ScrapeRequest,
+    raw_request: Request,
+    accept: Optional[str] = Header(None),
+    fmt: Literal["json", "columnar"] = Query("json", alias="format", description="columnar: 列式紧凑 JSON"),
+    request_deadline: Optional[deadline.Deadline] = Depends(parse_deadline_header)
+):
     """
     抓取 SEEK 职位
 
@@ -162,27 +396,46 @@ async def scrape_seek(request: ScrapeRequest):
 
     返回：
     - 标准化的职位数据列表
+    - Accept 为 application/vnd.apache.arrow.stream / application/msgpack 时返回对应格式（默认 JSON）
+    - format=columnar 时返回列式紧凑 JSON（重复取值字典编码，省略默认值列）
+    - 请求头 X-Request-Deadline 或 deadline_ms 用尽时返回已抓取的职位，truncated 为 True
     """
+    timer = metrics.RequestTimer(PlatformEnum.SEEK, "scrape")
     try:
-        from app.adapters.seek_adapter import SeekAdapter
-        from datetime import datetime
-
         logger.info(f"Scraping SEEK: keywords={request.keywords}, location={request.location}")
 
-        # 使用 SEEK 适配器
-        adapter = SeekAdapter()
-        jobs = adapter.scrape(request)
+        # 原生异步调用，复用共享 HTTP 连接池；调用方断开时取消在途的分页请求和转换
+        with deadline.scope(request_deadline):
+            outcome = await run_until_disconnect(
+                raw_request, scrape_service.fetch(PlatformEnum.SEEK, request), PlatformEnum.SEEK.value
+            )
+        jobs = outcome.jobs
 
-        logger.info(f"Successfully scraped {len(jobs)} jobs from SEEK")
+        logger.info(f"Successfully scraped {len(jobs)} jobs from SEEK (cache_hit={outcome.cache_hit})")
 
-        return ScrapeResponse(
+        # 职位已由适配器校验，直接组装响应
+        response = scrape_response(ScrapeResponse.model_construct(
             platform=PlatformEnum.SEEK,
             jobs=jobs,
             count=len(jobs),
-            scraped_at=datetime.utcnow()
-        )
+            scraped_at=outcome.scraped_at,
+            cache_hit=outcome.cache_hit,
+            cache_age_seconds=outcome.cache_age_seconds,
+            truncated=outcome.truncated
+        ), outcome, timer, accept, fmt)
+        timer.finish(metrics.SUCCESS, len(jobs))
+        return response
+
+    except CircuitOpenError as e:
+        timer.finish(metrics.REJECTED)
+        logger.warning(f"SEEK scraping rejected: {e}")
+        raise circuit_open_http_error(e)
+
+    except RequestCancelledError:
+        return cancelled_response(timer)
 
     except Exception as e:
+        timer.finish(metrics.ERROR)
         logger.error(f"SEEK scraping failed: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -190,6 +443,338 @@ async def scrape_seek(request: ScrapeRequest):
         )
 
 
+# ============================================================================
+# 批量抓取端点
+# ============================================================================
+
+@app.post(
+    "/scrape/batch",
+    response_model=BatchScrapeResponse,
+    response_class=ModelJSONResponse,
+    tags=["Scraper"],
+    summary="批量抓取职位",
+    description="一次请求执行多个 (platform, keywords, location, max_results) 抓取任务"
+)
+async def scrape_batch(
+    batch: BatchScrapeRequest,
+    raw_request: Request,
+    request_deadline: Optional[deadline.Deadline] = Depends(parse_deadline_header)
+):
+    """
+    批量抓取职位
+
+    参数：
+    - specs: 抓取任务列表（每项包含 platform, keywords, location, max_results）
+
+    返回：
+    - 按请求顺序排列的每个任务的结果、错误和耗时
+
+    说明：
+    - 任务在全局和平台并发上限内并发执行
+    - 单个任务失败不影响其他任务（错误记录在对应结果的 error 字段）
+    - 调用方断开连接时取消所有未完成的任务
+    - 请求头 X-Request-Deadline 是整个批量的时间预算，spec 的 deadline_ms 只限制该任务；
+      预算用尽的任务返回已抓取的职位，truncated 为 True
+    """
+    if len(batch.specs) > settings.batch_max_specs:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Too many specs: {len(batch.specs)} (max {settings.batch_max_specs})"
+        )
+
+    try:
+        with deadline.scope(request_deadline):
+            response = await run_until_disconnect(raw_request, batch_scheduler.run(batch.specs))
+    except RequestCancelledError:
+        logger.info(f"Batch scrape of {len(batch.specs)} specs cancelled: client disconnected")
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
+
+    # 直接编码，跳过 response_model 的二次校验
+    return ModelJSONResponse(response)
+
+
+# ============================================================================
+# 异步任务端点
+# ============================================================================
+
+@app.post(
+    "/jobs",
+    response_model=JobSubmitResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    tags=["Jobs"],
+    summary="提交异步抓取任务",
+    description="提交单个抓取（带 platform 的 ScrapeRequest）或批量抓取（specs），立即返回任务 ID"
+)
+async def submit_job(submission: Union[BatchScrapeRequest, BatchScrapeSpec]):
+    """
+    提交异步抓取任务
+
+    参数（二选一）：
+    - 单个抓取：platform, keywords, location, max_results
+    - 批量抓取：specs（同 /scrape/batch）
+
+    返回：
+    - job_id 和 status_url，通过 GET /jobs/{job_id} 轮询结果
+
+    说明：
+    - 排队 + 执行中的任务数达到上限时返回 503
+    """
+    if isinstance(submission, BatchScrapeRequest):
+        if len(submission.specs) > settings.batch_max_specs:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Too many specs: {len(submission.specs)} (max {settings.batch_max_specs})"
+            )
+        specs, kind = submission.specs, KIND_BATCH
+    else:
+        specs, kind = [submission], KIND_SCRAPE
+
+    try:
+        record = job_queue.submit(specs, kind)
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+
+    return JobSubmitResponse(
+        job_id=record.job_id,
+        kind=record.kind,
+        status=record.status,
+        status_url=f"/jobs/{record.job_id}",
+        created_at=record.created_at
+    )
+
+
+@app.get(
+    "/jobs/{job_id}",
+    response_model=JobStatusResponse,
+    response_class=ModelJSONResponse,
+    tags=["Jobs"],
+    summary="查询异步抓取任务",
+    description="返回任务状态、进度，完成后返回结果"
+)
+async def get_job(job_id: str):
+    """
+    查询异步抓取任务
+
+    返回：
+    - status: queued / running / succeeded / failed
+    - progress: 已完成的抓取任务数、已抓取的职位数
+    - result: 完成后的结果（scrape 任务为 ScrapeResponse，batch 任务为 BatchScrapeResponse）
+
+    说明：
+    - 完成的任务保留 JOB_RESULT_TTL 秒，过期或不存在时返回 404
+    """
+    record = job_queue.get(job_id)
+    if record is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Job not found: {job_id}")
+
+    return ModelJSONResponse(record.response_bytes())
+
+
+# ============================================================================
+# 流式抓取端点
+# ============================================================================
+
+@app.post(
+    "/scrape/{platform}/stream",
+    tags=["Scraper"],
+    summary="流式抓取职位（NDJSON）",
+    description="边抓取边输出，每行一个职位 JSON，最后一行为 {\"trailer\": {...}}",
+    response_class=StreamingResponse,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}}
+)
+async def scrape_stream(
+    platform: PlatformEnum,
+    request: ScrapeRequest,
+    raw_request: Request,
+    request_deadline: Optional[deadline.Deadline] = Depends(parse_deadline_header)
+):
+    """
+    流式抓取职位
+
+    参数：
+    - platform: 平台（seek, indeed）
+    - keywords / location / max_results: 同 /scrape/{platform}
+
+    返回（application/x-ndjson）：
+    - 每行一个职位，按页输出
+    - 最后一行 {"trailer": {"count", "pages", "transform_failures", "duplicates_removed", "errors", "completed",
+      "truncated"}}
+
+    说明：
+    - 第 1 页失败时返回 HTTP 500（与非流式端点一致）
+    - 之后的错误写入 trailer，已发送的数据不受影响
+    - 调用方断开连接时停止抓取（第 1 页由本函数检测，之后由 StreamingResponse 检测）
+    - 请求头 X-Request-Deadline 或 deadline_ms 用尽时停止抓取剩余页，trailer 的 truncated 为 True
+    """
+    logger.info(f"Streaming {platform.value}: keywords={request.keywords}, location={request.location}")
+
+    timer = metrics.RequestTimer(platform, "stream")
+    stats = ScrapeStats()
+    pages = scrape_service.iter_pages(platform.value, request, stats)
+
+    # 预取第 1 页：此时响应头尚未发送，失败时仍可返回正常的错误状态码
+    # （iter_pages 在第一次取页时确定截止时间，之后每页重新绑定）
+    try:
+        with deadline.scope(request_deadline):
+            first_page = await run_until_disconnect(raw_request, pages.__anext__(), platform.value)
+    except StopAsyncIteration:
+        first_page = []
+    except RequestCancelledError:
+        await pages.aclose()
+        return cancelled_response(timer)
+    except CircuitOpenError as e:
+        await pages.aclose()
+        timer.finish(metrics.REJECTED)
+        logger.warning(f"{platform.value} streaming rejected: {e}")
+        raise circuit_open_http_error(e)
+    except Exception as e:
+        await pages.aclose()
+        timer.finish(metrics.ERROR)
+        logger.error(f"{platform.value} streaming failed: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Scraping failed: {str(e)}"
+        )
+
+    return StreamingResponse(
+        ndjson_lines(platform.value, first_page, pages, stats, timer),
+        media_type=NDJSON_MEDIA_TYPE
+    )
+
+
+# ============================================================================
+# 管理端点
+# ============================================================================
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """
+    校验管理令牌（请求头 X-Admin-Token）
+
+    Raises:
+        HTTPException: 未配置 ADMIN_TOKEN 时 404（端点视为不存在），令牌不一致时 403
+    """
+    if not settings.admin_token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if not x_admin_token or not secrets.compare_digest(x_admin_token, settings.admin_token):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid admin token")
+
+
+def check_profile_options(mode: str, fmt: str, sort: str):
+    """校验剖析参数，无效时返回 HTTP 400"""
+    try:
+        validate_options(mode, fmt, sort)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+def profile_response(session: ProfileSession, fmt: str, sort: str, limit: int, filename: str) -> Response:
+    """剖析结果 → 响应（pstats 格式作为附件下载）"""
+    content, media_type = session.render(fmt, sort, limit)
+    headers = {}
+    if fmt == "pstats":
+        headers["Content-Disposition"] = f'attachment; filename="{filename}.pstats"'
+    return Response(content=content, media_type=media_type, headers=headers)
+
+
+@app.post(
+    "/admin/profile/{platform}",
+    tags=["Admin"],
+    summary="剖析一次抓取请求",
+    description="在剖析器下执行一次真实抓取（不经过结果缓存），返回 pstats 文本 / pstats 文件 / collapsed stack",
+    response_class=Response,
+    dependencies=[Depends(require_admin)]
+)
+async def profile_scrape(
+    platform: PlatformEnum,
+    request: ScrapeRequest,
+    mode: str = Query(MODE_CPROFILE, description="cprofile（事件循环线程）/ sample（采样所有线程）"),
+    fmt: str = Query("text", alias="format", description="cprofile: text / pstats；sample: text / collapsed"),
+    sort: str = Query("cumulative", description="cprofile 文本的排序字段"),
+    limit: int = Query(40, ge=1, le=1000, description="文本报告最多输出的函数数"),
+):
+    """
+    剖析一次抓取请求（需要 X-Admin-Token）
+
+    参数：
+    - platform / keywords / location / max_results: 同 /scrape/{platform}
+    - mode, format, sort, limit: 剖析模式和输出格式
+
+    返回：
+    - text/plain 报告或 collapsed stack；format=pstats 时返回原始 pstats 文件
+    - X-Profile-Jobs 头：本次抓取的职位数
+
+    说明：
+    - 跳过结果缓存和请求合并，直接调用适配器（仍经过限流、重试和熔断器）
+    - 同一时间只允许一个剖析，否则返回 409；超过 PROFILE_MAX_SECONDS 返回 504
+    """
+    check_profile_options(mode, fmt, sort)
+    adapter = scrape_service.get_adapter(platform.value)
+    logger.info(f"Profiling {platform.value} ({mode}): keywords={request.keywords}, location={request.location}")
+
+    try:
+        with ProfileSession(mode, settings.profile_sample_interval) as session:
+            jobs = await asyncio.wait_for(adapter.scrape_async(request), timeout=settings.profile_max_seconds)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=f"Profiled scrape exceeded {settings.profile_max_seconds}s"
+        )
+    except CircuitOpenError as e:
+        raise circuit_open_http_error(e)
+    except Exception as e:
+        logger.error(f"Profiled {platform.value} scrape failed: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Scraping failed: {str(e)}"
+        )
+
+    response = profile_response(session, fmt, sort, limit, f"{platform.value}-scrape")
+    response.headers["X-Profile-Jobs"] = str(len(jobs))
+    return response
+
+
+@app.get(
+    "/admin/profile",
+    tags=["Admin"],
+    summary="剖析一段时间内的进程",
+    description="剖析接下来 seconds 秒内处理的所有请求（线上真实流量）",
+    response_class=Response,
+    dependencies=[Depends(require_admin)]
+)
+async def profile_window(
+    seconds: float = Query(5.0, gt=0, description="剖析时长（秒），不超过 PROFILE_MAX_SECONDS"),
+    mode: str = Query(MODE_CPROFILE, description="cprofile（事件循环线程）/ sample（采样所有线程）"),
+    fmt: str = Query("text", alias="format", description="cprofile: text / pstats；sample: text / collapsed"),
+    sort: str = Query("cumulative", description="cprofile 文本的排序字段"),
+    limit: int = Query(40, ge=1, le=1000, description="文本报告最多输出的函数数"),
+):
+    """
+    剖析一段时间内的进程（需要 X-Admin-Token）
+
+    返回：
+    - 同 POST /admin/profile/{platform}
+
+    说明：
+    - seconds 超过 PROFILE_MAX_SECONDS 时返回 400；已有剖析在进行中时返回 409
+    """
+    check_profile_options(mode, fmt, sort)
+    if seconds > settings.profile_max_seconds:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"seconds must not exceed {settings.profile_max_seconds}"
+        )
+
+    try:
+        with ProfileSession(mode, settings.profile_sample_interval) as session:
+            await asyncio.sleep(seconds)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    return profile_response(session, fmt, sort, limit, "window")
+
+
 # ============================================================================
 # 全局异常处理
 # ============================================================================
@@ -218,11 +803,24 @@ async def startup_event():
     logger.info(f"Debug mode: {settings.debug}")
     logger.info(f"Supported platforms: {', '.join(settings.supported_platforms)}")
 
+    # 实例化并预热所有适配器，首个请求不再承担初始化成本
+    await adapter_registry.startup()
+
+    # 启动异步任务 worker
+    job_queue.start()
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """应用关闭事件"""
     logger.info(f"Shutting down {settings.app_name}")
+    await job_queue.stop()
+    await adapter_registry.shutdown()
+    await close_http_client()
+    close_page_cache()
+    platform_executors.shutdown(wait=False)
+    shutdown_indeed_process_pool(wait=False)
+    trace_exporter.close()
 
 
 # ============================================================================
@@ -5,7 +5,7 @@
 """
 
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Optional, List, Union
 from pydantic import BaseModel, Field, field_validator
 from enum import Enum
 
@@ -117,6 +117,9 @@ class ScrapeRequest(BaseModel):
     classification: Optional[str] = Field(None, description="职位分类 ID（SEEK 特有）")
     job_type: Optional[str] = Field(None, description="工作类型过滤")
 
+    # 时间预算（与 X-Request-Deadline 请求头取较早者），用尽时返回部分结果并标记 truncated
+    deadline_ms: Optional[int] = Field(None, description="时间预算（毫秒，从开始抓取时计）", ge=1)
+
     class Config:
         json_schema_extra = {
             "example": {
@@ -128,6 +131,24 @@ class ScrapeRequest(BaseModel):
         }
 
 
+class ScrapeTimings(BaseModel):
+    """
+    单个抓取请求的耗时分解（毫秒，各阶段为累计值）
+
+    与响应头 Server-Timing 一致，结果缓存命中时上游阶段为 0
+    """
+
+    fetch_ms: float = Field(0.0, description="上游请求耗时（不含限流等待）")
+    parse_ms: float = Field(0.0, description="上游响应解析和格式校验耗时")
+    transform_ms: float = Field(0.0, description="职位转换耗时（clean_html、地点解析、DTO 校验等）")
+    dedup_ms: float = Field(0.0, description="按 source_id 去重耗时")
+    serialize_ms: float = Field(0.0, description="响应序列化耗时（不含 timings 本身）")
+    rate_limit_wait_ms: float = Field(0.0, description="限流等待耗时")
+    total_ms: float = Field(0.0, description="请求总耗时")
+    upstream_requests: int = Field(0, description="上游请求次数（含重试）")
+    upstream_bytes: int = Field(0, description="上游响应字节数")
+
+
 class ScrapeResponse(BaseModel):
     """
     爬取响应
@@ -139,6 +160,10 @@ class ScrapeResponse(BaseModel):
     jobs: List[JobPostingDTO] = Field(..., description="职位列表")
     count: int = Field(..., description="职位数量")
     scraped_at: datetime = Field(default_factory=datetime.utcnow, description="爬取时间")
+    cache_hit: bool = Field(False, description="是否来自结果缓存或页面缓存")
+    cache_age_seconds: Optional[float] = Field(None, description="缓存数据的年龄（秒，未命中时为空）")
+    truncated: bool = Field(False, description="是否因截止时间用尽只返回了部分结果")
+    timings: Optional[ScrapeTimings] = Field(None, description="耗时分解（/scrape/{platform} 返回，同 Server-Timing 头）")
 
     class Config:
         json_schema_extra = {
@@ -155,18 +180,162 @@ class ScrapeResponse(BaseModel):
                     }
                 ],
                 "count": 1,
-                "scraped_at": "2025-12-18T12:00:00Z"
+                "scraped_at": "2025-12-18T12:00:00Z",
+                "cache_hit": False,
+                "cache_age_seconds": None,
+                "truncated": False
+            }
+        }
+
+
+class StreamTrailer(BaseModel):
+    """
+    流式抓取的结尾行
+
+    NDJSON 流的最后一行为 {"trailer": {...}}，用于与职位行区分
+    """
+
+    platform: PlatformEnum = Field(..., description="数据源平台")
+    count: int = Field(..., description="已输出的职位数量")
+    pages: int = Field(0, description="成功获取的页数")
+    transform_failures: int = Field(0, description="转换失败（跳过）的职位数")
+    duplicates_removed: int = Field(0, description="去重移除的职位数")
+    errors: List[str] = Field(default_factory=list, description="抓取过程中的错误")
+    completed: bool = Field(True, description="是否完整结束（出错中断时为 False）")
+    truncated: bool = Field(False, description="是否因截止时间用尽提前结束")
+    scraped_at: datetime = Field(default_factory=datetime.utcnow, description="爬取时间")
+
+
+class BatchScrapeSpec(ScrapeRequest):
+    """
+    批量抓取中的单个任务
+
+    在 ScrapeRequest 的基础上增加目标平台
+    """
+
+    platform: PlatformEnum = Field(..., description="目标平台")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "platform": "seek",
+                "keywords": "tiler",
+                "location": "Adelaide",
+                "max_results": 50
+            }
+        }
+
+
+class BatchScrapeRequest(BaseModel):
+    """批量抓取请求（keyword × location × platform 矩阵）"""
+
+    specs: List[BatchScrapeSpec] = Field(..., description="抓取任务列表", min_length=1)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "specs": [
+                    {"platform": "seek", "keywords": "tiler", "location": "Adelaide", "max_results": 50},
+                    {"platform": "indeed", "keywords": "tiler", "location": "Adelaide", "max_results": 50}
+                ]
+            }
+        }
+
+
+class BatchScrapeResult(BaseModel):
+    """批量抓取中单个任务的结果"""
+
+    index: int = Field(..., description="任务在请求中的序号（从 0 开始）")
+    platform: PlatformEnum = Field(..., description="数据源平台")
+    keywords: str = Field(..., description="搜索关键词")
+    location: str = Field(..., description="地点")
+    jobs: List[JobPostingDTO] = Field(default_factory=list, description="职位列表")
+    count: int = Field(0, description="职位数量")
+    error: Optional[str] = Field(None, description="错误信息（成功时为空）")
+    error_type: Optional[str] = Field(None, description="异常类型（如 ScraperTimeoutError）")
+    truncated: bool = Field(False, description="是否因截止时间用尽只返回了部分结果")
+    queued_ms: float = Field(0.0, description="等待并发槽位的时间（毫秒）")
+    duration_ms: float = Field(0.0, description="抓取耗时（毫秒）")
+
+
+class BatchScrapeResponse(BaseModel):
+    """批量抓取响应"""
+
+    results: List[BatchScrapeResult] = Field(..., description="按请求顺序排列的任务结果")
+    total_jobs: int = Field(..., description="所有任务的职位总数")
+    succeeded: int = Field(..., description="成功的任务数")
+    failed: int = Field(..., description="失败的任务数")
+    duration_ms: float = Field(..., description="批量抓取总耗时（毫秒）")
+    scraped_at: datetime = Field(default_factory=datetime.utcnow, description="爬取时间")
+
+
+class JobStatusEnum(str, Enum):
+    """异步任务状态"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class JobProgress(BaseModel):
+    """异步任务进度"""
+
+    total: int = Field(..., description="抓取任务总数")
+    completed: int = Field(0, description="已完成的抓取任务数（含失败）")
+    failed: int = Field(0, description="失败的抓取任务数")
+    jobs_found: int = Field(0, description="已抓取的职位数")
+
+
+class JobSubmitResponse(BaseModel):
+    """异步任务提交响应"""
+
+    job_id: str = Field(..., description="任务 ID")
+    kind: str = Field(..., description="任务类型（scrape / batch）")
+    status: JobStatusEnum = Field(..., description="任务状态")
+    status_url: str = Field(..., description="查询任务状态的 URL")
+    created_at: datetime = Field(..., description="提交时间")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "job_id": "3f1c2b9e8d7a4c6b9e0f1a2b3c4d5e6f",
+                "kind": "scrape",
+                "status": "queued",
+                "status_url": "/jobs/3f1c2b9e8d7a4c6b9e0f1a2b3c4d5e6f",
+                "created_at": "2025-12-18T12:00:00Z"
             }
         }
 
 
+class JobStatusResponse(BaseModel):
+    """异步任务状态响应"""
+
+    job_id: str = Field(..., description="任务 ID")
+    kind: str = Field(..., description="任务类型（scrape / batch）")
+    status: JobStatusEnum = Field(..., description="任务状态")
+    progress: JobProgress = Field(..., description="进度")
+    created_at: datetime = Field(..., description="提交时间")
+    started_at: Optional[datetime] = Field(None, description="开始执行时间")
+    finished_at: Optional[datetime] = Field(None, description="完成时间")
+    result: Optional[Union[ScrapeResponse, BatchScrapeResponse]] = Field(
+        None,
+        description="结果（完成后返回；scrape 任务为 ScrapeResponse，batch 任务为 BatchScrapeResponse）"
+    )
+    error: Optional[str] = Field(None, description="错误信息（失败时）")
+    error_type: Optional[str] = Field(None, description="异常类型（失败时）")
+
+
 class HealthResponse(BaseModel):
     """健康检查响应"""
 
-    status: str = Field(default="ok", description="服务状态")
+    status: str = Field(default="ok", description="服务状态（ok / degraded）")
     version: str = Field(..., description="API 版本")
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="当前时间")
     platforms: List[str] = Field(..., description="支持的平台列表")
+    circuits: Dict[str, str] = Field(
+        default_factory=dict,
+        description="各平台熔断器状态（closed / open / half_open）"
+    )
 
     class Config:
         json_schema_extra = {
@@ -174,6 +343,7 @@ class HealthResponse(BaseModel):
                 "status": "ok",
                 "version": "1.0.0",
                 "timestamp": "2025-12-18T12:00:00Z",
-                "platforms": ["indeed", "seek"]
+                "platforms": ["indeed", "seek"],
+                "circuits": {"indeed": "closed", "seek": "closed"}
             }
         }
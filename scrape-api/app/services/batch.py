@@ -0,0 +1,153 @@
+"""
+批量抓取调度
+
+一次请求执行整个 keyword × location × platform 矩阵：
+1. 全局并发上限（batch_max_concurrency）：限制同时进行的任务总数
+2. 平台并发上限（seek_batch_concurrency, indeed_batch_concurrency）：保护各上游
+3. 单个任务失败不影响其他任务，错误按任务返回
+"""
+
+import asyncio
+import time
+from typing import Callable, Dict, List, Optional
+
+from loguru import logger
+
+from app.config.settings import settings
+from app.exceptions import CircuitOpenError
+from app.models.job_posting_dto import (
+    BatchScrapeResponse,
+    BatchScrapeResult,
+    BatchScrapeSpec,
+    PlatformEnum,
+)
+from app.services import deadline, metrics, scrape_service
+
+
+class BatchScheduler:
+    """
+    批量抓取调度器
+
+    信号量在首次使用时按当前事件循环创建，
+    同一进程内的所有批量请求共享同一组并发上限
+    """
+
+    def __init__(self, max_concurrency: int, platform_limits: Dict[str, int]):
+        """
+        Args:
+            max_concurrency: 全局并发上限
+            platform_limits: 平台名称 → 平台并发上限
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.platform_limits = dict(platform_limits)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._global: Optional[asyncio.Semaphore] = None
+        self._platforms: Dict[str, asyncio.Semaphore] = {}
+
+    def _semaphores(self, platform: str):
+        """返回 (全局信号量, 平台信号量)，事件循环变化时重新创建"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._global = asyncio.Semaphore(self.max_concurrency)
+            self._platforms = {}
+
+        if platform not in self._platforms:
+            limit = self.platform_limits.get(platform, self.max_concurrency)
+            self._platforms[platform] = asyncio.Semaphore(max(1, limit))
+
+        return self._global, self._platforms[platform]
+
+    async def run(
+        self,
+        specs: List[BatchScrapeSpec],
+        on_result: Optional[Callable[[BatchScrapeResult], None]] = None
+    ) -> BatchScrapeResponse:
+        """
+        并发执行所有任务
+
+        Args:
+            specs: 抓取任务列表
+            on_result: 每个任务完成时的回调（用于报告进度，按完成顺序调用）
+
+        Returns:
+            BatchScrapeResponse: 按请求顺序排列的结果
+        """
+        start = time.perf_counter()
+        logger.info(f"Starting batch scrape: {len(specs)} specs")
+
+        results = await asyncio.gather(*[
+            self._run_spec(index, spec, on_result) for index, spec in enumerate(specs)
+        ])
+
+        failed = sum(1 for result in results if result.error)
+        duration_ms = (time.perf_counter() - start) * 1000
+        total_jobs = sum(result.count for result in results)
+
+        logger.info(
+            f"Batch scrape finished: {len(results) - failed} succeeded, {failed} failed, "
+            f"{total_jobs} jobs in {duration_ms:.0f}ms"
+        )
+
+        return BatchScrapeResponse(
+            results=results,
+            total_jobs=total_jobs,
+            succeeded=len(results) - failed,
+            failed=failed,
+            duration_ms=duration_ms,
+        )
+
+    async def _run_spec(
+        self,
+        index: int,
+        spec: BatchScrapeSpec,
+        on_result: Optional[Callable[[BatchScrapeResult], None]] = None
+    ) -> BatchScrapeResult:
+        """
+        执行单个任务
+
+        先获取平台槽位，再获取全局槽位：排队等待平台槽位的任务
+        不会占住全局槽位，避免一个平台的积压饿死其他平台
+        """
+        platform = PlatformEnum(spec.platform).value
+        global_semaphore, platform_semaphore = self._semaphores(platform)
+        result = BatchScrapeResult(
+            index=index,
+            platform=platform,
+            keywords=spec.keywords,
+            location=spec.location,
+        )
+
+        queued_at = time.perf_counter()
+        async with platform_semaphore, global_semaphore:
+            started_at = time.perf_counter()
+            result.queued_ms = (started_at - queued_at) * 1000
+            timer = metrics.RequestTimer(platform, "batch")
+            try:
+                # 每个任务独立的截止时间（请求头和 spec.deadline_ms 中较早的一个）
+                with deadline.scope(deadline.for_request(spec.deadline_ms)) as spec_deadline:
+                    jobs = await scrape_service.scrape(platform, spec)
+                result.jobs = jobs
+                result.count = len(jobs)
+                result.truncated = spec_deadline is not None and spec_deadline.exceeded
+                timer.finish(metrics.SUCCESS, len(jobs))
+            except Exception as e:
+                logger.warning(f"Batch spec #{index} ({platform}: {spec.keywords} @ {spec.location}) failed: {e}")
+                result.error = str(e)
+                result.error_type = type(e).__name__
+                timer.finish(metrics.REJECTED if isinstance(e, CircuitOpenError) else metrics.ERROR)
+            result.duration_ms = (time.perf_counter() - started_at) * 1000
+
+        if on_result is not None:
+            on_result(result)
+        return result
+
+
+# 全局调度器实例
+batch_scheduler = BatchScheduler(
+    max_concurrency=settings.batch_max_concurrency,
+    platform_limits={
+        "seek": settings.seek_batch_concurrency,
+        "indeed": settings.indeed_batch_concurrency,
+    },
+)
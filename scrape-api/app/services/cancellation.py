@@ -0,0 +1,118 @@
+"""
+调用方断开时取消抓取
+
+.NET 调用方超时或 Hangfire 取消任务后，没人会读取的抓取仍在占用上游配额、线程和 CPU：
+1. 端点通过 run_until_disconnect() 同时等待抓取和 http.disconnect，断开时取消抓取任务
+2. asyncio 的取消沿调用链传递：single-flight 的最后一个等待者离开时取消共享的抓取，
+   SEEK 的在途分页请求和转换随任务一起取消
+3. 线程池中的同步调用无法被 asyncio 中断：执行器在取消时设置 CancelToken，
+   同步代码在检查点（check_cancelled()）抛出 RequestCancelledError 提前结束
+
+被丢弃的抓取已发出的上游请求计入 scrape_wasted_upstream_calls_total（见 metrics.py）
+"""
+
+import asyncio
+import threading
+from contextvars import ContextVar
+from typing import Awaitable, Optional, TypeVar
+
+from starlette.requests import Request
+
+from app.exceptions import RequestCancelledError
+
+T = TypeVar("T")
+
+
+class CancelToken:
+    """
+    线程安全的取消标记
+
+    由异步一侧设置，线程中的同步代码查询
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        """标记为已取消"""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """是否已取消"""
+        return self._event.is_set()
+
+
+_current: ContextVar[Optional[CancelToken]] = ContextVar("cancel_token", default=None)
+
+
+def bind(token: CancelToken):
+    """
+    把 token 设为当前上下文的取消标记
+
+    在 contextvars.Context.run() 中调用，只影响该上下文（如执行器复制给工作线程的上下文）
+
+    Args:
+        token: 取消标记
+    """
+    _current.set(token)
+
+
+def check_cancelled(platform: Optional[str] = None):
+    """
+    检查点：当前调用已取消时抛出 RequestCancelledError（不在可取消的调用内时什么也不做）
+
+    Args:
+        platform: 平台名称（写入异常）
+
+    Raises:
+        RequestCancelledError: 所属的异步调用已取消
+    """
+    token = _current.get()
+    if token is not None and token.cancelled:
+        raise RequestCancelledError("Request cancelled", platform=platform)
+
+
+async def _wait_for_disconnect(request: Request):
+    """等待 http.disconnect（请求体已读完，之后只会收到断开消息）"""
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+async def run_until_disconnect(request: Request, awaitable: Awaitable[T], platform: Optional[str] = None) -> T:
+    """
+    执行 awaitable，调用方先断开连接时取消它
+
+    Args:
+        request: 当前 HTTP 请求（请求体须已读取）
+        awaitable: 抓取协程
+        platform: 平台名称（写入异常）
+
+    Returns:
+        awaitable 的结果
+
+    Raises:
+        RequestCancelledError: 调用方已断开，抓取已取消
+    """
+    work = asyncio.ensure_future(awaitable)
+    watcher = asyncio.ensure_future(_wait_for_disconnect(request))
+    try:
+        await asyncio.wait({work, watcher}, return_when=asyncio.FIRST_COMPLETED)
+    except asyncio.CancelledError:
+        work.cancel()
+        raise
+    finally:
+        watcher.cancel()
+
+    if work.done():
+        return work.result()
+
+    # 等待取消完成，让 finally 中的清理（取消在途分页、记录浪费的上游请求）在返回前执行
+    work.cancel()
+    try:
+        await work
+    except (asyncio.CancelledError, Exception):
+        pass  # 调用方已断开，抓取的结果或异常都无人读取
+    raise RequestCancelledError("Client disconnected", platform=platform)
@@ -0,0 +1,365 @@
+"""
+按平台的熔断器
+
+上游宕机或封禁时，不再让每个请求都等满超时：
+1. CLOSED：正常调用，在最近 circuit_window_size 次调用的滑动窗口内统计失败率
+2. 调用数达到 circuit_min_calls 且失败率 ≥ circuit_failure_rate_threshold 时转为 OPEN
+3. OPEN：直接抛出 CircuitOpenError（不访问上游），circuit_open_seconds 后转为 HALF_OPEN
+4. HALF_OPEN：只放行 circuit_half_open_max_calls 个探测请求，成功则 CLOSED，失败则重新 OPEN
+
+失败按现有异常分类判定（见 is_upstream_failure()）；调用方断开或截止时间用尽而中止的调用
+不代表上游的状态，不计入结果。状态见 GET /health 的 circuits
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+from loguru import logger
+
+from app.config.settings import settings
+from app.exceptions import (
+    CircuitOpenError,
+    DeadlineExceededError,
+    PlatformException,
+    RequestCancelledError,
+    ScraperNetworkError,
+    ScraperNotFoundError,
+)
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# 表示上游不可用 / 封禁的 4xx（其他 4xx 是请求本身的问题）
+_BLOCKING_STATUS_CODES = {401, 403, 429}
+
+
+def is_upstream_failure(error: BaseException) -> bool:
+    """
+    判断异常是否计入熔断失败率
+
+    超时 / 网络错误 / 429 / 5xx / 401 / 403 计入；404、其他 4xx、数据格式错误不计入
+
+    Args:
+        error: 上游调用抛出的异常
+
+    Returns:
+        bool: 是否为上游故障
+    """
+    if isinstance(error, ScraperNetworkError):
+        return True
+    if isinstance(error, ScraperNotFoundError):
+        return False
+    if isinstance(error, PlatformException):
+        status_code = error.status_code
+        return status_code is None or status_code >= 500 or status_code in _BLOCKING_STATUS_CODES
+    return False
+
+
+class CircuitBreaker:
+    """
+    单个平台的熔断器（线程安全，事件循环和线程池共用）
+    """
+
+    def __init__(
+        self,
+        platform: str,
+        failure_rate_threshold: float = 0.5,
+        window_size: int = 20,
+        min_calls: int = 5,
+        open_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            platform: 平台名称
+            failure_rate_threshold: 触发熔断的失败率（0-1）
+            window_size: 滑动窗口大小（最近的调用数）
+            min_calls: 窗口内至少多少次调用后才判断失败率
+            open_seconds: OPEN 状态持续时间（秒）
+            half_open_max_calls: HALF_OPEN 状态同时允许的探测请求数
+            clock: 单调时钟（测试中可替换）
+        """
+        self.platform = platform
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_calls = max(1, min_calls)
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = max(1, half_open_max_calls)
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self._state = CLOSED
+        self._outcomes: Deque[bool] = deque(maxlen=max(1, window_size))  # True 表示失败
+        self._opened_at = 0.0
+        self._probes = 0
+
+        self.rejected = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> str:
+        """当前状态（OPEN 到期后报告为 HALF_OPEN）"""
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _maybe_half_open(self):
+        """OPEN 到期后转为 HALF_OPEN（调用方持有锁）"""
+        if self._state == OPEN and self._clock() - self._opened_at >= self.open_seconds:
+            self._state = HALF_OPEN
+            self._probes = 0
+            logger.info(f"[{self.platform}] Circuit half-open, probing upstream")
+
+    def _open(self):
+        """转为 OPEN（调用方持有锁）"""
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._probes = 0
+        self.times_opened += 1
+
+    def retry_after(self) -> float:
+        """OPEN 状态剩余时间（秒）"""
+        with self._lock:
+            if self._state != OPEN:
+                return 0.0
+            return max(0.0, self.open_seconds - (self._clock() - self._opened_at))
+
+    def before_call(self):
+        """
+        调用上游前检查（HALF_OPEN 时占用一个探测名额）
+
+        Raises:
+            CircuitOpenError: 熔断器打开，或 HALF_OPEN 探测名额已满
+        """
+        with self._lock:
+            self._maybe_half_open()
+
+            if self._state == CLOSED:
+                return
+            if self._state == HALF_OPEN and self._probes < self.half_open_max_calls:
+                self._probes += 1
+                return
+
+            self.rejected += 1
+            remaining = max(0.0, self.open_seconds - (self._clock() - self._opened_at))
+
+        raise CircuitOpenError(
+            message=f"Circuit open, upstream unavailable (retry in {remaining:.0f}s)",
+            platform=self.platform,
+            retry_after=int(remaining + 0.999)
+        )
+
+    def on_success(self):
+        """记录一次成功调用"""
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._state = CLOSED
+                self._outcomes.clear()
+                self._probes = 0
+                logger.info(f"[{self.platform}] Circuit closed, upstream recovered")
+                return
+            self._outcomes.append(False)
+
+    def on_failure(self):
+        """记录一次失败调用（可能触发 OPEN）"""
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._open()
+                logger.warning(f"[{self.platform}] Probe failed, circuit re-opened for {self.open_seconds:g}s")
+                return
+            if self._state == OPEN:
+                return
+
+            self._outcomes.append(True)
+            calls = len(self._outcomes)
+            failure_rate = sum(self._outcomes) / calls
+            if calls >= self.min_calls and failure_rate >= self.failure_rate_threshold:
+                self._open()
+                logger.warning(
+                    f"[{self.platform}] Circuit opened for {self.open_seconds:g}s "
+                    f"(failure rate {failure_rate:.0%} over {calls} calls)"
+                )
+
+    def on_abort(self):
+        """调用被取消（不计入结果，只释放探测名额）"""
+        with self._lock:
+            if self._state == HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def _record(self, error: BaseException, is_failure: Callable[[BaseException], bool]):
+        """按异常类型记录调用结果"""
+        if isinstance(error, (DeadlineExceededError, RequestCancelledError)):
+            # 调用方放弃了调用，没有得到上游的任何信息（HALF_OPEN 时不能据此恢复）
+            self.on_abort()
+        elif is_failure(error):
+            self.on_failure()
+        else:
+            # 上游正常响应（如 404），只是请求本身有问题
+            self.on_success()
+
+    async def call(
+        self,
+        func: Callable[[], Awaitable[T]],
+        is_failure: Callable[[BaseException], bool] = is_upstream_failure
+    ) -> T:
+        """
+        经过熔断器执行异步调用
+
+        Args:
+            func: 无参协程工厂
+            is_failure: 判断异常是否计入失败率
+
+        Returns:
+            func() 的返回值
+
+        Raises:
+            CircuitOpenError: 熔断器打开
+        """
+        self.before_call()
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            self.on_abort()
+            raise
+        except Exception as e:
+            self._record(e, is_failure)
+            raise
+        self.on_success()
+        return result
+
+    def call_sync(
+        self,
+        func: Callable[[], T],
+        is_failure: Callable[[BaseException], bool] = is_upstream_failure
+    ) -> T:
+        """
+        经过熔断器执行同步调用，见 call()
+        """
+        self.before_call()
+        try:
+            result = func()
+        except Exception as e:
+            self._record(e, is_failure)
+            raise
+        self.on_success()
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """返回熔断器状态"""
+        with self._lock:
+            self._maybe_half_open()
+            calls = len(self._outcomes)
+            failures = sum(self._outcomes)
+            state = self._state
+        return {
+            "state": state,
+            "window_calls": calls,
+            "window_failure_rate": round(failures / calls, 4) if calls else 0.0,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+            "retry_after_seconds": round(self.retry_after(), 1),
+        }
+
+
+class CircuitBreakers:
+    """按平台管理熔断器（首次使用时按配置创建）"""
+
+    def __init__(self):
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, platform: str) -> Optional[CircuitBreaker]:
+        """
+        获取平台的熔断器
+
+        Args:
+            platform: 平台名称
+
+        Returns:
+            CircuitBreaker: 熔断器；circuit_breaker_enabled=False 时返回 None
+        """
+        if not settings.circuit_breaker_enabled:
+            return None
+
+        platform = getattr(platform, "value", platform)
+        with self._lock:
+            breaker = self._breakers.get(platform)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    platform,
+                    failure_rate_threshold=settings.circuit_failure_rate_threshold,
+                    window_size=settings.circuit_window_size,
+                    min_calls=settings.circuit_min_calls,
+                    open_seconds=settings.circuit_open_seconds,
+                    half_open_max_calls=settings.circuit_half_open_max_calls,
+                )
+                self._breakers[platform] = breaker
+            return breaker
+
+    def states(self) -> Dict[str, str]:
+        """返回各平台的熔断状态（未使用过的平台为 closed）"""
+        with self._lock:
+            breakers = dict(self._breakers)
+        states = {platform: CLOSED for platform in settings.supported_platforms}
+        states.update({platform: breaker.state for platform, breaker in breakers.items()})
+        return states
+
+    def stats(self) -> Dict[str, Any]:
+        """返回各平台熔断器的详细状态"""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {platform: breaker.stats() for platform, breaker in breakers.items()}
+
+    def reset(self):
+        """丢弃所有熔断器"""
+        with self._lock:
+            self._breakers.clear()
+
+
+# 全局熔断器
+circuit_breakers = CircuitBreakers()
+
+
+async def guarded(platform: str, func: Callable[[], Awaitable[T]]) -> T:
+    """
+    经过平台熔断器执行异步上游调用（熔断关闭时直接执行）
+
+    Args:
+        platform: 平台名称
+        func: 无参协程工厂
+
+    Returns:
+        func() 的返回值
+    """
+    breaker = circuit_breakers.get(platform)
+    if breaker is None:
+        return await func()
+    return await breaker.call(func)
+
+
+def guarded_sync(
+    platform: str,
+    func: Callable[[], T],
+    is_failure: Callable[[BaseException], bool] = is_upstream_failure
+) -> T:
+    """
+    经过平台熔断器执行同步上游调用，见 guarded()
+
+    Args:
+        platform: 平台名称
+        func: 无参函数
+        is_failure: 判断异常是否计入失败率
+
+    Returns:
+        func() 的返回值
+    """
+    breaker = circuit_breakers.get(platform)
+    if breaker is None:
+        return func()
+    return breaker.call_sync(func, is_failure)
@@ -0,0 +1,119 @@
+"""
+列式紧凑 JSON（/scrape/{platform}?format=columnar）
+
+ScrapeResponse 中 source、location_state、trade、employment_type、company 等字段在每行重复，
+null 字段也逐行输出。列式格式把职位列表转为按字段存储的列：
+1. 所有行都等于字段默认值（null / 空列表）的列省略，解码时补默认值
+2. 所有行取值相同的列：{"const": 值}
+3. 低基数的字符串列（不同取值数不超过非空行数的一半）字典编码：
+   {"dict": [取值...], "codes": [下标或 null...]}
+4. 其他列为普通数组（与行顺序一致）
+
+响应的其余字段（platform、count、scraped_at 等）不变，职位在 "jobs": {"length": N, "columns": {...}} 中，
+并带 "format": "columnar"。取值与 JSON 格式一致（datetime 为 ISO 8601 字符串）
+"""
+
+from typing import Any, Dict, List
+
+from pydantic_core import to_json
+
+from app.models.job_posting_dto import JobPostingDTO, ScrapeResponse
+
+COLUMNAR_FORMAT = "columnar"
+
+_NO_DEFAULT = object()
+
+
+def _field_defaults() -> Dict[str, Any]:
+    """JobPostingDTO 各字段的默认值（只考虑 null 和空列表；其他字段不省略）"""
+    defaults: Dict[str, Any] = {}
+    for name, field in JobPostingDTO.model_fields.items():
+        if field.default_factory is list:
+            defaults[name] = []
+        elif field.default_factory is None and field.default is None:
+            defaults[name] = None
+        else:
+            defaults[name] = _NO_DEFAULT
+    return defaults
+
+
+_DEFAULTS = _field_defaults()
+
+
+def _encode_column(values: List[Any]) -> Any:
+    """编码一列（常量 / 字典 / 普通数组）"""
+    first = values[0]
+    if all(value == first for value in values):
+        return {"const": first}
+
+    present = [value for value in values if value is not None]
+    if present and all(isinstance(value, str) for value in present):
+        distinct = list(dict.fromkeys(present))
+        if len(distinct) * 2 <= len(present):
+            index = {value: i for i, value in enumerate(distinct)}
+            return {"dict": distinct, "codes": [None if value is None else index[value] for value in values]}
+    return values
+
+
+def encode_jobs(jobs: List[JobPostingDTO]) -> Dict[str, Any]:
+    """
+    把职位列表转为列式结构
+
+    Args:
+        jobs: 已校验的职位
+
+    Returns:
+        dict: {"length": N, "columns": {字段: 编码后的列}}
+    """
+    rows = [job.model_dump(mode="json") for job in jobs]
+    columns: Dict[str, Any] = {}
+    if rows:
+        for name, default in _DEFAULTS.items():
+            values = [row[name] for row in rows]
+            if default is not _NO_DEFAULT and all(value == default for value in values):
+                continue
+            columns[name] = _encode_column(values)
+    return {"length": len(rows), "columns": columns}
+
+
+def encode_columnar(response: ScrapeResponse) -> bytes:
+    """
+    把抓取响应编码为列式 JSON（不含 timings，由调用方拼接）
+
+    Args:
+        response: 抓取响应
+
+    Returns:
+        bytes: UTF-8 编码的 JSON
+    """
+    body = response.model_dump(mode="json", exclude={"jobs", "timings"})
+    body["format"] = COLUMNAR_FORMAT
+    body["jobs"] = encode_jobs(response.jobs)
+    return to_json(body)
+
+
+def decode_jobs(jobs: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    把列式结构还原为行（与 JSON 格式中的职位对象相同）
+
+    Args:
+        jobs: 列式响应中的 "jobs"
+
+    Returns:
+        list: 每个职位的 dict（省略的列补默认值）
+    """
+    length = jobs["length"]
+    columns = jobs["columns"]
+    decoded: Dict[str, List[Any]] = {}
+    for name, default in _DEFAULTS.items():
+        column = columns.get(name)
+        if column is None:
+            decoded[name] = [[] if isinstance(default, list) else default for _ in range(length)]
+        elif isinstance(column, list):
+            decoded[name] = column
+        elif "const" in column:
+            decoded[name] = [column["const"]] * length
+        else:
+            values = column["dict"]
+            decoded[name] = [None if code is None else values[code] for code in column["codes"]]
+    return [{name: decoded[name][i] for name in decoded} for i in range(length)]
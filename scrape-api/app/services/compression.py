@@ -0,0 +1,252 @@
+"""
+响应压缩
+
+Indeed 的职位描述不截断，50-200 个职位的响应可达数 MB。CompressionMiddleware 按请求的
+Accept-Encoding 协商压缩：
+1. 支持 zstd（需要安装 zstandard，未安装时只提供 gzip）和 gzip；q 值相同时优先 zstd
+2. 完整响应小于 compression_min_size 字节时不压缩；已带 Content-Encoding 或非文本类型的响应不压缩
+3. 流式响应（NDJSON，每页一块）逐块压缩并 flush，调用方仍能逐页读取
+4. 可能压缩的响应（可压缩的内容类型）都带 Vary: Accept-Encoding，包括因请求不接受压缩或响应太小而未压缩的响应
+5. 超过 256 KB 的响应体在线程中压缩（zlib / zstandard 压缩时释放 GIL），不阻塞事件循环
+"""
+
+import asyncio
+import functools
+import zlib
+from typing import Dict, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from app.config.settings import settings
+
+GZIP = "gzip"
+ZSTD = "zstd"
+
+# 压缩的内容类型（JSON / NDJSON / 文本 / Arrow / MessagePack）
+_COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "text/",
+    "application/vnd.apache.arrow.stream",
+    "application/msgpack",
+)
+
+# 超过该大小的块在线程中压缩
+_OFFLOAD_BYTES = 256 * 1024
+
+
+@functools.lru_cache(maxsize=None)
+def zstd_available() -> bool:
+    """检查 zstd 依赖（zstandard）是否已安装（结果缓存，避免每个请求重复查找模块）"""
+    try:
+        import zstandard  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def parse_accept_encoding(header: Optional[str]) -> Dict[str, float]:
+    """
+    解析 Accept-Encoding 头
+
+    Args:
+        header: 头的值，如 "zstd;q=1.0, gzip;q=0.8, *;q=0"
+
+    Returns:
+        dict: 编码名称（小写）→ q 值（无效的 q 值视为 0）
+    """
+    preferences: Dict[str, float] = {}
+    for part in (header or "").split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        preferences[coding] = quality
+    return preferences
+
+
+def choose_encoding(header: Optional[str]) -> Optional[str]:
+    """
+    根据 Accept-Encoding 选择压缩编码
+
+    Args:
+        header: Accept-Encoding 头
+
+    Returns:
+        str: "zstd" / "gzip"；调用方不接受任何支持的编码时返回 None
+    """
+    preferences = parse_accept_encoding(header)
+    wildcard = preferences.get("*", 0.0)
+    candidates = (ZSTD, GZIP) if zstd_available() else (GZIP,)
+
+    best, best_quality = None, 0.0
+    for coding in candidates:
+        quality = preferences.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+class _GzipCompressor:
+    """gzip 流式压缩器"""
+
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        """压缩一块数据（非最后一块时 flush，使已压缩的数据立即可解压）"""
+        flush_mode = zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH
+        return self._compressor.compress(data) + self._compressor.flush(flush_mode)
+
+
+class _ZstdCompressor:
+    """zstd 流式压缩器"""
+
+    def __init__(self, level: int):
+        import zstandard
+        self._flush_block = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        """压缩一块数据（非最后一块时 flush 当前 block）"""
+        if final:
+            return self._compressor.compress(data) + self._compressor.flush()
+        return self._compressor.compress(data) + self._compressor.flush(self._flush_block)
+
+
+def create_compressor(encoding: str):
+    """按编码和配置的压缩级别创建流式压缩器"""
+    if encoding == ZSTD:
+        return _ZstdCompressor(settings.zstd_level)
+    return _GzipCompressor(settings.gzip_level)
+
+
+class CompressionStats:
+    """压缩统计（GET /stats 的 compression）"""
+
+    def __init__(self):
+        self.responses: Dict[str, int] = {}
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def add_response(self, encoding: str):
+        """记录一个压缩的响应"""
+        self.responses[encoding] = self.responses.get(encoding, 0) + 1
+
+    def add_bytes(self, bytes_in: int, bytes_out: int):
+        """记录一块数据压缩前后的字节数"""
+        self.bytes_in += bytes_in
+        self.bytes_out += bytes_out
+
+    def stats(self) -> dict:
+        """返回统计信息"""
+        return {
+            "responses": dict(self.responses),
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "ratio": round(self.bytes_out / self.bytes_in, 4) if self.bytes_in else None,
+        }
+
+
+# 全局压缩统计
+compression_stats = CompressionStats()
+
+
+class _CompressingSend:
+    """
+    包装 ASGI send：延迟发送响应头，根据第一块响应体决定是否压缩
+    """
+
+    def __init__(self, send, encoding: Optional[str]):
+        self._send = send
+        self._encoding = encoding
+        self._start: Optional[dict] = None
+        self._compressor = None
+        self._passthrough = False
+
+    async def __call__(self, message):
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            self._start = message
+            return
+        if message_type != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._start is not None:
+            start, self._start = self._start, None
+            headers = MutableHeaders(scope=start)
+            if not self._should_compress(headers, body, more_body):
+                # 换一个 Accept-Encoding 可能得到压缩的响应，缓存需要区分
+                if self._compressible(headers):
+                    headers.add_vary_header("Accept-Encoding")
+                self._passthrough = True
+                await self._send(start)
+                await self._send(message)
+                return
+
+            self._compressor = create_compressor(self._encoding)
+            compression_stats.add_response(self._encoding)
+            data = await self._compress(body, final=not more_body)
+            headers["Content-Encoding"] = self._encoding
+            headers.add_vary_header("Accept-Encoding")
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(len(data))
+            await self._send(start)
+        else:
+            data = await self._compress(body, final=not more_body)
+
+        await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+    @staticmethod
+    def _compressible(headers: Headers) -> bool:
+        """响应是否可压缩（可压缩的内容类型，且未带 Content-Encoding）"""
+        if "content-encoding" in headers:
+            return False
+        return headers.get("content-type", "").startswith(_COMPRESSIBLE_TYPES)
+
+    def _should_compress(self, headers: Headers, body: bytes, more_body: bool) -> bool:
+        """是否压缩该响应（调用方不接受压缩或完整响应小于下限时不压缩；流式响应总是压缩）"""
+        if self._encoding is None or not self._compressible(headers):
+            return False
+        return more_body or len(body) >= settings.compression_min_size
+
+    async def _compress(self, body: bytes, final: bool) -> bytes:
+        """压缩一块响应体（大块在线程中压缩）"""
+        if len(body) >= _OFFLOAD_BYTES:
+            data = await asyncio.to_thread(self._compressor.compress, body, final)
+        else:
+            data = self._compressor.compress(body, final)
+        compression_stats.add_bytes(len(body), len(data))
+        return data
+
+
+class CompressionMiddleware:
+    """
+    ASGI 中间件：按 Accept-Encoding 压缩响应（见模块说明）
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.compression_enabled:
+            await self.app(scope, receive, send)
+            return
+
+        # 调用方不接受压缩时也包装 send：可压缩的响应需要带 Vary
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding"))
+        await self.app(scope, receive, _CompressingSend(send, encoding))
@@ -0,0 +1,199 @@
+"""
+请求截止时间
+
+调用方（.NET / Hangfire）通过 X-Request-Deadline 请求头或 ScrapeRequest.deadline_ms 传入剩余的时间预算（毫秒），
+抓取在预算内尽量多返回结果，而不是等到上游超时后整体失败：
+1. 端点 / scrape_service 把 Deadline 绑定到当前上下文（线程池调用会复制上下文）
+2. 每次上游请求的超时取 min(配置的超时, 剩余预算)，预算用尽时抛出 DeadlineExceededError
+   （不重试、不计入熔断失败率），剩余的退避等待超过预算时不再重试
+3. 适配器捕获 DeadlineExceededError，返回已抓取的职位；响应的 truncated 为 True
+
+截止时间使用单调时钟，不依赖调用方与本服务的时钟同步
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from app.exceptions import DeadlineExceededError
+
+# 请求头名称（值为剩余预算的毫秒数）
+DEADLINE_HEADER = "X-Request-Deadline"
+
+
+class Deadline:
+    """
+    单个请求的截止时间
+
+    exceeded 表示有调用因预算用尽而提前结束（结果可能不完整），同时标记到 parent
+    """
+
+    def __init__(self, seconds: float, parent: Optional["Deadline"] = None):
+        """
+        Args:
+            seconds: 从现在起的时间预算（秒）
+            parent: 外层的截止时间（如批量抓取中单个任务的截止时间）
+        """
+        self.expires_at = time.monotonic() + seconds
+        self.parent = parent
+        self.exceeded = False
+
+    def mark_exceeded(self):
+        """记录截断（包括所有外层截止时间）"""
+        deadline = self
+        while deadline is not None:
+            deadline.exceeded = True
+            deadline = deadline.parent
+
+    def remaining(self) -> float:
+        """剩余秒数（不小于 0）"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """预算是否已用尽"""
+        return time.monotonic() >= self.expires_at
+
+    def check(self, platform: Optional[str] = None):
+        """
+        预算已用尽时记录截断并抛出 DeadlineExceededError
+
+        Args:
+            platform: 平台名称（写入异常）
+
+        Raises:
+            DeadlineExceededError: 预算已用尽
+        """
+        if self.expired:
+            self.mark_exceeded()
+            raise DeadlineExceededError("Request deadline exceeded", platform=platform)
+
+    def timeout(self, default: float, platform: Optional[str] = None) -> float:
+        """
+        本次上游调用的超时
+
+        Args:
+            default: 配置的超时（秒）
+            platform: 平台名称（写入异常）
+
+        Returns:
+            float: min(default, 剩余预算)
+
+        Raises:
+            DeadlineExceededError: 预算已用尽
+        """
+        self.check(platform)
+        return min(default, self.remaining())
+
+
+_current: ContextVar[Optional[Deadline]] = ContextVar("request_deadline", default=None)
+
+
+def current() -> Optional[Deadline]:
+    """返回当前上下文的截止时间（未设置时为 None）"""
+    return _current.get()
+
+
+@contextmanager
+def scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """
+    在代码块内把 deadline 设为当前截止时间（None 时不改变当前上下文）
+
+    Args:
+        deadline: 截止时间
+
+    Yields:
+        Optional[Deadline]: deadline
+    """
+    if deadline is None:
+        yield None
+        return
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+def detach():
+    """
+    清除当前上下文的截止时间
+
+    在后台任务开始时调用（任务复制了创建时的上下文，但不应受调用方预算的限制）
+    """
+    _current.set(None)
+
+
+def for_request(budget_ms: Optional[int] = None) -> Optional[Deadline]:
+    """
+    为单次抓取创建截止时间：取当前截止时间（请求头）和 budget_ms（请求体）中较早的一个
+
+    每次抓取使用独立的 Deadline（截断时同时标记当前截止时间），
+    批量抓取中一个任务被截断不影响其他任务的 truncated
+
+    Args:
+        budget_ms: 请求体中的时间预算（毫秒）
+
+    Returns:
+        Optional[Deadline]: 两者都未设置时为 None
+    """
+    parent = current()
+    budgets = [seconds for seconds in (
+        parent.remaining() if parent is not None else None,
+        budget_ms / 1000 if budget_ms is not None else None,
+    ) if seconds is not None]
+    return Deadline(min(budgets), parent=parent) if budgets else None
+
+
+def parse_header(value: Optional[str]) -> Optional[Deadline]:
+    """
+    解析 X-Request-Deadline 请求头
+
+    Args:
+        value: 请求头的值（剩余预算的毫秒数）
+
+    Returns:
+        Optional[Deadline]: 未设置时为 None
+
+    Raises:
+        ValueError: 不是正数
+    """
+    if value is None or not value.strip():
+        return None
+    budget_ms = float(value)
+    if not budget_ms > 0:
+        raise ValueError(f"{DEADLINE_HEADER} must be a positive number of milliseconds")
+    return Deadline(budget_ms / 1000)
+
+
+def check(platform: Optional[str] = None):
+    """当前截止时间已过时抛出 DeadlineExceededError（未设置截止时间时什么也不做），见 Deadline.check()"""
+    deadline = current()
+    if deadline is not None:
+        deadline.check(platform)
+
+
+def timeout(default: float, platform: Optional[str] = None) -> float:
+    """本次上游调用的超时（未设置截止时间时为 default），见 Deadline.timeout()"""
+    deadline = current()
+    return default if deadline is None else deadline.timeout(default, platform)
+
+
+def out_of_time() -> bool:
+    """
+    非抛出版本的 check()：预算已用尽时记录截断并返回 True
+
+    用于逐行转换等可以直接停止、返回已有结果的循环
+    """
+    deadline = current()
+    if deadline is not None and deadline.expired:
+        deadline.mark_exceeded()
+        return True
+    return False
+
+
+def truncated() -> bool:
+    """当前抓取是否因截止时间被截断"""
+    deadline = current()
+    return deadline is not None and deadline.exceeded
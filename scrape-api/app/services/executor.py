@@ -0,0 +1,152 @@
+"""
+阻塞任务执行器
+
+为每个平台维护独立、有界的线程池，将同步适配器调用（requests / JobSpy / pandas）
+移出事件循环，避免单个慢请求冻结整个 uvicorn worker（包括 /health）。
+
+设计要点：
+1. 平台隔离：Indeed 变慢不会占满 SEEK 的线程
+2. 有界：线程数由 Settings 配置（seek_executor_workers, indeed_executor_workers）
+3. 上下文传递：与 asyncio.to_thread 一致，复制 contextvars 到工作线程
+4. 取消：等待中的调用被取消时，排队的任务不再执行，运行中的任务通过 CancelToken
+   在检查点提前结束（见 cancellation.py）
+"""
+
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from loguru import logger
+
+from app.config.settings import settings
+from app.services import cancellation
+
+T = TypeVar("T")
+
+
+class PlatformExecutors:
+    """
+    按平台划分的线程池集合
+
+    线程池在首次使用时创建，shutdown() 后再次使用会重新创建
+    """
+
+    def __init__(self, sizes: Dict[str, int], default_size: int = 4):
+        """
+        Args:
+            sizes: 平台名称 → 线程池大小
+            default_size: 未配置平台的线程池大小
+        """
+        self._sizes = dict(sizes)
+        self._default_size = default_size
+        self._executors: Dict[str, ThreadPoolExecutor] = {}
+        self._lock = threading.Lock()
+
+    def size_of(self, platform: str) -> int:
+        """返回平台线程池的大小"""
+        return max(1, self._sizes.get(platform, self._default_size))
+
+    def get(self, platform: str) -> ThreadPoolExecutor:
+        """
+        获取（必要时创建）平台线程池
+
+        Args:
+            platform: 平台名称（seek, indeed 等）
+
+        Returns:
+            ThreadPoolExecutor: 该平台专用的线程池
+        """
+        executor = self._executors.get(platform)
+        if executor is not None:
+            return executor
+
+        with self._lock:
+            executor = self._executors.get(platform)
+            if executor is None:
+                workers = self.size_of(platform)
+                executor = ThreadPoolExecutor(
+                    max_workers=workers,
+                    thread_name_prefix=f"{platform}-worker"
+                )
+                self._executors[platform] = executor
+                logger.info(f"Created {platform} executor with {workers} workers")
+            return executor
+
+    async def run(self, platform: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        在平台线程池中执行阻塞函数
+
+        Args:
+            platform: 平台名称
+            func: 阻塞函数
+            *args, **kwargs: 传给 func 的参数
+
+        Returns:
+            func 的返回值（异常原样抛出）
+        """
+        loop = asyncio.get_running_loop()
+        token = cancellation.CancelToken()
+        ctx = contextvars.copy_context()
+        ctx.run(cancellation.bind, token)
+        call = functools.partial(ctx.run, func, *args, **kwargs)
+        try:
+            return await loop.run_in_executor(self.get(platform), call)
+        except asyncio.CancelledError:
+            # 线程中的调用无法中断，通知它在下一个检查点结束
+            token.cancel()
+            raise
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        返回各线程池的状态
+
+        Returns:
+            dict: {platform: {"max_workers": n, "threads": n, "queued": n}}
+        """
+        result = {}
+        for platform, executor in list(self._executors.items()):
+            result[platform] = {
+                "max_workers": executor._max_workers,
+                "threads": len(executor._threads),
+                "queued": executor._work_queue.qsize(),
+            }
+        return result
+
+    def shutdown(self, wait: bool = True, platform: Optional[str] = None):
+        """
+        关闭线程池
+
+        Args:
+            wait: 是否等待正在执行的任务完成
+            platform: 只关闭指定平台（默认全部）
+        """
+        with self._lock:
+            names = [platform] if platform else list(self._executors)
+            for name in names:
+                executor = self._executors.pop(name, None)
+                if executor is not None:
+                    executor.shutdown(wait=wait, cancel_futures=True)
+                    logger.info(f"Shut down {name} executor")
+
+
+# 全局执行器实例
+platform_executors = PlatformExecutors(
+    sizes={
+        "seek": settings.seek_executor_workers,
+        "indeed": settings.indeed_executor_workers,
+    },
+    default_size=settings.default_executor_workers,
+)
+
+
+async def run_blocking(platform: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    在平台专用线程池中运行阻塞调用（全局执行器的快捷方式）
+
+    Example:
+        >>> jobs = await run_blocking("seek", adapter.scrape, request)
+    """
+    return await platform_executors.run(platform, func, *args, **kwargs)
@@ -0,0 +1,82 @@
+"""
+共享 HTTP 客户端
+
+所有异步适配器共用一个长生命周期的 httpx.AsyncClient：
+1. 连接池 + keep-alive：避免每次请求重新进行 TCP / TLS 握手
+2. 连接数上限可配置（http_max_connections, http_max_keepalive_connections）
+3. 可选 HTTP/2（需要安装 h2，未安装时回退到 HTTP/1.1）
+"""
+
+from typing import Optional
+
+import httpx
+from loguru import logger
+
+from app.config.settings import settings
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def http2_available() -> bool:
+    """检查 HTTP/2 依赖（h2）是否已安装"""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def build_http_client(**overrides) -> httpx.AsyncClient:
+    """
+    按 Settings 创建带连接池的 AsyncClient
+
+    Args:
+        **overrides: 传给 httpx.AsyncClient 的额外参数（测试中用于注入 transport）
+
+    Returns:
+        httpx.AsyncClient: 新的客户端实例
+    """
+    use_http2 = settings.http2_enabled
+    if use_http2 and not http2_available():
+        logger.warning("HTTP/2 enabled but 'h2' is not installed. Falling back to HTTP/1.1.")
+        use_http2 = False
+
+    options = dict(
+        limits=httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(settings.http_timeout),
+        http2=use_http2,
+        headers={"User-Agent": settings.user_agent},
+    )
+    options.update(overrides)
+    return httpx.AsyncClient(**options)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    获取全局共享客户端（首次调用时创建，关闭后会重新创建）
+
+    Returns:
+        httpx.AsyncClient: 共享客户端
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = build_http_client()
+        logger.info(
+            f"Created shared HTTP client (max_connections={settings.http_max_connections}, "
+            f"keepalive={settings.http_max_keepalive_connections}, "
+            f"http2={settings.http2_enabled and http2_available()})"
+        )
+    return _client
+
+
+async def close_http_client():
+    """关闭全局共享客户端（应用关闭时调用）"""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+        logger.info("Closed shared HTTP client")
+    _client = None
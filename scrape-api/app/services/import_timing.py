@@ -0,0 +1,153 @@
+"""
+导入耗时报告
+
+容器按需缩容到零后，每次冷启动都要重新导入 app.main，导入越慢首个请求等待越久。
+本模块在新的子进程中用 `python -X importtime` 导入指定模块：
+1. 总耗时取子进程内 import 语句前后的墙钟时间（多次运行取最小值，减少抖动）
+2. 各模块的自身 / 累计耗时解析自 -X importtime 的输出，用于定位最慢的依赖
+3. 记录导入后已加载的模块，用于检查重量级依赖（JobSpy、pandas、BeautifulSoup 等）是否按需加载
+
+用法:
+    python -m app.services.import_timing [模块 ...]
+
+默认导入 app.main；总耗时超过 settings.import_time_budget_ms 时退出码为 1
+"""
+
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Sequence, Set
+
+# 项目根目录（子进程的工作目录，保证 app 包可导入）
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# 子进程执行的脚本：计时导入，然后在 stdout 输出耗时和已加载的模块
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+{imports}
+elapsed = time.perf_counter() - start
+print(elapsed * 1000)
+print(" ".join(sorted(sys.modules)))
+"""
+
+
+@dataclass
+class ImportRecord:
+    """-X importtime 输出中的一行"""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class ImportReport:
+    """一次导入测量的结果"""
+    modules: List[str]
+    total_ms: float
+    records: List[ImportRecord] = field(default_factory=list)
+    loaded: Set[str] = field(default_factory=set)
+
+    def slowest(self, limit: int = 15) -> List[ImportRecord]:
+        """自身耗时最长的模块"""
+        return sorted(self.records, key=lambda record: record.self_us, reverse=True)[:limit]
+
+    def render(self, limit: int = 15) -> str:
+        """
+        生成文本报告
+
+        Args:
+            limit: 列出的模块数
+
+        Returns:
+            str: 总耗时 + 自身耗时最长的模块
+        """
+        lines = [f"import {', '.join(self.modules)}: {self.total_ms:.0f}ms", ""]
+        lines.append(f"{'self ms':>9} {'cumul ms':>9}  module")
+        for record in self.slowest(limit):
+            lines.append(f"{record.self_us / 1000:>9.1f} {record.cumulative_us / 1000:>9.1f}  {record.module}")
+        return "\n".join(lines)
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """
+    解析 -X importtime 的 stderr 输出
+
+    Args:
+        output: stderr 文本（格式为 "import time: self [us] | cumulative | imported package"）
+
+    Returns:
+        List[ImportRecord]: 每个模块一条记录（按导入完成顺序）
+    """
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # 表头
+        name = parts[2].rstrip()
+        module = name.lstrip()
+        # 每层嵌套缩进两个空格（顶层模块前有一个空格）
+        depth = (len(name) - len(module) - 1) // 2
+        records.append(ImportRecord(module, int(parts[0]), int(parts[1]), depth))
+    return records
+
+
+def measure(modules: Sequence[str] = ("app.main",), runs: int = 3) -> ImportReport:
+    """
+    在新的子进程中测量导入耗时
+
+    Args:
+        modules: 要导入的模块
+        runs: 运行次数，返回总耗时最小的一次
+
+    Returns:
+        ImportReport: 测量结果
+
+    Raises:
+        RuntimeError: 子进程导入失败
+    """
+    script = _PROBE.format(imports="\n".join(f"import {module}" for module in modules))
+
+    best = None
+    for _ in range(max(runs, 1)):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", script],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+        )
+        if completed.returncode != 0:
+            raise RuntimeError(f"import {', '.join(modules)} failed:\n{completed.stderr[-2000:]}")
+
+        stdout = completed.stdout.strip().splitlines()
+        report = ImportReport(
+            modules=list(modules),
+            total_ms=float(stdout[-2]),
+            records=parse_importtime(completed.stderr),
+            loaded=set(stdout[-1].split()),
+        )
+        if best is None or report.total_ms < best.total_ms:
+            best = report
+    return best
+
+
+def main(argv: Sequence[str]) -> int:
+    """命令行入口：打印报告，超出预算时返回 1"""
+    from app.config.settings import settings
+
+    report = measure(list(argv) or ["app.main"])
+    print(report.render())
+    budget = settings.import_time_budget_ms
+    if report.total_ms > budget:
+        print(f"\nover budget: {report.total_ms:.0f}ms > {budget:.0f}ms")
+        return 1
+    print(f"\nwithin budget: {report.total_ms:.0f}ms <= {budget:.0f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,298 @@
+"""
+异步抓取任务队列
+
+深度抓取可能超过 .NET ScrapeApiClient 的 HTTP 超时，调用方改为提交任务后轮询：
+1. POST /jobs 立即返回任务 ID，任务进入有界队列
+2. 固定数量的 worker（job_workers）从队列取任务，通过批量调度器执行（共享并发上限）
+3. GET /jobs/{id} 返回状态、进度，完成后返回结果
+4. 完成的任务保留 job_result_ttl 秒，结果 JSON 只序列化一次，轮询几乎没有开销
+
+任务只保存在当前进程内存中（多 worker 部署时需要把轮询路由到同一进程）
+"""
+
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from app.config.settings import settings
+from app.models.job_posting_dto import (
+    BatchScrapeResponse,
+    BatchScrapeResult,
+    BatchScrapeSpec,
+    JobProgress,
+    JobStatusEnum,
+    JobStatusResponse,
+    ScrapeResponse,
+)
+from app.services.batch import batch_scheduler
+from app.services.serialization import dump_json
+
+# 任务类型
+KIND_SCRAPE = "scrape"
+KIND_BATCH = "batch"
+
+
+class JobQueueFullError(Exception):
+    """待执行任务数达到上限"""
+
+
+@dataclass
+class JobRecord:
+    """异步任务"""
+
+    job_id: str
+    kind: str
+    specs: List[BatchScrapeSpec]
+    status: JobStatusEnum = JobStatusEnum.QUEUED
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    completed: int = 0
+    failed: int = 0
+    jobs_found: int = 0
+    result: Optional[Any] = None  # ScrapeResponse / BatchScrapeResponse
+    error: Optional[str] = None
+    error_type: Optional[str] = None
+    expires_at: Optional[float] = None  # 单调时钟，完成后设置
+    response_json: Optional[bytes] = None  # 完成后缓存的状态响应
+
+    @property
+    def finished(self) -> bool:
+        """是否已完成（成功或失败）"""
+        return self.status in (JobStatusEnum.SUCCEEDED, JobStatusEnum.FAILED)
+
+    def on_result(self, result: BatchScrapeResult):
+        """单个抓取任务完成时更新进度"""
+        self.completed += 1
+        self.jobs_found += result.count
+        if result.error:
+            self.failed += 1
+
+    def to_response(self) -> JobStatusResponse:
+        """转换为状态响应"""
+        return JobStatusResponse(
+            job_id=self.job_id,
+            kind=self.kind,
+            status=self.status,
+            progress=JobProgress(
+                total=len(self.specs),
+                completed=self.completed,
+                failed=self.failed,
+                jobs_found=self.jobs_found,
+            ),
+            created_at=self.created_at,
+            started_at=self.started_at,
+            finished_at=self.finished_at,
+            result=self.result,
+            error=self.error,
+            error_type=self.error_type,
+        )
+
+    def response_bytes(self) -> bytes:
+        """
+        返回状态响应 JSON
+
+        完成后只序列化一次并缓存，之后的轮询直接返回缓存内容
+        """
+        if self.response_json is not None:
+            return self.response_json
+        body = dump_json(self.to_response())
+        if self.finished:
+            self.response_json = body
+            self.result = None  # 结果只保留序列化后的版本
+        return body
+
+
+class JobQueue:
+    """
+    进程内任务队列 + worker 池
+
+    worker 在首次提交时（或应用启动时）按当前事件循环创建
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        max_pending: int,
+        result_ttl: float,
+        clock=time.monotonic
+    ):
+        """
+        Args:
+            workers: 同时执行的任务数
+            max_pending: 排队 + 执行中的任务数上限
+            result_ttl: 完成的任务保留时间（秒）
+            clock: 单调时钟（测试中可替换）
+        """
+        self.workers = max(1, workers)
+        self.max_pending = max(1, max_pending)
+        self.result_ttl = result_ttl
+        self._clock = clock
+        self._jobs: Dict[str, JobRecord] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def start(self):
+        """在当前事件循环中启动 worker（已启动时不重复创建）"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._tasks:
+            return
+
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._tasks = [
+            asyncio.ensure_future(self._worker(number)) for number in range(self.workers)
+        ]
+        # 事件循环切换（测试）时，把尚未执行的任务重新入队
+        for record in self._jobs.values():
+            if record.status == JobStatusEnum.QUEUED:
+                self._queue.put_nowait(record.job_id)
+        logger.info(f"Job queue started with {self.workers} worker(s)")
+
+    async def stop(self):
+        """停止 worker（执行中的任务被取消并标记为失败）"""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._loop = None
+
+    def submit(self, specs: List[BatchScrapeSpec], kind: str) -> JobRecord:
+        """
+        提交任务
+
+        Args:
+            specs: 抓取任务列表（scrape 任务只有一项）
+            kind: 任务类型（scrape / batch）
+
+        Returns:
+            JobRecord: 新任务
+
+        Raises:
+            JobQueueFullError: 排队 + 执行中的任务数达到上限
+        """
+        self._purge()
+        if self.pending >= self.max_pending:
+            raise JobQueueFullError(f"Too many pending jobs ({self.pending}/{self.max_pending})")
+
+        self.start()
+        record = JobRecord(job_id=uuid.uuid4().hex, kind=kind, specs=list(specs))
+        self._jobs[record.job_id] = record
+        self._queue.put_nowait(record.job_id)
+        logger.info(f"Job {record.job_id} queued ({kind}, {len(specs)} spec(s))")
+        return record
+
+    def get(self, job_id: str) -> Optional[JobRecord]:
+        """
+        查询任务
+
+        Args:
+            job_id: 任务 ID
+
+        Returns:
+            JobRecord: 任务；不存在或已过期时返回 None
+        """
+        self._purge()
+        return self._jobs.get(job_id)
+
+    @property
+    def pending(self) -> int:
+        """排队 + 执行中的任务数"""
+        return sum(1 for record in self._jobs.values() if not record.finished)
+
+    def _purge(self):
+        """删除已过期的完成任务"""
+        now = self._clock()
+        expired = [
+            job_id for job_id, record in self._jobs.items()
+            if record.expires_at is not None and record.expires_at <= now
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    async def _worker(self, number: int):
+        """从队列取任务并执行"""
+        queue = self._queue
+        while True:
+            job_id = await queue.get()
+            try:
+                record = self._jobs.get(job_id)
+                if record is not None and record.status == JobStatusEnum.QUEUED:
+                    await self._run(record)
+            finally:
+                queue.task_done()
+
+    async def _run(self, record: JobRecord):
+        """执行单个任务"""
+        record.status = JobStatusEnum.RUNNING
+        record.started_at = datetime.utcnow()
+        logger.info(f"Job {record.job_id} started")
+
+        try:
+            response = await batch_scheduler.run(record.specs, on_result=record.on_result)
+            self._complete(record, response)
+        except asyncio.CancelledError:
+            self._fail(record, "Job cancelled (service shutting down)", "CancelledError")
+            raise
+        except Exception as e:
+            logger.error(f"Job {record.job_id} failed: {e}")
+            self._fail(record, str(e), type(e).__name__)
+
+    def _complete(self, record: JobRecord, response: BatchScrapeResponse):
+        """根据批量结果完成任务"""
+        if record.kind == KIND_SCRAPE:
+            spec_result = response.results[0]
+            if spec_result.error:
+                self._fail(record, spec_result.error, spec_result.error_type)
+                return
+            record.result = ScrapeResponse(
+                platform=spec_result.platform,
+                jobs=spec_result.jobs,
+                count=spec_result.count,
+                scraped_at=response.scraped_at,
+                truncated=spec_result.truncated,
+            )
+        else:
+            record.result = response
+
+        record.status = JobStatusEnum.SUCCEEDED
+        self._finish(record)
+
+    def _fail(self, record: JobRecord, error: str, error_type: Optional[str]):
+        """标记任务失败"""
+        record.status = JobStatusEnum.FAILED
+        record.error = error
+        record.error_type = error_type
+        self._finish(record)
+
+    def _finish(self, record: JobRecord):
+        """记录完成时间和过期时间"""
+        record.finished_at = datetime.utcnow()
+        record.expires_at = self._clock() + self.result_ttl
+        duration = (record.finished_at - (record.started_at or record.created_at)).total_seconds()
+        logger.info(f"Job {record.job_id} {record.status.value} in {duration:.1f}s")
+
+    def stats(self) -> Dict[str, Any]:
+        """返回队列统计"""
+        counts = {status.value: 0 for status in JobStatusEnum}
+        for record in self._jobs.values():
+            counts[record.status.value] += 1
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "jobs": counts,
+        }
+
+
+# 全局任务队列
+job_queue = JobQueue(
+    workers=settings.job_workers,
+    max_pending=settings.job_max_pending,
+    result_ttl=settings.job_result_ttl,
+)
@@ -0,0 +1,246 @@
+"""
+Prometheus 指标
+
+GET /metrics 以 Prometheus 文本格式导出，所有指标按 platform 标注：
+1. 请求：scrape_requests_total（按 endpoint、outcome）、scrape_request_duration_seconds
+2. 阶段耗时：上游请求、限流等待、响应解析校验、单个职位转换、去重、响应序列化
+3. 数据量：返回的职位数、去重移除数、转换失败数（按异常类型）、上游响应字节数
+4. 浪费：调用方断开后被丢弃的抓取已发出的上游请求数（scrape_wasted_upstream_calls_total）
+
+阶段耗时、上游请求数和字节数同时累加到当前请求的耗时分解（见 timings.py）
+
+多进程部署（uvicorn --workers）时设置 PROMETHEUS_MULTIPROC_DIR，/metrics 汇总所有 worker 的指标
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+from app.services import timings
+
+# 请求结果
+SUCCESS = "success"
+ERROR = "error"
+REJECTED = "rejected"  # 熔断快速失败
+CANCELLED = "cancelled"  # 调用方断开连接
+
+# 整个请求 / 上游请求：毫秒到分钟
+REQUEST_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+# 进程内阶段（转换、解析、序列化）：微秒到百毫秒
+STAGE_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25)
+
+REQUESTS = Counter(
+    "scrape_requests_total",
+    "Scrape requests by platform, endpoint and outcome",
+    ["platform", "endpoint", "outcome"],
+)
+REQUEST_SECONDS = Histogram(
+    "scrape_request_duration_seconds",
+    "End-to-end scrape request latency (including cache hits)",
+    ["platform", "endpoint"],
+    buckets=REQUEST_BUCKETS,
+)
+UPSTREAM_FETCH_SECONDS = Histogram(
+    "scrape_upstream_fetch_seconds",
+    "Latency of a single upstream call (SEEK page request or JobSpy call)",
+    ["platform"],
+    buckets=REQUEST_BUCKETS,
+)
+UPSTREAM_BYTES = Counter(
+    "scrape_upstream_bytes_total",
+    "Bytes received from upstream",
+    ["platform"],
+)
+RATE_LIMIT_WAIT_SECONDS = Histogram(
+    "scrape_rate_limit_wait_seconds",
+    "Time spent waiting for a rate limiter token",
+    ["platform"],
+    buckets=(0.0, 0.01, 0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0),
+)
+VALIDATION_SECONDS = Histogram(
+    "scrape_validation_seconds",
+    "Time spent parsing and validating an upstream payload",
+    ["platform"],
+    buckets=STAGE_BUCKETS,
+)
+TRANSFORM_SECONDS = Histogram(
+    "scrape_transform_seconds",
+    "Time spent transforming a single job into JobPostingDTO",
+    ["platform"],
+    buckets=STAGE_BUCKETS,
+)
+DEDUP_SECONDS = Histogram(
+    "scrape_dedup_seconds",
+    "Time spent deduplicating a page of jobs by source_id",
+    ["platform"],
+    buckets=STAGE_BUCKETS,
+)
+SERIALIZATION_SECONDS = Histogram(
+    "scrape_serialization_seconds",
+    "Time spent serializing a response body",
+    ["platform", "endpoint"],
+    buckets=STAGE_BUCKETS,
+)
+JOBS_RETURNED = Counter(
+    "scrape_jobs_returned_total",
+    "Jobs returned to clients",
+    ["platform", "endpoint"],
+)
+DUPLICATES_REMOVED = Counter(
+    "scrape_duplicates_removed_total",
+    "Jobs removed by source_id deduplication",
+    ["platform"],
+)
+TRANSFORM_FAILURES = Counter(
+    "scrape_transform_failures_total",
+    "Jobs skipped because the transform raised, by exception class",
+    ["platform", "exception"],
+)
+WASTED_UPSTREAM_CALLS = Counter(
+    "scrape_wasted_upstream_calls_total",
+    "Upstream calls whose results were discarded because every caller disconnected",
+    ["platform"],
+)
+
+# 同时计入请求耗时分解的阶段
+_REQUEST_STAGES = {
+    UPSTREAM_FETCH_SECONDS: "fetch",
+    VALIDATION_SECONDS: "parse",
+    DEDUP_SECONDS: "dedup",
+}
+
+
+def _platform(platform) -> str:
+    """平台标签（兼容 PlatformEnum）"""
+    return getattr(platform, "value", platform)
+
+
+@contextmanager
+def timed(histogram: Histogram, platform, **labels: str) -> Iterator[None]:
+    """
+    记录代码块耗时（异常时也记录）
+
+    Args:
+        histogram: 目标直方图
+        platform: 平台名称
+        **labels: 其他标签
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        histogram.labels(platform=_platform(platform), **labels).observe(seconds)
+        stage = _REQUEST_STAGES.get(histogram)
+        request_timings = timings.current()
+        if stage is not None and request_timings is not None:
+            # 抓取已被丢弃后才结束的上游请求（线程中的 JobSpy 调用、正在取消的分页请求）
+            if request_timings.add(stage, seconds) and stage == "fetch":
+                record_wasted_upstream(platform, 1)
+
+
+def record_transform(platform, seconds: float):
+    """记录单个职位的转换耗时"""
+    TRANSFORM_SECONDS.labels(platform=_platform(platform)).observe(seconds)
+    request_timings = timings.current()
+    if request_timings is not None:
+        request_timings.add("transform", seconds)
+
+
+def record_transform_failure(platform, error: BaseException):
+    """记录一次转换失败（按异常类型）"""
+    TRANSFORM_FAILURES.labels(platform=_platform(platform), exception=type(error).__name__).inc()
+
+
+def record_duplicates(platform, count: int):
+    """记录去重移除的职位数"""
+    if count > 0:
+        DUPLICATES_REMOVED.labels(platform=_platform(platform)).inc(count)
+
+
+def record_upstream_bytes(platform, size: int):
+    """记录上游响应字节数"""
+    UPSTREAM_BYTES.labels(platform=_platform(platform)).inc(size)
+    request_timings = timings.current()
+    if request_timings is not None:
+        request_timings.add_bytes(size)
+
+
+def record_wasted_upstream(platform, count: int):
+    """记录被丢弃的抓取已发出的上游请求数"""
+    if count > 0:
+        WASTED_UPSTREAM_CALLS.labels(platform=_platform(platform)).inc(count)
+
+
+def record_rate_limit_wait(platform, seconds: float):
+    """记录一次限流等待"""
+    RATE_LIMIT_WAIT_SECONDS.labels(platform=_platform(platform)).observe(seconds)
+    request_timings = timings.current()
+    if request_timings is not None:
+        request_timings.add_wait(seconds)
+
+
+class RequestTimer:
+    """
+    单个抓取请求的计时器
+
+    创建时开始计时，finish() 时记录请求数、耗时和返回的职位数（只记录一次）
+    """
+
+    def __init__(self, platform, endpoint: str):
+        """
+        Args:
+            platform: 平台名称
+            endpoint: 端点类型（scrape / stream / batch）
+        """
+        self.platform = _platform(platform)
+        self.endpoint = endpoint
+        self._start = time.perf_counter()
+        self._finished = False
+
+    def elapsed(self) -> float:
+        """从请求开始到现在的秒数"""
+        return time.perf_counter() - self._start
+
+    def finish(self, outcome: str, jobs: int = 0):
+        """
+        结束计时
+
+        Args:
+            outcome: 请求结果（success / error / rejected / cancelled）
+            jobs: 返回的职位数
+        """
+        if self._finished:
+            return
+        self._finished = True
+        REQUESTS.labels(platform=self.platform, endpoint=self.endpoint, outcome=outcome).inc()
+        REQUEST_SECONDS.labels(platform=self.platform, endpoint=self.endpoint).observe(
+            time.perf_counter() - self._start
+        )
+        if jobs:
+            JOBS_RETURNED.labels(platform=self.platform, endpoint=self.endpoint).inc(jobs)
+
+
+def render() -> Tuple[bytes, str]:
+    """
+    生成 Prometheus 文本格式的指标
+
+    Returns:
+        tuple: (指标内容, Content-Type)
+    """
+    registry = REGISTRY
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
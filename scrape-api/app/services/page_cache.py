@@ -0,0 +1,336 @@
+"""
+上游原始页面的磁盘缓存（SQLite）
+
+缓存 SEEK API 的原始 JSON 响应页和 Indeed（JobSpy）的原始结果，
+键为 (平台, 请求参数哈希, 页码)：
+1. 数据库文件放在挂载卷上，容器重启 / 重新部署后仍然有效
+2. WAL 模式 + busy_timeout，多个 uvicorn worker 进程可以共享同一个文件
+3. 按平台配置 TTL（墙钟时间，跨进程 / 重启一致），总大小超过上限时淘汰最久未访问的页
+
+命中的页的存放时间累加到当前请求的耗时分解（见 timings.py），scrape_service 据此报告
+cache_hit / cache_age_seconds；bypass() 内不读取缓存（结果缓存的后台刷新需要上游的新数据）
+
+缓存读写失败只记录日志，不影响抓取（退回到访问上游）
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Union
+
+from loguru import logger
+
+from app.config.settings import settings
+from app.services import timings
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    platform    TEXT    NOT NULL,
+    key         TEXT    NOT NULL,
+    page        INTEGER NOT NULL,
+    payload     BLOB    NOT NULL,
+    size        INTEGER NOT NULL,
+    stored_at   REAL    NOT NULL,
+    expires_at  REAL    NOT NULL,
+    accessed_at REAL    NOT NULL,
+    PRIMARY KEY (platform, key, page)
+);
+CREATE INDEX IF NOT EXISTS idx_pages_expires_at ON pages (expires_at);
+CREATE INDEX IF NOT EXISTS idx_pages_accessed_at ON pages (accessed_at);
+"""
+
+
+def params_key(params: Mapping[str, Any]) -> str:
+    """
+    生成请求参数的缓存键（与参数顺序无关）
+
+    Args:
+        params: 请求参数（不含页码）
+
+    Returns:
+        str: SHA-256 十六进制摘要
+    """
+    canonical = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class PageCache:
+    """
+    SQLite 页面缓存
+
+    每个线程（以及 fork 后的每个进程）使用独立的连接，可在事件循环和线程池中同时使用
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int,
+        ttls: Dict[str, float],
+        default_ttl: float = 300.0,
+        busy_timeout_ms: int = 5000,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Args:
+            path: 数据库文件路径（目录不存在时自动创建）
+            max_bytes: 所有页面的最大总字节数
+            ttls: 平台名称 → TTL（秒）
+            default_ttl: 未配置平台的 TTL（秒）
+            busy_timeout_ms: 其他进程持有写锁时的等待时间（毫秒）
+            clock: 墙钟（测试中可替换）
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttls = dict(ttls)
+        self.default_ttl = default_ttl
+        self.busy_timeout_ms = busy_timeout_ms
+        self._clock = clock
+        self._local = threading.local()
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+
+        # 进程内统计
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.errors = 0
+
+    def ttl_for(self, platform: str) -> float:
+        """返回平台的 TTL（秒）"""
+        return self.ttls.get(platform, self.default_ttl)
+
+    def _connect(self) -> sqlite3.Connection:
+        """获取当前线程的连接（fork 后重新连接）"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+        # isolation_level=None：自动提交，需要事务时显式 BEGIN
+        conn = sqlite3.connect(self.path, timeout=self.busy_timeout_ms / 1000, isolation_level=None)
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+
+        with self._schema_lock:
+            if not self._schema_ready:
+                conn.executescript(_SCHEMA)
+                self._schema_ready = True
+
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def get(self, platform: str, key: str, page: int = 1) -> Optional[bytes]:
+        """
+        读取缓存页
+
+        Args:
+            platform: 平台名称
+            key: 请求参数键（见 params_key()）
+            page: 页码
+
+        Returns:
+            bytes: 原始页面内容；未命中、已过期、读取失败或在 bypass() 内时返回 None
+        """
+        if _bypass.get():
+            return None
+
+        now = self._clock()
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT payload, stored_at, expires_at FROM pages WHERE platform = ? AND key = ? AND page = ?",
+                (platform, key, page),
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            payload, stored_at, expires_at = row
+            if expires_at <= now:
+                conn.execute(
+                    "DELETE FROM pages WHERE platform = ? AND key = ? AND page = ?",
+                    (platform, key, page),
+                )
+                self.misses += 1
+                return None
+
+            conn.execute(
+                "UPDATE pages SET accessed_at = ? WHERE platform = ? AND key = ? AND page = ?",
+                (now, platform, key, page),
+            )
+        except (sqlite3.Error, OSError) as e:
+            self.errors += 1
+            logger.warning(f"Page cache read failed ({platform} page {page}): {e}")
+            return None
+
+        self.hits += 1
+        request_timings = timings.current()
+        if request_timings is not None:
+            request_timings.add_page_cache_hit(max(0.0, now - stored_at))
+        return bytes(payload)
+
+    def set(self, platform: str, key: str, page: int, payload: Union[bytes, str]):
+        """
+        写入缓存页（总大小超过上限时淘汰过期页和最久未访问的页）
+
+        单页超过 max_bytes 或 TTL ≤ 0 时不缓存
+
+        Args:
+            platform: 平台名称
+            key: 请求参数键（见 params_key()）
+            page: 页码
+            payload: 原始页面内容
+        """
+        ttl = self.ttl_for(platform)
+        if ttl <= 0:
+            return
+
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+        size = len(payload)
+        if size > self.max_bytes:
+            return
+
+        now = self._clock()
+        try:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO pages "
+                    "(platform, key, page, payload, size, stored_at, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (platform, key, page, payload, size, now, now + ttl, now),
+                )
+                self._evict(conn, now)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        except (sqlite3.Error, OSError) as e:
+            self.errors += 1
+            logger.warning(f"Page cache write failed ({platform} page {page}): {e}")
+            return
+
+        self.writes += 1
+
+    def _evict(self, conn: sqlite3.Connection, now: float):
+        """删除过期页；仍超过上限时按 accessed_at 从旧到新删除（在调用方的事务中执行）"""
+        self.evictions += conn.execute("DELETE FROM pages WHERE expires_at <= ?", (now,)).rowcount
+
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = conn.execute("SELECT rowid, size FROM pages ORDER BY accessed_at").fetchall()
+        victims = []
+        for rowid, size in rows:
+            if total <= self.max_bytes:
+                break
+            victims.append((rowid,))
+            total -= size
+
+        conn.executemany("DELETE FROM pages WHERE rowid = ?", victims)
+        self.evictions += len(victims)
+
+    async def aget(self, platform: str, key: str, page: int = 1) -> Optional[bytes]:
+        """get() 的异步版本（在线程中执行，避免磁盘 I/O 阻塞事件循环）"""
+        return await asyncio.to_thread(self.get, platform, key, page)
+
+    async def aset(self, platform: str, key: str, page: int, payload: Union[bytes, str]):
+        """set() 的异步版本"""
+        await asyncio.to_thread(self.set, platform, key, page, payload)
+
+    def clear(self):
+        """清空缓存"""
+        try:
+            self._connect().execute("DELETE FROM pages")
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Page cache clear failed: {e}")
+
+    def close(self):
+        """关闭当前线程的连接"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def stats(self) -> Dict[str, Any]:
+        """返回缓存统计（条目数和字节数为所有进程共享的数据库总量）"""
+        result: Dict[str, Any] = {
+            "path": self.path,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "errors": self.errors,
+        }
+        try:
+            pages, size = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM pages"
+            ).fetchone()
+            result.update(pages=pages, bytes=size)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Page cache stats failed: {e}")
+        return result
+
+
+_bypass: ContextVar[bool] = ContextVar("page_cache_bypass", default=False)
+
+
+@contextmanager
+def bypass() -> Iterator[None]:
+    """在代码块内跳过页面缓存的读取（仍写入上游返回的新页面）"""
+    token = _bypass.set(True)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+_page_cache: Optional[PageCache] = None
+
+
+def get_page_cache() -> Optional[PageCache]:
+    """
+    获取全局页面缓存（首次调用时创建）
+
+    Returns:
+        PageCache: 全局页面缓存；page_cache_enabled=False 时返回 None
+    """
+    global _page_cache
+    if not settings.page_cache_enabled:
+        return None
+    if _page_cache is None:
+        _page_cache = PageCache(
+            path=settings.page_cache_path,
+            max_bytes=settings.page_cache_max_bytes,
+            ttls={
+                "seek": settings.seek_page_cache_ttl,
+                "indeed": settings.indeed_page_cache_ttl,
+            },
+            default_ttl=settings.default_page_cache_ttl,
+        )
+        logger.info(f"Page cache enabled at {settings.page_cache_path}")
+    return _page_cache
+
+
+def close_page_cache():
+    """关闭全局页面缓存（应用关闭时调用）"""
+    global _page_cache
+    if _page_cache is not None:
+        _page_cache.close()
+        _page_cache = None
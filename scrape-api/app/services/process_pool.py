@@ -0,0 +1,304 @@
+"""
+JobSpy / Indeed 进程池
+
+JobSpy + pandas 的抓取和 DataFrame 处理是 CPU 密集、受 GIL 限制的，且导入很慢：
+1. Indeed 抓取在独立的 worker 进程中执行，进程启动时导入一次 JobSpy 和 pandas
+2. 结果以 JSON records 字符串返回（与页面缓存格式一致），API 进程不接触 DataFrame
+3. 每个进程平均执行 indeed_process_max_jobs 次后整体更换进程池，回收 pandas 的内存增长
+4. 使用 spawn 启动方式，避免在多线程的 API 进程中 fork
+
+Python 3.10 的 ProcessPoolExecutor 没有 max_tasks_per_child，这里按"代"回收：
+达到 workers × max_jobs 次调用后新建进程池，旧进程池在执行中的任务完成后退出。
+调用超时时同样更换进程池，等这一代其他执行中的调用结束（最多 timeout 秒）后，
+终止仍未退出的 worker 进程（卡住的进程不会自行退出；提前终止会让同代的其他调用一起失败）
+"""
+
+import concurrent.futures
+import multiprocessing
+import os
+import threading
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from app.config.settings import settings
+from app.exceptions import ScraperException, ScraperTimeoutError
+from app.services import deadline
+
+
+def _init_indeed_worker():
+    """worker 进程初始化：提前导入 JobSpy 和 pandas"""
+    try:
+        import pandas  # noqa: F401
+        import jobspy  # noqa: F401
+    except ImportError as e:
+        # 不让初始化失败（否则整个进程池不可用），调用时再报错
+        logger.warning(f"[indeed worker {os.getpid()}] JobSpy unavailable: {e}")
+
+
+def worker_pid() -> int:
+    """返回 worker 进程 ID（用于预热和测试）"""
+    return os.getpid()
+
+
+def scrape_jobs_serialized(query: Dict[str, Any]) -> str:
+    """
+    在 worker 进程中调用 JobSpy，返回 JSON records
+
+    Args:
+        query: scrape_jobs() 参数
+
+    Returns:
+        str: DataFrame.to_json(orient="records", date_format="iso")
+
+    Raises:
+        RuntimeError: JobSpy 未安装
+    """
+    try:
+        from jobspy import scrape_jobs
+    except ImportError:
+        raise RuntimeError("JobSpy library is not installed. Please run: pip install python-jobspy")
+
+    df = scrape_jobs(**query)
+    return df.to_json(orient="records", date_format="iso")
+
+
+class ProcessPool:
+    """
+    可回收的进程池（线程安全，可在线程池中并发调用）
+    """
+
+    def __init__(
+        self,
+        name: str,
+        workers: int,
+        max_jobs_per_worker: int,
+        timeout: float,
+        initializer: Optional[Callable[[], None]] = None
+    ):
+        """
+        Args:
+            name: 名称（日志用）
+            workers: 进程数
+            max_jobs_per_worker: 每个进程平均执行多少次调用后回收（0 表示不回收）
+            timeout: 单次调用超时（秒）
+            initializer: 进程初始化函数（需可在子进程中导入）
+        """
+        self.name = name
+        self.workers = max(1, workers)
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.timeout = timeout
+        self._initializer = initializer
+        self._context = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        self._executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self._calls_in_generation = 0
+        # 各代进程池执行中的调用（超时时等它们结束后再终止进程）
+        self._in_flight: Dict[concurrent.futures.ProcessPoolExecutor, Set[concurrent.futures.Future]] = {}
+
+        self.generation = 0
+        self.calls = 0
+        self.failures = 0
+        self.recycles = 0
+
+    def _current(self) -> concurrent.futures.ProcessPoolExecutor:
+        """返回当前进程池，达到回收阈值时更换（调用方持有锁）"""
+        limit = self.workers * self.max_jobs_per_worker
+        if self._executor is not None and limit > 0 and self._calls_in_generation >= limit:
+            self._retire("recycle")
+
+        if self._executor is None:
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=self._context,
+                initializer=self._initializer,
+            )
+            self._calls_in_generation = 0
+            self.generation += 1
+        return self._executor
+
+    def _retire(self, reason: str):
+        """丢弃当前进程池（执行中的任务完成后进程退出，调用方持有锁）"""
+        if self._executor is None:
+            return
+        logger.info(f"Retiring {self.name} process pool generation {self.generation} ({reason})")
+        self._executor.shutdown(wait=False, cancel_futures=False)
+        self._executor = None
+        self.recycles += 1
+
+    def _abandon(self, executor: concurrent.futures.ProcessPoolExecutor, future: concurrent.futures.Future):
+        """
+        调用超时：更换进程池，在后台等这一代其他执行中的调用结束后终止剩余的 worker 进程
+
+        executor 已被其他调用更换时不影响当前进程池
+        """
+        with self._lock:
+            processes = list((getattr(executor, "_processes", None) or {}).values())
+            others = [f for f in self._in_flight.get(executor, ()) if f is not future and not f.done()]
+            if executor is self._executor:
+                self._retire("timeout")
+        # 不取消排队中的调用：它们的调用方仍在等待结果，由旧进程池中空闲的 worker 执行
+        executor.shutdown(wait=False, cancel_futures=False)
+        threading.Thread(
+            target=self._reap,
+            args=(processes, others),
+            name=f"{self.name}-pool-reaper",
+            daemon=True,
+        ).start()
+
+    def _reap(self, processes: List[Any], others: List[concurrent.futures.Future]):
+        """等其他调用结束（最多 timeout 秒，它们各自也有超时）后终止仍在运行的 worker 进程"""
+        if others:
+            concurrent.futures.wait(others, timeout=self.timeout)
+        self._terminate([process for process in processes if process.is_alive()])
+
+    def _terminate(self, processes: List[Any]):
+        """终止 worker 进程（先 SIGTERM，未退出时 SIGKILL）"""
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join(timeout=1)
+            if process.is_alive():
+                process.kill()
+                process.join(timeout=1)
+        if processes:
+            logger.warning(f"Terminated {len(processes)} stuck {self.name} worker process(es)")
+
+    def _submit(
+        self,
+        func: Callable[..., Any],
+        *args: Any
+    ) -> Tuple[concurrent.futures.ProcessPoolExecutor, concurrent.futures.Future]:
+        """提交调用，返回执行它的进程池和结果"""
+        with self._lock:
+            executor = self._current()
+            self._calls_in_generation += 1
+            self.calls += 1
+            future = executor.submit(func, *args)
+            self._prune_in_flight()
+            self._in_flight.setdefault(executor, set()).add(future)
+            return executor, future
+
+    def _prune_in_flight(self):
+        """移除已完成的调用和已没有执行中调用的旧进程池（调用方持有锁）"""
+        for executor, futures in list(self._in_flight.items()):
+            futures.difference_update([f for f in futures if f.done()])
+            if not futures and executor is not self._executor:
+                del self._in_flight[executor]
+
+    def submit(self, func: Callable[..., Any], *args: Any) -> concurrent.futures.Future:
+        """
+        提交调用
+
+        Args:
+            func: 模块级函数（需可在子进程中导入）
+            *args: 参数（需可 pickle）
+
+        Returns:
+            Future: 调用结果
+        """
+        return self._submit(func, *args)[1]
+
+    def call(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        在 worker 进程中执行并阻塞等待结果（只能在线程池中调用）
+
+        Args:
+            func: 模块级函数
+            *args: 参数
+
+        Returns:
+            func(*args) 的返回值
+
+        Raises:
+            ScraperTimeoutError: 超过 timeout
+            DeadlineExceededError: 请求的截止时间先到（worker 继续执行，结果丢弃）
+            ScraperException: 进程池异常退出
+        """
+        timeout = deadline.timeout(self.timeout, self.name)
+        executor, future = self._submit(func, *args)
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError as e:
+            # 截止时间先到：worker 没有卡住，不更换进程池
+            deadline.check(self.name)
+            self.failures += 1
+            future.cancel()
+            # 后续调用换到新的进程池，不排在卡住的进程后面；
+            # 单独终止某个 worker 会让同代的其他调用失败，卡住的进程等它们结束后再终止
+            self._abandon(executor, future)
+            raise ScraperTimeoutError(
+                message=f"{self.name} worker timed out after {timeout:g}s",
+                platform=self.name,
+                original_error=e
+            )
+        except BrokenProcessPool as e:
+            self.failures += 1
+            with self._lock:
+                self._retire("broken")
+            raise ScraperException(
+                message=f"{self.name} worker process died: {e}",
+                platform=self.name,
+                original_error=e
+            )
+
+    def warmup(self):
+        """启动所有 worker 进程（触发 initializer 中的导入）"""
+        futures = [self.submit(worker_pid) for _ in range(self.workers)]
+        pids = {future.result(timeout=self.timeout) for future in futures}
+        logger.info(f"{self.name} process pool warmed up: {len(pids)} worker(s)")
+
+    def shutdown(self, wait: bool = True):
+        """关闭进程池"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait, cancel_futures=True)
+                self._executor = None
+            self._in_flight.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """返回进程池统计"""
+        return {
+            "workers": self.workers,
+            "generation": self.generation,
+            "calls": self.calls,
+            "failures": self.failures,
+            "recycles": self.recycles,
+            "max_jobs_per_worker": self.max_jobs_per_worker,
+        }
+
+
+_indeed_pool: Optional[ProcessPool] = None
+_indeed_pool_lock = threading.Lock()
+
+
+def get_indeed_process_pool() -> Optional[ProcessPool]:
+    """
+    获取 Indeed 进程池（首次调用时创建）
+
+    Returns:
+        ProcessPool: Indeed 进程池；indeed_process_workers=0 时返回 None（在 API 进程内执行）
+    """
+    global _indeed_pool
+    if settings.indeed_process_workers <= 0:
+        return None
+    with _indeed_pool_lock:
+        if _indeed_pool is None:
+            _indeed_pool = ProcessPool(
+                name="indeed",
+                workers=settings.indeed_process_workers,
+                max_jobs_per_worker=settings.indeed_process_max_jobs,
+                timeout=settings.indeed_process_timeout,
+                initializer=_init_indeed_worker,
+            )
+        return _indeed_pool
+
+
+def shutdown_indeed_process_pool(wait: bool = True):
+    """关闭 Indeed 进程池（应用关闭时调用）"""
+    global _indeed_pool
+    with _indeed_pool_lock:
+        pool, _indeed_pool = _indeed_pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait)
@@ -0,0 +1,283 @@
+"""
+按需性能剖析
+
+管理员端点（/admin/profile）使用，在生产环境剖析真实请求，不需要离线复现：
+1. cprofile：确定性剖析，只记录事件循环线程（SEEK 的请求、解析和 _transform_job 都在事件循环中执行），
+   输出按 sort 排序的 pstats 文本，或原始 pstats 文件（可用 snakeviz 等工具打开）
+2. sample：后台线程按固定间隔采样所有线程的调用栈（包括 Indeed 的线程池），
+   输出按函数汇总的文本，或 collapsed stack 格式（flamegraph.pl / speedscope 可直接读取）
+
+剖析期间事件循环上的其他请求也会被记录；同一时间只允许一个剖析（Python 3.12+ 不允许多个 profiler 同时启用）。
+Indeed 进程池（INDEED_PROCESS_WORKERS > 0）中的 JobSpy 调用在 worker 进程中执行，不在剖析结果中
+"""
+
+import cProfile
+import io
+import marshal
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Optional, Tuple
+
+# 剖析模式和对应支持的输出格式
+MODE_CPROFILE = "cprofile"
+MODE_SAMPLE = "sample"
+FORMATS = {
+    MODE_CPROFILE: ("text", "pstats"),
+    MODE_SAMPLE: ("text", "collapsed"),
+}
+
+# 空闲线程的栈顶函数（等待任务 / IO 的线程不计入采样）
+_IDLE_FRAMES = {
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("queue.py", "get"),
+    ("selectors.py", "select"),
+    ("thread.py", "_worker"),  # concurrent.futures 线程池等待任务
+}
+
+TEXT_MEDIA_TYPE = "text/plain; charset=utf-8"
+PSTATS_MEDIA_TYPE = "application/octet-stream"
+
+_busy = threading.Lock()
+
+
+class ProfilerBusyError(Exception):
+    """已有剖析在进行中"""
+    pass
+
+
+def validate_options(mode: str, fmt: str, sort: str = "cumulative"):
+    """
+    校验剖析参数
+
+    Args:
+        mode: 剖析模式（cprofile / sample）
+        fmt: 输出格式（cprofile: text / pstats；sample: text / collapsed）
+        sort: cprofile 文本的排序字段（cumulative, tottime, ncalls 等）
+
+    Raises:
+        ValueError: 无效的模式、格式或排序字段
+    """
+    if mode not in FORMATS:
+        raise ValueError(f"Unsupported profile mode: {mode} (expected one of {', '.join(FORMATS)})")
+    if fmt not in FORMATS[mode]:
+        raise ValueError(f"Unsupported format for {mode}: {fmt} (expected one of {', '.join(FORMATS[mode])})")
+    if sort not in pstats.Stats.sort_arg_dict_default:
+        raise ValueError(f"Unsupported sort key: {sort}")
+
+
+def _frame_label(code) -> str:
+    """调用栈中的函数名（如 "_transform_job (seek_adapter.py:788)"）"""
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _is_idle(frame) -> bool:
+    """栈顶函数是否为等待中的空闲函数"""
+    code = frame.f_code
+    return (os.path.basename(code.co_filename), code.co_name) in _IDLE_FRAMES
+
+
+class SamplingProfiler:
+    """
+    采样剖析器
+
+    后台线程每 interval 秒读取一次所有线程的调用栈（sys._current_frames），
+    按 "线程名;外层函数;...;栈顶函数" 计数
+    """
+
+    def __init__(self, interval: float = 0.005):
+        """
+        Args:
+            interval: 采样间隔（秒）
+        """
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+        self._started = 0.0
+
+    def start(self) -> "SamplingProfiler":
+        """启动采样线程"""
+        self._stop.clear()
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """停止采样并等待采样线程退出"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.duration = time.perf_counter() - self._started
+
+    def __enter__(self) -> "SamplingProfiler":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.stop()
+        return False
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self.sample(exclude=own)
+
+    def sample(self, exclude: int = 0):
+        """
+        采样一次所有线程的调用栈
+
+        Args:
+            exclude: 不采样的线程 ID（采样线程自身）
+        """
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == exclude or _is_idle(frame):
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            stack.append(names.get(ident, f"thread-{ident}"))
+            self.stacks[";".join(reversed(stack))] += 1
+        self.samples += 1
+
+    def collapsed(self) -> str:
+        """
+        collapsed stack 格式（每行 "线程名;函数;...;函数 次数"，按次数降序）
+
+        Returns:
+            str: 可直接交给 flamegraph.pl / speedscope 的文本
+        """
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def text(self, limit: int = 40) -> str:
+        """
+        按函数汇总的文本报告
+
+        Args:
+            limit: 最多输出的函数数
+
+        Returns:
+            str: 每个函数的 self（栈顶）和 total（在栈中）采样数，按 total 降序
+        """
+        own: Counter = Counter()
+        total: Counter = Counter()
+        for stack, count in self.stacks.items():
+            frames = stack.split(";")[1:]
+            own[frames[-1]] += count
+            for label in set(frames):
+                total[label] += count
+
+        lines = [
+            f"{self.samples} samples, interval {self.interval * 1000:.1f} ms, duration {self.duration:.3f} s",
+            "",
+            f"{'self':>8} {'total':>8}  function",
+        ]
+        for label, count in total.most_common(limit):
+            lines.append(f"{own[label]:>8} {count:>8}  {label}")
+        return "\n".join(lines) + "\n"
+
+
+def cprofile_text(profile: cProfile.Profile, sort: str = "cumulative", limit: int = 40) -> str:
+    """
+    cProfile 结果的文本报告
+
+    Args:
+        profile: 已停止的 cProfile.Profile
+        sort: 排序字段（cumulative, tottime, ncalls 等，见 pstats.SortKey）
+        limit: 最多输出的函数数
+
+    Returns:
+        str: pstats 文本
+
+    Raises:
+        KeyError: 无效的排序字段
+    """
+    stream = io.StringIO()
+    pstats.Stats(profile, stream=stream).strip_dirs().sort_stats(sort).print_stats(limit)
+    return stream.getvalue()
+
+
+def cprofile_dump(profile: cProfile.Profile) -> bytes:
+    """
+    cProfile 结果的原始 pstats 文件内容（与 Profile.dump_stats 写入的文件一致）
+
+    Args:
+        profile: 已停止的 cProfile.Profile
+
+    Returns:
+        bytes: 可用 pstats.Stats / snakeviz 读取的内容
+    """
+    profile.create_stats()
+    return marshal.dumps(profile.stats)
+
+
+class ProfileSession:
+    """
+    一次剖析（上下文管理器：进入时占用剖析器并开始，退出时停止并释放）
+    """
+
+    def __init__(self, mode: str = MODE_CPROFILE, interval: float = 0.005):
+        """
+        Args:
+            mode: 剖析模式（cprofile / sample）
+            interval: 采样间隔（秒，仅 sample 模式）
+        """
+        self.mode = mode
+        self._profile: Optional[cProfile.Profile] = None
+        self._sampler: Optional[SamplingProfiler] = None
+        if mode == MODE_CPROFILE:
+            self._profile = cProfile.Profile()
+        else:
+            self._sampler = SamplingProfiler(interval)
+
+    def __enter__(self) -> "ProfileSession":
+        if not _busy.acquire(blocking=False):
+            raise ProfilerBusyError("Another profile is already running")
+        try:
+            if self._profile is not None:
+                self._profile.enable()
+            else:
+                self._sampler.start()
+        except BaseException:
+            _busy.release()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        try:
+            if self._profile is not None:
+                self._profile.disable()
+            else:
+                self._sampler.stop()
+        finally:
+            _busy.release()
+        return False
+
+    def render(self, fmt: str = "text", sort: str = "cumulative", limit: int = 40) -> Tuple[bytes, str]:
+        """
+        输出剖析结果
+
+        Args:
+            fmt: 输出格式（见 validate_options）
+            sort: cprofile 文本的排序字段
+            limit: 文本报告最多输出的函数数
+
+        Returns:
+            tuple: (内容, media type)
+        """
+        if self._profile is not None:
+            if fmt == "pstats":
+                return cprofile_dump(self._profile), PSTATS_MEDIA_TYPE
+            return cprofile_text(self._profile, sort, limit).encode("utf-8"), TEXT_MEDIA_TYPE
+        if fmt == "collapsed":
+            return self._sampler.collapsed().encode("utf-8"), TEXT_MEDIA_TYPE
+        return self._sampler.text(limit).encode("utf-8"), TEXT_MEDIA_TYPE
@@ -0,0 +1,312 @@
+"""
+按平台的令牌桶限流器
+
+所有适配器的上游 HTTP 调用都先从对应平台的令牌桶取令牌：
+1. 平均速率 = 1 / {platform}_request_delay（每秒请求数），突发上限 = {platform}_rate_limit_burst
+2. 异步调用方 await 等待，同步调用方（线程池中的 requests / JobSpy）阻塞等待
+3. 记录等待次数和等待时间，见 GET /stats 的 rate_limiter 和 GET /metrics
+4. 需要等待的时间超过请求剩余的时间预算时不等待，直接抛出 DeadlineExceededError
+
+令牌采用预约方式：取令牌时立即扣减（可为负），按欠额计算等待时间，
+临界区内没有 await，事件循环和线程池可以共用同一个令牌桶。
+等待中的预约被取消时归还令牌，排在它后面的预约提前 1/rate 秒并被唤醒。
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.config.settings import settings
+from app.exceptions import DeadlineExceededError
+from app.services import deadline, metrics
+
+
+class _Reservation:
+    """一次需要等待的预约"""
+
+    __slots__ = ("ready_at", "wake")
+
+    def __init__(self, ready_at: float):
+        # 可以发出请求的时间（前面的预约被取消时提前）
+        self.ready_at = ready_at
+        # 异步等待方的唤醒回调（ready_at 变化时调用，线程安全）
+        self.wake: Optional[Callable[[], None]] = None
+
+
+class TokenBucket:
+    """
+    令牌桶
+
+    统计：
+    - acquired: 取得令牌的次数
+    - throttled: 需要等待的次数
+    - total_wait_seconds / max_wait_seconds: 等待时间
+    """
+
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            rate: 每秒补充的令牌数（> 0）
+            burst: 桶容量（允许的突发请求数，至少为 1）
+            clock: 单调时钟（测试中可替换）
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+        # ready_at 变化时通知同步等待方
+        self._changed = threading.Condition(self._lock)
+        # 等待中的预约（按预约顺序）
+        self._waiting: List[_Reservation] = []
+
+        self.acquired = 0
+        self.throttled = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _refill(self, now: float):
+        """按经过的时间补充令牌（调用方持有锁）"""
+        elapsed = max(0.0, now - self._updated_at)
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    def _reserve(self) -> Tuple[float, _Reservation]:
+        """预约一个令牌，返回需要等待的秒数和预约"""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            reservation = _Reservation(now + wait)
+
+            self.acquired += 1
+            if wait > 0:
+                self.throttled += 1
+                self.total_wait_seconds += wait
+                self.max_wait_seconds = max(self.max_wait_seconds, wait)
+                self._waiting = [r for r in self._waiting if r.ready_at > now]
+                self._waiting.append(reservation)
+            return wait, reservation
+
+    def reserve(self) -> float:
+        """
+        预约一个令牌
+
+        Returns:
+            float: 需要等待的秒数（0 表示立即可用）
+        """
+        return self._reserve()[0]
+
+    def _cancel(self, reservation: _Reservation):
+        """取消预约：归还令牌，排在它后面的预约提前 1/rate 秒并唤醒等待方"""
+        with self._lock:
+            self._tokens = min(float(self.burst), self._tokens + 1)
+            if reservation not in self._waiting:
+                return
+            index = self._waiting.index(reservation)
+            later = self._waiting[index + 1:]
+            del self._waiting[index]
+            for other in later:
+                other.ready_at -= 1.0 / self.rate
+                if other.wake is not None:
+                    other.wake()
+            self._changed.notify_all()
+
+    async def acquire(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """
+        取得一个令牌（异步等待）
+
+        Args:
+            max_wait: 最多等待的秒数（需要等待更久时不占用令牌，返回 None）
+
+        Returns:
+            Optional[float]: 实际等待的秒数；超过 max_wait 时为 None
+        """
+        wait, reservation = self._reserve()
+        if wait <= 0:
+            return 0.0
+        if max_wait is not None and wait > max_wait:
+            self._cancel(reservation)
+            return None
+
+        started = reservation.ready_at - wait
+        loop = asyncio.get_running_loop()
+        woken = asyncio.Event()
+        reservation.wake = lambda: loop.call_soon_threadsafe(woken.set)
+        try:
+            while True:
+                remaining = reservation.ready_at - self._clock()
+                if remaining <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(woken.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+                woken.clear()
+        except asyncio.CancelledError:
+            self._cancel(reservation)
+            raise
+        return reservation.ready_at - started
+
+    def acquire_sync(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """
+        取得一个令牌（阻塞等待，只能在线程池中调用）
+
+        Args:
+            max_wait: 最多等待的秒数（需要等待更久时不占用令牌，返回 None）
+
+        Returns:
+            Optional[float]: 实际等待的秒数；超过 max_wait 时为 None
+        """
+        wait, reservation = self._reserve()
+        if wait <= 0:
+            return 0.0
+        if max_wait is not None and wait > max_wait:
+            self._cancel(reservation)
+            return None
+
+        started = reservation.ready_at - wait
+        with self._changed:
+            while True:
+                remaining = reservation.ready_at - self._clock()
+                if remaining <= 0:
+                    break
+                self._changed.wait(remaining)
+        return reservation.ready_at - started
+
+    def stats(self) -> Dict[str, Any]:
+        """返回限流统计"""
+        with self._lock:
+            self._refill(self._clock())
+            tokens = self._tokens
+        return {
+            "rate_per_second": round(self.rate, 4),
+            "burst": self.burst,
+            "tokens": round(tokens, 3),
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "total_wait_seconds": round(self.total_wait_seconds, 3),
+            "max_wait_seconds": round(self.max_wait_seconds, 3),
+        }
+
+
+class RateLimiters:
+    """
+    按平台管理令牌桶（首次使用时按配置创建）
+
+    {platform}_request_delay ≤ 0 的平台不限流
+    """
+
+    def __init__(self):
+        self._buckets: Dict[str, Optional[TokenBucket]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, platform: str) -> Optional[TokenBucket]:
+        """
+        获取平台的令牌桶
+
+        Args:
+            platform: 平台名称
+
+        Returns:
+            TokenBucket: 令牌桶；限流关闭或平台未配置速率时返回 None
+        """
+        if not settings.rate_limit_enabled:
+            return None
+
+        platform = getattr(platform, "value", platform)
+        with self._lock:
+            if platform not in self._buckets:
+                self._buckets[platform] = self._build(platform)
+            return self._buckets[platform]
+
+    @staticmethod
+    def _build(platform: str) -> Optional[TokenBucket]:
+        """按配置创建令牌桶"""
+        delay = getattr(settings, f"{platform}_request_delay", 0)
+        if not delay or delay <= 0:
+            return None
+        burst = getattr(settings, f"{platform}_rate_limit_burst", 1)
+        return TokenBucket(rate=1.0 / delay, burst=burst)
+
+    def reset(self):
+        """丢弃所有令牌桶（配置变更后重新创建）"""
+        with self._lock:
+            self._buckets.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """返回各平台的限流统计"""
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {
+            platform: bucket.stats()
+            for platform, bucket in buckets.items()
+            if bucket is not None
+        }
+
+
+# 全局限流器
+rate_limiters = RateLimiters()
+
+
+def _max_wait() -> Optional[float]:
+    """当前请求剩余的时间预算（未设置截止时间时为 None）"""
+    budget = deadline.current()
+    return None if budget is None else budget.remaining()
+
+
+def _wait_exceeds_deadline(platform: str):
+    """需要等待的时间超过剩余预算：记录截断并抛出 DeadlineExceededError"""
+    deadline.current().mark_exceeded()
+    raise DeadlineExceededError("Rate limit wait exceeds request deadline", platform=platform)
+
+
+async def throttle(platform: str) -> float:
+    """
+    异步等待平台的令牌（等待不超过请求剩余的时间预算）
+
+    Args:
+        platform: 平台名称
+
+    Returns:
+        float: 等待的秒数
+
+    Raises:
+        DeadlineExceededError: 需要等待的时间超过剩余预算（不占用令牌）
+    """
+    bucket = rate_limiters.get(platform)
+    if bucket is None:
+        return 0.0
+    waited = await bucket.acquire(max_wait=_max_wait())
+    if waited is None:
+        _wait_exceeds_deadline(platform)
+    metrics.record_rate_limit_wait(platform, waited)
+    return waited
+
+
+def throttle_sync(platform: str) -> float:
+    """
+    阻塞等待平台的令牌（同步适配器代码使用，等待不超过请求剩余的时间预算）
+
+    Args:
+        platform: 平台名称
+
+    Returns:
+        float: 等待的秒数
+
+    Raises:
+        DeadlineExceededError: 需要等待的时间超过剩余预算（不占用令牌）
+    """
+    bucket = rate_limiters.get(platform)
+    if bucket is None:
+        return 0.0
+    waited = bucket.acquire_sync(max_wait=_max_wait())
+    if waited is None:
+        _wait_exceeds_deadline(platform)
+    metrics.record_rate_limit_wait(platform, waited)
+    return waited
@@ -0,0 +1,213 @@
+"""
+抓取结果缓存（进程内 TTL + LRU）
+
+缓存转换后的职位列表，键为归一化的请求（scrape_service.request_key）：
+1. 按平台配置 TTL（seek_cache_ttl, indeed_cache_ttl）
+2. 同时按条目数和估算字节数淘汰最久未使用的条目
+3. 过期后的 stale 窗口内可返回旧数据，由调用方在后台刷新（stale-while-revalidate）
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Hashable, List, Optional
+
+from app.models.job_posting_dto import JobPostingDTO
+
+# 每个职位的固定开销估算（对象头、数值字段、时间戳等）
+_JOB_OVERHEAD_BYTES = 256
+
+
+def estimate_size(jobs: List[JobPostingDTO]) -> int:
+    """
+    估算职位列表占用的字节数
+
+    只累加字符串字段长度加固定开销，不做完整序列化（避免为了计费而多一次编码）
+
+    Args:
+        jobs: 职位列表
+
+    Returns:
+        int: 估算字节数
+    """
+    size = 0
+    for job in jobs:
+        size += _JOB_OVERHEAD_BYTES
+        for value in job.__dict__.values():
+            if isinstance(value, str):
+                size += len(value)
+    return size
+
+
+@dataclass
+class CacheEntry:
+    """缓存条目"""
+
+    jobs: List[JobPostingDTO]
+    platform: str
+    size: int
+    stored_at: float  # 单调时钟
+    scraped_at: datetime  # 抓取时的 UTC 时间
+
+
+@dataclass
+class CacheLookup:
+    """缓存查询结果"""
+
+    jobs: List[JobPostingDTO]
+    age: float  # 秒
+    stale: bool  # 是否已超过 TTL（处于 stale 窗口内）
+    scraped_at: datetime
+
+
+class ResultCache:
+    """
+    有界的 TTL / LRU 缓存
+
+    非线程安全：只在事件循环线程中访问
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        ttls: Dict[str, float],
+        default_ttl: float = 300.0,
+        stale_ttl: float = 0.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_entries: 最大条目数
+            max_bytes: 最大估算字节数
+            ttls: 平台名称 → TTL（秒）
+            default_ttl: 未配置平台的 TTL（秒）
+            stale_ttl: 过期后仍可返回旧数据的时间窗口（秒），0 表示禁用
+            clock: 单调时钟（测试中可替换）
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttls = dict(ttls)
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def ttl_for(self, platform: str) -> float:
+        """返回平台的 TTL（秒）"""
+        return self.ttls.get(platform, self.default_ttl)
+
+    def get(self, key: Hashable) -> Optional[CacheLookup]:
+        """
+        查询缓存
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            CacheLookup: 命中（新鲜或 stale）时返回；未命中或完全过期时返回 None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        age = self._clock() - entry.stored_at
+        ttl = self.ttl_for(entry.platform)
+
+        if age > ttl + self.stale_ttl:
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        stale = age > ttl
+        if stale:
+            self.stale_hits += 1
+        else:
+            self.hits += 1
+        self._entries.move_to_end(key)
+
+        return CacheLookup(jobs=list(entry.jobs), age=age, stale=stale, scraped_at=entry.scraped_at)
+
+    def set(
+        self,
+        key: Hashable,
+        platform: str,
+        jobs: List[JobPostingDTO],
+        scraped_at: Optional[datetime] = None,
+        age: float = 0.0
+    ):
+        """
+        写入缓存（超出上限时淘汰最久未使用的条目）
+
+        单个条目超过 max_bytes 时不缓存
+
+        Args:
+            key: 缓存键
+            platform: 平台名称（决定 TTL）
+            jobs: 职位列表
+            scraped_at: 抓取时间（默认当前 UTC 时间）
+            age: 数据写入时已有的存放时间（秒，如来自页面缓存），条目相应提前过期
+        """
+        if self.ttl_for(platform) <= 0:
+            return
+
+        size = estimate_size(jobs)
+        if size > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = CacheEntry(
+            jobs=list(jobs),
+            platform=platform,
+            size=size,
+            stored_at=self._clock() - age,
+            scraped_at=scraped_at or datetime.utcnow(),
+        )
+        self._bytes += size
+
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: Hashable):
+        """删除条目并更新字节计数"""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def clear(self):
+        """清空缓存"""
+        self._entries.clear()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """当前估算字节数"""
+        return self._bytes
+
+    def stats(self) -> dict:
+        """返回缓存统计"""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,259 @@
+"""
+上游调用重试（指数退避 + 抖动）
+
+在适配器的单次 HTTP 调用（SEEK 的一页）外层重试，代替 Hangfire 几分钟后重跑整个
+(trade, location) 任务：
+1. 按异常类别分别配置最大尝试次数：超时、网络错误、5xx、429
+2. 退避时间为 full jitter：uniform(0, min(max_delay, base_delay * 2^(n-1)))
+3. 429 带 retry_after 时至少等待 retry_after 秒
+4. 所有重试共享一个总时间预算，下一次等待会超出预算或请求的截止时间（见 deadline.py）时
+   直接放弃并抛出最后一个异常
+
+其他异常（4xx、数据格式错误等）不重试
+"""
+
+import asyncio
+import random
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from loguru import logger
+
+from app.config.settings import settings
+from app.exceptions import (
+    PlatformException,
+    RateLimitException,
+    ScraperNetworkError,
+    ScraperTimeoutError,
+)
+from app.services import deadline
+from app.services.cancellation import check_cancelled
+
+T = TypeVar("T")
+
+# 异常类别（同时是 settings.retry_{category}_attempts 的名称）
+TIMEOUT = "timeout"
+NETWORK = "network"
+SERVER_ERROR = "server_error"
+RATE_LIMIT = "rate_limit"
+
+
+def classify_retryable(error: BaseException) -> Optional[str]:
+    """
+    判断异常是否可重试
+
+    Args:
+        error: 上游调用抛出的异常
+
+    Returns:
+        str: 异常类别（timeout / network / server_error / rate_limit）；不可重试时返回 None
+    """
+    if isinstance(error, RateLimitException):
+        return RATE_LIMIT
+    if isinstance(error, ScraperTimeoutError):
+        return TIMEOUT
+    if isinstance(error, ScraperNetworkError):
+        return NETWORK
+    if isinstance(error, PlatformException) and error.status_code is not None and error.status_code >= 500:
+        return SERVER_ERROR
+    return None
+
+
+def parse_retry_after(value: Any) -> Optional[int]:
+    """
+    解析 Retry-After 响应头
+
+    Args:
+        value: 秒数（"120"）或 HTTP 日期（"Wed, 21 Oct 2015 07:28:00 GMT"）
+
+    Returns:
+        int: 等待秒数；无法解析时返回 None
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return max(0, int(value))
+    if not isinstance(value, str) or not value.strip():
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0, int((when - datetime.now(timezone.utc)).total_seconds()))
+
+
+class Retrier:
+    """
+    重试执行器
+
+    每次调用时读取 settings，统计在实例上按平台累计：
+    - retries: 重试次数（按异常类别）
+    - recovered: 重试后成功的调用数
+    - exhausted: 用尽次数或预算后仍失败的调用数
+    """
+
+    def __init__(
+        self,
+        rng: Callable[[], float] = random.random,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            rng: [0, 1) 随机数（测试中可替换）
+            clock: 单调时钟（测试中可替换）
+        """
+        self._rng = rng
+        self._clock = clock
+        self._retries: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._recovered: Dict[str, int] = defaultdict(int)
+        self._exhausted: Dict[str, int] = defaultdict(int)
+
+    def max_attempts(self, category: str) -> int:
+        """异常类别的最大尝试次数（含第一次）"""
+        return max(1, getattr(settings, f"retry_{category}_attempts", 1))
+
+    def backoff(self, attempt: int, error: BaseException) -> float:
+        """
+        计算第 attempt 次失败后的等待时间
+
+        Args:
+            attempt: 已失败的次数（从 1 开始）
+            error: 最近一次的异常
+
+        Returns:
+            float: 等待秒数
+        """
+        ceiling = min(settings.retry_max_delay, settings.retry_base_delay * (2 ** (attempt - 1)))
+        delay = self._rng() * ceiling
+
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after:
+            delay = max(delay, float(retry_after))
+        return delay
+
+    def _next_delay(self, platform: str, attempt: int, error: BaseException, started: float) -> Optional[float]:
+        """
+        决定是否重试
+
+        Returns:
+            float: 重试前的等待秒数；不重试时返回 None
+        """
+        category = classify_retryable(error)
+        if category is None:
+            return None
+
+        if attempt >= self.max_attempts(category):
+            self._exhausted[platform] += 1
+            return None
+
+        delay = self.backoff(attempt, error)
+        elapsed = self._clock() - started
+        if elapsed + delay > settings.retry_budget_seconds:
+            logger.warning(
+                f"[{platform}] Retry budget exhausted after {attempt} attempt(s) "
+                f"({elapsed:.1f}s elapsed, next wait {delay:.1f}s): {error}"
+            )
+            self._exhausted[platform] += 1
+            return None
+
+        request_deadline = deadline.current()
+        if request_deadline is not None and delay >= request_deadline.remaining():
+            logger.info(f"[{platform}] Not retrying: next wait {delay:.1f}s exceeds the request deadline: {error}")
+            return None
+
+        self._retries[platform][category] += 1
+        logger.info(f"[{platform}] Retrying in {delay:.2f}s after {category} (attempt {attempt}): {error}")
+        return delay
+
+    async def call(self, platform: str, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        执行异步调用，可重试的失败按策略重试
+
+        Args:
+            platform: 平台名称（统计用）
+            func: 无参协程工厂（每次尝试调用一次）
+
+        Returns:
+            func() 的返回值
+
+        Raises:
+            最后一次尝试的异常
+        """
+        if not settings.retry_enabled:
+            return await func()
+
+        started = self._clock()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                result = await func()
+            except Exception as e:
+                delay = self._next_delay(platform, attempt, e, started)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+
+            if attempt > 1:
+                self._recovered[platform] += 1
+            return result
+
+    def call_sync(self, platform: str, func: Callable[[], T]) -> T:
+        """
+        执行同步调用（阻塞等待，只能在线程池中调用），策略同 call()
+
+        Args:
+            platform: 平台名称（统计用）
+            func: 无参函数
+
+        Returns:
+            func() 的返回值
+
+        Raises:
+            最后一次尝试的异常
+        """
+        if not settings.retry_enabled:
+            return func()
+
+        started = self._clock()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                result = func()
+            except Exception as e:
+                delay = self._next_delay(platform, attempt, e, started)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                check_cancelled(platform)  # 等待期间调用方可能已断开，不再重试
+                continue
+
+            if attempt > 1:
+                self._recovered[platform] += 1
+            return result
+
+    def stats(self) -> Dict[str, Any]:
+        """返回各平台的重试统计"""
+        platforms = set(self._retries) | set(self._recovered) | set(self._exhausted)
+        return {
+            platform: {
+                "retries": dict(self._retries.get(platform, {})),
+                "recovered": self._recovered.get(platform, 0),
+                "exhausted": self._exhausted.get(platform, 0),
+            }
+            for platform in sorted(platforms)
+        }
+
+
+# 全局重试执行器
+retrier = Retrier()
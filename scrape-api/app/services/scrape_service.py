@@ -0,0 +1,270 @@
+"""
+抓取服务
+
+所有抓取端点（单平台、批量）的统一入口：根据平台选择适配器并执行异步抓取
+
+处理顺序：
+1. 结果缓存（TTL / LRU）：命中直接返回；stale 命中返回旧数据并在后台刷新
+2. single-flight：相同的并发请求（按 request_key 归一化）合并为一次上游抓取
+3. 适配器抓取，成功后写入缓存；所有调用方都断开时取消抓取，已发出的上游请求计为浪费
+
+带截止时间（X-Request-Deadline / deadline_ms）的请求可能返回截断的结果：
+不与其他请求合并，截断的结果不写入缓存
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Hashable, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from app.adapters.base_adapter import BaseJobAdapter, ScrapeStats
+from app.adapters.registry import adapter_registry
+from app.config.settings import settings
+from app.models.job_posting_dto import JobPostingDTO, ScrapeRequest
+from app.services import deadline, metrics, page_cache
+from app.services.result_cache import ResultCache
+from app.services.single_flight import SingleFlight
+from app.services.timings import RequestTimings, collect
+
+# 全局请求合并器
+scrape_flights = SingleFlight()
+
+# 全局结果缓存
+result_cache = ResultCache(
+    max_entries=settings.result_cache_max_entries,
+    max_bytes=settings.result_cache_max_bytes,
+    ttls={
+        "seek": settings.seek_cache_ttl,
+        "indeed": settings.indeed_cache_ttl,
+    },
+    default_ttl=settings.default_cache_ttl,
+    stale_ttl=settings.result_cache_stale_ttl,
+)
+
+# 正在后台刷新的缓存键（每个键同时最多一个刷新任务）
+_refreshing: Set[Hashable] = set()
+_background_tasks: Set[asyncio.Task] = set()
+
+
+@dataclass
+class ScrapeOutcome:
+    """抓取结果及其来源"""
+
+    jobs: List[JobPostingDTO]
+    cache_hit: bool = False
+    cache_age_seconds: Optional[float] = None
+    stale: bool = False
+    scraped_at: datetime = field(default_factory=datetime.utcnow)
+    timings: RequestTimings = field(default_factory=RequestTimings)  # 上游抓取的耗时分解（缓存命中时为空）
+    truncated: bool = False  # 截止时间用尽，只有部分结果
+
+
+def _normalize_text(value: Optional[str]) -> str:
+    """归一化文本参数：去除首尾空格、合并连续空白、忽略大小写"""
+    return " ".join((value or "").split()).casefold()
+
+
+def request_key(platform: str, request: ScrapeRequest) -> Tuple:
+    """
+    生成归一化的请求键（用于合并相同请求）
+
+    "Tiler " / "tiler" 和 "Adelaide" / "adelaide " 视为同一请求
+
+    Args:
+        platform: 平台名称
+        request: 爬取请求参数
+
+    Returns:
+        tuple: (platform, keywords, location, max_results, classification, job_type)
+    """
+    return (
+        getattr(platform, "value", platform),
+        _normalize_text(request.keywords),
+        _normalize_text(request.location),
+        request.max_results,
+        _normalize_text(request.classification),
+        _normalize_text(request.job_type),
+    )
+
+
+def get_adapter(platform: str) -> BaseJobAdapter:
+    """
+    获取平台适配器（来自全局注册表，进程内共享）
+
+    Args:
+        platform: 平台名称（seek, indeed）
+
+    Returns:
+        BaseJobAdapter: 对应平台的适配器
+
+    Raises:
+        ScraperConfigurationError: 不支持的平台
+    """
+    return adapter_registry.get(platform)
+
+
+async def fetch(platform: str, request: ScrapeRequest) -> ScrapeOutcome:
+    """
+    抓取指定平台的职位（带缓存信息）
+
+    - 缓存新鲜命中：直接返回
+    - 缓存 stale 命中：返回旧数据，后台刷新一次
+    - 未命中：相同的在途请求只执行一次上游抓取和转换，所有调用方共享结果
+    - 带截止时间：在预算内抓取，用尽时返回已有的结果（truncated）
+
+    Args:
+        platform: 平台名称
+        request: 爬取请求参数
+
+    Returns:
+        ScrapeOutcome: 职位列表（每个调用方得到独立的列表）和缓存信息
+    """
+    platform = getattr(platform, "value", platform)
+    key = request_key(platform, request)
+
+    if settings.result_cache_enabled:
+        cached = result_cache.get(key)
+        if cached is not None:
+            if cached.stale:
+                _schedule_refresh(platform, key, request)
+            return ScrapeOutcome(
+                jobs=cached.jobs,
+                cache_hit=True,
+                cache_age_seconds=round(cached.age, 3),
+                stale=cached.stale,
+                scraped_at=cached.scraped_at,
+            )
+
+    request_deadline = deadline.for_request(request.deadline_ms)
+    if request_deadline is not None:
+        with deadline.scope(request_deadline):
+            jobs, scraped_at, timings = await _fetch_and_store(platform, key, request)
+        if request_deadline.exceeded:
+            logger.info(f"{platform} scrape truncated by deadline: {len(jobs)} jobs")
+        return _fetched_outcome(jobs, scraped_at, timings, truncated=request_deadline.exceeded)
+
+    if not settings.coalesce_enabled:
+        jobs, scraped_at, timings = await _fetch_and_store(platform, key, request)
+        return _fetched_outcome(jobs, scraped_at, timings)
+
+    # 被合并的调用方共享同一次抓取的耗时分解
+    jobs, scraped_at, timings = await scrape_flights.do(key, lambda: _fetch_and_store(platform, key, request))
+    return _fetched_outcome(list(jobs), scraped_at, timings)
+
+
+def _fetched_outcome(
+    jobs: List[JobPostingDTO],
+    scraped_at: datetime,
+    timings: RequestTimings,
+    truncated: bool = False
+) -> ScrapeOutcome:
+    """适配器抓取的结果（有页面来自页面缓存时 cache_hit 为 True，cache_age_seconds 为最旧一页的存放时间）"""
+    page_cache_hit = timings.page_cache_hits > 0
+    return ScrapeOutcome(
+        jobs=jobs,
+        cache_hit=page_cache_hit,
+        cache_age_seconds=round(timings.page_cache_age, 3) if page_cache_hit else None,
+        scraped_at=scraped_at,
+        timings=timings,
+        truncated=truncated,
+    )
+
+
+async def scrape(platform: str, request: ScrapeRequest) -> List[JobPostingDTO]:
+    """
+    抓取指定平台的职位（只返回职位列表，见 fetch()）
+
+    Args:
+        platform: 平台名称
+        request: 爬取请求参数
+
+    Returns:
+        List[JobPostingDTO]: 标准化的职位列表
+    """
+    return (await fetch(platform, request)).jobs
+
+
+async def _fetch_and_store(
+    platform: str,
+    key: Hashable,
+    request: ScrapeRequest
+) -> Tuple[List[JobPostingDTO], datetime, RequestTimings]:
+    """调用适配器抓取，成功且未被截止时间截断时写入缓存（返回职位、抓取时间（与缓存条目一致）和耗时分解）"""
+    adapter = get_adapter(platform)
+    with collect() as timings:
+        try:
+            jobs = await adapter.scrape_async(request)
+        except asyncio.CancelledError:
+            wasted = timings.discard()
+            metrics.record_wasted_upstream(platform, wasted)
+            logger.info(f"Cancelled {platform} scrape after {wasted} upstream calls: all callers disconnected")
+            raise
+    # 来自页面缓存的数据按最旧一页的存放时间计算抓取时间和结果缓存的过期时间
+    age = timings.page_cache_age or 0.0
+    scraped_at = datetime.utcnow() - timedelta(seconds=age)
+    if settings.result_cache_enabled and not deadline.truncated():
+        result_cache.set(key, platform, jobs, scraped_at, age=age)
+    return jobs, scraped_at, timings
+
+
+def _schedule_refresh(platform: str, key: Hashable, request: ScrapeRequest):
+    """为 stale 条目安排一次后台刷新（同一个键同时只刷新一次）"""
+    if key in _refreshing:
+        return
+    _refreshing.add(key)
+
+    async def refresh():
+        deadline.detach()  # 后台刷新不受触发它的请求的截止时间限制
+        try:
+            # 刷新需要上游的新数据，不读取页面缓存（可能与 stale 条目同样旧）
+            with page_cache.bypass():
+                await scrape_flights.do(key, lambda: _fetch_and_store(platform, key, request))
+            logger.debug(f"Refreshed stale cache entry for {platform}: {request.keywords} @ {request.location}")
+        except Exception as e:
+            logger.warning(f"Background refresh failed for {platform}: {e}")
+        finally:
+            _refreshing.discard(key)
+
+    task = asyncio.ensure_future(refresh())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def iter_pages(
+    platform: str,
+    request: ScrapeRequest,
+    stats: Optional[ScrapeStats] = None
+) -> AsyncIterator[List[JobPostingDTO]]:
+    """
+    逐页抓取指定平台的职位（流式端点使用）
+
+    截止时间（当前截止时间和 deadline_ms 中较早的一个）在第一次取页时确定。
+    异步生成器的每一步可能在不同的任务中执行（第 1 页在端点中预取，之后由 StreamingResponse 读取），
+    因此每次取页时重新绑定截止时间，而不是在整个生成器外层绑定一次
+
+    Args:
+        platform: 平台名称
+        request: 爬取请求参数
+        stats: 统计信息（可选，抓取过程中填充；截止时间用尽时 truncated 为 True）
+
+    Yields:
+        List[JobPostingDTO]: 每页的职位
+    """
+    adapter = get_adapter(platform)
+    stats = stats if stats is not None else ScrapeStats()
+    request_deadline = deadline.for_request(request.deadline_ms)
+    pages = adapter.iter_pages(request, stats).__aiter__()
+    try:
+        while True:
+            with deadline.scope(request_deadline):
+                try:
+                    page = await pages.__anext__()
+                except StopAsyncIteration:
+                    break
+                finally:
+                    stats.truncated = deadline.truncated()
+            yield page
+    finally:
+        await pages.aclose()
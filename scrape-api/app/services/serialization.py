@@ -0,0 +1,47 @@
+"""
+响应序列化
+
+适配器返回的 JobPostingDTO 已经校验过，响应只需要编码一次：
+1. dump_json()：通过 pydantic-core 的序列化器直接生成 JSON bytes（Rust 实现，不经过 dict / str 中间结果）
+2. ModelJSONResponse：端点直接返回该响应时，FastAPI 跳过 response_model 的
+   "转 dict → 重新校验 → jsonable_encoder → json.dumps" 流程（response_model 只用于 OpenAPI 文档）
+3. 由已校验对象组装的响应模型使用 model_construct() 创建，不再逐个检查职位
+"""
+
+from typing import Any, Optional
+
+from fastapi.responses import Response
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+
+def dump_json(model: BaseModel, exclude: Optional[Any] = None) -> bytes:
+    """
+    把模型编码为 JSON bytes（与 model_dump_json() 的输出一致）
+
+    Args:
+        model: pydantic 模型
+        exclude: 排除的字段（同 model_dump_json 的 exclude）
+
+    Returns:
+        bytes: UTF-8 编码的 JSON
+    """
+    return model.__pydantic_serializer__.to_json(model, exclude=exclude)
+
+
+class ModelJSONResponse(Response):
+    """
+    直接编码 pydantic 模型的 JSON 响应
+
+    content 为模型时通过 dump_json() 编码；bytes 原样返回（已序列化的内容）；
+    其他值（dict / list 等）通过 pydantic-core 编码
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return dump_json(content)
+        if isinstance(content, bytes):
+            return content
+        return to_json(content)
@@ -0,0 +1,95 @@
+"""
+Single-flight 请求合并
+
+相同 key 的并发调用只执行一次，所有等待者共享同一个结果（或同一个异常）。
+用于合并同时到达的相同抓取请求（如 .NET /api/ingest/all 与 Hangfire 定时任务撞车），
+减少上游调用和重复转换。所有等待者都取消（调用方断开）时取消共享的调用。
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    按 key 合并在途调用
+
+    统计：
+    - hits: 加入已有在途调用的次数（被合并）
+    - misses: 发起新调用的次数
+    - cancelled: 所有等待者都取消而被取消的调用数
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self._waiters: Dict[asyncio.Future, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.cancelled = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        执行 func()，若相同 key 的调用正在进行则等待其结果
+
+        单个等待者被取消不会取消共享的调用（其他等待者仍需要结果）；最后一个等待者被取消时
+        取消共享的调用（结果已无人读取）
+
+        Args:
+            key: 合并键（需可哈希）
+            func: 无参协程工厂
+
+        Returns:
+            func() 的返回值
+        """
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            future = asyncio.ensure_future(func())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        return await self._wait(future)
+
+    async def _wait(self, future: asyncio.Future):
+        """作为一个等待者等待共享的调用"""
+        self._waiters[future] = self._waiters.get(future, 0) + 1
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if self._waiters[future] == 1 and not future.done():
+                self.cancelled += 1
+                future.cancel()
+            raise
+        finally:
+            remaining = self._waiters[future] - 1
+            if remaining:
+                self._waiters[future] = remaining
+            else:
+                del self._waiters[future]
+
+    def _forget(self, key: Hashable, future: asyncio.Future):
+        """调用完成后移除在途记录（只移除自己，避免误删同 key 的新调用）"""
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        # 所有等待者都已取消时，读取异常避免 "exception was never retrieved" 警告
+        if not future.cancelled():
+            future.exception()
+
+    @property
+    def in_flight(self) -> int:
+        """当前在途调用数"""
+        return len(self._in_flight)
+
+    def stats(self) -> Dict[str, Any]:
+        """返回合并统计"""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "cancelled": self.cancelled,
+            "in_flight": self.in_flight,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
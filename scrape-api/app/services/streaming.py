@@ -0,0 +1,92 @@
+"""
+NDJSON 流式输出
+
+每行一个职位 JSON，边抓取边输出（每页作为一块发送，压缩时每页 flush 一次）；
+最后一行为 {"trailer": {...}}，包含数量统计和错误。内存占用只与单页大小有关，与结果总数无关。
+"""
+
+import asyncio
+import time
+from typing import AsyncIterator, List, Optional
+
+from loguru import logger
+
+from app.adapters.base_adapter import ScrapeStats
+from app.models.job_posting_dto import JobPostingDTO, StreamTrailer
+from app.services import metrics
+from app.services.serialization import dump_json
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def ndjson_lines(
+    platform: str,
+    first_page: List[JobPostingDTO],
+    pages: AsyncIterator[List[JobPostingDTO]],
+    stats: ScrapeStats,
+    timer: Optional[metrics.RequestTimer] = None
+) -> AsyncIterator[bytes]:
+    """
+    将逐页的职位转换为 NDJSON 行
+
+    第 1 页由调用方预先获取（第 1 页失败时可以返回正常的 HTTP 错误），
+    之后的错误写入结尾行，不中断已发送的数据。
+
+    Args:
+        platform: 平台名称
+        first_page: 已获取的第 1 页职位
+        pages: 剩余页的异步迭代器
+        stats: 抓取统计（由适配器填充）
+        timer: 请求计时器（可选，输出结尾行时结束计时）
+
+    Yields:
+        bytes: 每页一块，每行一个 JSON 对象（以换行结尾）；最后一块为结尾行
+    """
+    count = 0
+    completed = True
+    serialize_seconds = 0.0
+
+    def lines(jobs: List[JobPostingDTO]) -> bytes:
+        nonlocal serialize_seconds
+        start = time.perf_counter()
+        data = b"".join(dump_json(job) + b"\n" for job in jobs)
+        serialize_seconds += time.perf_counter() - start
+        return data
+
+    try:
+        if first_page:
+            yield lines(first_page)
+            count += len(first_page)
+
+        async for page in pages:
+            if page:
+                yield lines(page)
+                count += len(page)
+    except asyncio.CancelledError:
+        # 调用方断开连接：StreamingResponse 取消输出，剩余页不再抓取
+        logger.info(f"{platform} stream cancelled after {count} jobs: client disconnected")
+        if timer is not None:
+            timer.finish(metrics.CANCELLED, count)
+        raise
+    except Exception as e:
+        logger.error(f"{platform} stream interrupted after {count} jobs: {e}")
+        stats.errors.append(str(e))
+        completed = False
+    finally:
+        await pages.aclose()
+
+    trailer = StreamTrailer(
+        platform=platform,
+        count=count,
+        pages=stats.pages,
+        transform_failures=stats.transform_failures,
+        duplicates_removed=stats.duplicates_removed,
+        errors=stats.errors,
+        completed=completed,
+        truncated=stats.truncated,
+    )
+    logger.info(f"Streamed {count} jobs from {platform} ({stats.pages} pages)")
+    metrics.SERIALIZATION_SECONDS.labels(platform=platform, endpoint="stream").observe(serialize_seconds)
+    if timer is not None:
+        timer.finish(metrics.SUCCESS if completed else metrics.ERROR, count)
+    yield b'{"trailer":' + dump_json(trailer) + b"}\n"
@@ -0,0 +1,150 @@
+"""
+单个请求的耗时分解
+
+/scrape/{platform} 响应的 Server-Timing 头和 ScrapeResponse.timings：
+1. 抓取开始时通过 collect() 把 RequestTimings 绑定到当前上下文（线程池调用会复制上下文）
+2. 适配器中的指标埋点（metrics.timed / record_*）同时累加到当前请求的 RequestTimings
+3. 端点序列化响应后补上 serialize 和 total，生成 Server-Timing
+
+各阶段为累计耗时：SEEK 并发抓取多页时 fetch 可能大于 total
+"""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+from app.models.job_posting_dto import ScrapeTimings
+
+# 耗时分解的阶段（Server-Timing 中的顺序）
+STAGES = ("fetch", "parse", "transform", "dedup", "serialize")
+
+
+class RequestTimings:
+    """
+    单个请求的各阶段累计耗时和上游请求统计（线程安全）
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.seconds: Dict[str, float] = dict.fromkeys(STAGES, 0.0)
+        self.upstream_requests = 0
+        self.upstream_bytes = 0
+        self.rate_limit_wait = 0.0
+        self.discarded = False
+        self.page_cache_hits = 0
+        self.page_cache_age: Optional[float] = None  # 命中的页中最旧一页的存放时间（秒）
+
+    def add(self, stage: str, seconds: float) -> bool:
+        """
+        累加阶段耗时（fetch 同时计为一次上游请求）
+
+        Returns:
+            bool: 结果是否已被丢弃（见 discard()）
+        """
+        with self._lock:
+            self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+            if stage == "fetch":
+                self.upstream_requests += 1
+            return self.discarded
+
+    def discard(self) -> int:
+        """
+        标记抓取结果已被丢弃（调用方断开，抓取被取消）
+
+        之后 add() 返回 True，由调用方把取消后才结束的上游请求另行计为浪费
+
+        Returns:
+            int: 此前已完成的上游请求数
+        """
+        with self._lock:
+            self.discarded = True
+            return self.upstream_requests
+
+    def add_bytes(self, size: int):
+        """累加上游响应字节数"""
+        with self._lock:
+            self.upstream_bytes += size
+
+    def add_wait(self, seconds: float):
+        """累加限流等待时间"""
+        with self._lock:
+            self.rate_limit_wait += seconds
+
+    def add_page_cache_hit(self, age: float):
+        """记录一次页面缓存命中（age 为该页的存放时间，秒）"""
+        with self._lock:
+            self.page_cache_hits += 1
+            self.page_cache_age = max(age, self.page_cache_age or 0.0)
+
+    def to_model(self, total_seconds: float, serialize_seconds: float = 0.0) -> ScrapeTimings:
+        """
+        转换为响应中的 timings 对象
+
+        被合并的请求共享同一个 RequestTimings，各自的序列化耗时通过参数传入，不写回共享对象
+
+        Args:
+            total_seconds: 请求总耗时（秒）
+            serialize_seconds: 本次响应的序列化耗时（秒）
+
+        Returns:
+            ScrapeTimings: 毫秒为单位的耗时分解
+        """
+        with self._lock:
+            seconds = dict(self.seconds)
+            seconds["serialize"] += serialize_seconds
+            return ScrapeTimings(
+                **{f"{stage}_ms": round(seconds[stage] * 1000, 3) for stage in STAGES},
+                rate_limit_wait_ms=round(self.rate_limit_wait * 1000, 3),
+                total_ms=round(total_seconds * 1000, 3),
+                upstream_requests=self.upstream_requests,
+                upstream_bytes=self.upstream_bytes,
+            )
+
+
+def server_timing(timings: ScrapeTimings, cache_hit: bool = False) -> str:
+    """
+    生成 Server-Timing 响应头
+
+    Args:
+        timings: 耗时分解
+        cache_hit: 是否来自结果缓存
+
+    Returns:
+        str: 如 'fetch;dur=812.4, parse;dur=3.1, ..., total;dur=840.2, upstream;desc="requests=2 bytes=51234"'
+    """
+    parts = [f"{stage};dur={getattr(timings, f'{stage}_ms'):.1f}" for stage in STAGES]
+    if timings.rate_limit_wait_ms:
+        parts.append(f"wait;dur={timings.rate_limit_wait_ms:.1f}")
+    parts.append(f"total;dur={timings.total_ms:.1f}")
+    parts.append(f'upstream;desc="requests={timings.upstream_requests} bytes={timings.upstream_bytes}"')
+    if cache_hit:
+        parts.append('cache;desc="hit"')
+    return ", ".join(parts)
+
+
+_current: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+@contextmanager
+def collect(timings: Optional[RequestTimings] = None) -> Iterator[RequestTimings]:
+    """
+    在代码块内把指标埋点累加到 timings
+
+    Args:
+        timings: 累加目标（默认新建）
+
+    Yields:
+        RequestTimings: 累加目标
+    """
+    timings = timings or RequestTimings()
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+def current() -> Optional[RequestTimings]:
+    """返回当前上下文的 RequestTimings（不在 collect() 内时为 None）"""
+    return _current.get()
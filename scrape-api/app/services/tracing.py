@@ -0,0 +1,362 @@
+"""
+轻量级链路追踪
+
+用于定位生产环境的长尾延迟，不需要挂调试器：
+1. 每个 HTTP 请求一个根 span（TraceMiddleware），按 trace_sample_rate 采样
+2. 调用方（.NET HttpClient）传入 W3C traceparent 时沿用其 trace id；
+   traceparent 标记为已采样时本请求也采样，.NET 可以强制追踪某次 ingest
+3. 子 span：适配器的上游 HTTP 调用，以及适配器调用 app/utils 规范化函数的位置
+   （app/utils 是纯解析函数，不依赖本模块）
+4. 采样的 span 以 JSON lines 写入按大小轮转的本地文件（后台线程写入，不阻塞事件循环），
+   字段名与 OTLP 一致（traceId / spanId / parentSpanId / startTimeUnixNano ...），方便转换导入
+
+未采样的请求只做一次 ContextVar 读取，span() 返回共享的空操作对象；
+所有响应带 X-Trace-Id 头，便于在 .NET 日志中关联
+"""
+
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import re
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Optional, Tuple
+
+from loguru import logger
+
+from app.config.settings import settings
+
+
+TRACE_ID_HEADER = "X-Trace-Id"
+
+_TRACEPARENT = re.compile(r"^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+_INVALID_TRACE_ID = "0" * 32
+_INVALID_SPAN_ID = "0" * 16
+
+
+def new_trace_id() -> str:
+    """生成 32 位十六进制 trace id"""
+    return os.urandom(16).hex()
+
+
+def new_span_id() -> str:
+    """生成 16 位十六进制 span id"""
+    return os.urandom(8).hex()
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[Tuple[str, str, bool]]:
+    """
+    解析 W3C traceparent 头
+
+    Args:
+        value: 头的值，如 "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+
+    Returns:
+        tuple: (trace_id, parent_span_id, sampled)；缺失或格式无效时返回 None
+    """
+    if not value:
+        return None
+    match = _TRACEPARENT.match(value.strip().lower())
+    if match is None:
+        return None
+    version, trace_id, parent_id, flags = match.groups()
+    if version == "ff" or trace_id == _INVALID_TRACE_ID or parent_id == _INVALID_SPAN_ID:
+        return None
+    return trace_id, parent_id, bool(int(flags, 16) & 0x01)
+
+
+class Trace:
+    """一次请求的追踪（所有 span 共享，限制 span 总数）"""
+
+    def __init__(self, trace_id: str, max_spans: int):
+        self.trace_id = trace_id
+        self.max_spans = max_spans
+        self.spans = 0
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> bool:
+        """占用一个 span 名额（超过上限时丢弃）"""
+        with self._lock:
+            if self.spans >= self.max_spans:
+                self.dropped += 1
+                return False
+            self.spans += 1
+            return True
+
+
+class Span:
+    """
+    已采样的 span（作为上下文管理器使用，退出时导出）
+    """
+
+    __slots__ = ("trace", "span_id", "parent_id", "name", "attributes", "error",
+                 "_start_ns", "_start", "_token")
+
+    def __init__(self, trace: Trace, name: str, parent_id: Optional[str], attributes: Dict[str, Any]):
+        self.trace = trace
+        self.span_id = new_span_id()
+        self.parent_id = parent_id
+        self.name = name
+        self.attributes = attributes
+        self.error: Optional[str] = None
+        self._start_ns = 0
+        self._start = 0.0
+        self._token = None
+
+    def set(self, **attributes: Any):
+        """添加属性"""
+        self.attributes.update(attributes)
+
+    def start(self, activate: bool = True) -> "Span":
+        """
+        开始计时
+
+        Args:
+            activate: 是否设为当前 span（end() 时恢复父 span，须在同一上下文中调用）
+        """
+        self._start_ns = time.time_ns()
+        self._start = time.perf_counter()
+        if activate:
+            self._token = _current.set(self)
+        return self
+
+    def end(self, error: Optional[BaseException] = None):
+        """结束计时、恢复父 span 并导出"""
+        duration = time.perf_counter() - self._start
+        if self._token is not None:
+            _current.reset(self._token)
+            self._token = None
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+        exporter.export({
+            "traceId": self.trace.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id,
+            "name": self.name,
+            "startTimeUnixNano": self._start_ns,
+            "endTimeUnixNano": self._start_ns + int(duration * 1e9),
+            "durationMs": round(duration * 1000, 3),
+            "attributes": self.attributes,
+            "status": "error" if self.error else "ok",
+            "error": self.error,
+        })
+
+    def __enter__(self) -> "Span":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.end(exc)
+        return False
+
+
+class _NoopSpan:
+    """未采样时的空操作 span（共享单例）"""
+
+    __slots__ = ()
+
+    def set(self, **attributes: Any):
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+_current: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    """当前 span（未采样时为 None）"""
+    return _current.get()
+
+
+def span(name: str, **attributes: Any):
+    """
+    创建当前 span 的子 span
+
+    Args:
+        name: span 名称（如 "seek.http"）
+        **attributes: 属性
+
+    Returns:
+        Span / NOOP_SPAN: 上下文管理器；不在已采样的请求内时返回空操作对象
+    """
+    parent = _current.get()
+    if parent is None or not parent.trace.reserve():
+        return NOOP_SPAN
+    return Span(parent.trace, name, parent.span_id, attributes)
+
+
+def start_trace(traceparent: Optional[str], name: str, **attributes: Any) -> Tuple[str, Optional[Span]]:
+    """
+    为新请求创建根 span
+
+    Args:
+        traceparent: 调用方的 traceparent 头（可选）
+        name: 根 span 名称
+        **attributes: 属性
+
+    Returns:
+        tuple: (trace_id, 根 span)；未采样时根 span 为 None
+    """
+    parent = parse_traceparent(traceparent)
+    if parent is not None:
+        trace_id, parent_id, sampled = parent
+    else:
+        trace_id, parent_id, sampled = new_trace_id(), None, False
+
+    if not sampled:
+        sampled = random.random() < settings.trace_sample_rate
+    if not sampled:
+        return trace_id, None
+
+    trace = Trace(trace_id, settings.trace_max_spans)
+    trace.reserve()
+    return trace_id, Span(trace, name, parent_id, attributes)
+
+
+class FileExporter:
+    """
+    JSON lines 文件导出器
+
+    首次导出时创建后台线程（QueueListener）和按大小轮转的文件，
+    调用方只把 span 放入队列，不做文件 IO
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._queue: Optional[queue.SimpleQueue] = None
+        self._listener: Optional[logging.handlers.QueueListener] = None
+        self._logger = logging.getLogger("app.tracing.export")
+        self._logger.propagate = False
+        self._logger.setLevel(logging.INFO)
+        self.exported = 0
+        self.failed = 0
+
+    def _start(self):
+        """创建文件处理器和后台写入线程（调用方持有锁）"""
+        directory = os.path.dirname(settings.trace_file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        handler = logging.handlers.RotatingFileHandler(
+            settings.trace_file_path,
+            maxBytes=settings.trace_file_max_bytes,
+            backupCount=settings.trace_file_backups,
+            encoding="utf-8",
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        self._queue = queue.SimpleQueue()
+        self._listener = logging.handlers.QueueListener(self._queue, handler)
+        self._listener.start()
+        self._logger.addHandler(logging.handlers.QueueHandler(self._queue))
+
+    def export(self, record: Dict[str, Any]):
+        """导出一个 span（文件不可写时丢弃，不影响请求）"""
+        if self._listener is None:
+            with self._lock:
+                if self._listener is None:
+                    try:
+                        self._start()
+                    except OSError as e:
+                        self.failed += 1
+                        logger.warning(f"Trace export disabled, cannot open {settings.trace_file_path}: {e}")
+                        return
+        self._logger.info(json.dumps(record, default=str, ensure_ascii=False))
+        self.exported += 1
+
+    def close(self):
+        """写完队列中的 span 并关闭文件"""
+        with self._lock:
+            if self._listener is None:
+                return
+            self._listener.stop()
+            for handler in list(self._listener.handlers):
+                handler.close()
+            for handler in list(self._logger.handlers):
+                self._logger.removeHandler(handler)
+            self._listener = None
+            self._queue = None
+
+
+# 全局导出器
+exporter = FileExporter()
+
+
+class TraceMiddleware:
+    """
+    ASGI 中间件：为每个 HTTP 请求创建根 span，响应头带 X-Trace-Id
+
+    根 span 在响应体发送完毕时结束（流式响应包含整个流）
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.tracing_enabled:
+            await self.app(scope, receive, send)
+            return
+
+        traceparent = None
+        for name, value in scope.get("headers", []):
+            if name == b"traceparent":
+                traceparent = value.decode("latin-1")
+                break
+
+        trace_id, root = start_trace(
+            traceparent,
+            f"{scope['method']} {scope['path']}",
+            **{"http.method": scope["method"], "http.target": scope["path"]}
+        )
+        trace_header = (TRACE_ID_HEADER.lower().encode(), trace_id.encode())
+
+        if root is None:
+            async def send_with_trace_id(message):
+                if message["type"] == "http.response.start":
+                    message.setdefault("headers", [])
+                    message["headers"] = list(message["headers"]) + [trace_header]
+                await send(message)
+
+            await self.app(scope, receive, send_with_trace_id)
+            return
+
+        finished = False
+
+        def finish(error: Optional[BaseException] = None):
+            nonlocal finished
+            if finished:
+                return
+            finished = True
+            route = scope.get("route")
+            if route is not None and getattr(route, "path", None):
+                root.name = f"{scope['method']} {route.path}"
+            root.end(error)
+
+        async def send_traced(message):
+            if message["type"] == "http.response.start":
+                root.set(**{"http.status_code": message["status"]})
+                message["headers"] = list(message.get("headers", [])) + [trace_header]
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                finish()
+
+        # 流式响应的 send 可能在其他任务（上下文）中调用，当前 span 由中间件自己设置和恢复
+        root.start(activate=False)
+        token = _current.set(root)
+        try:
+            await self.app(scope, receive, send_traced)
+        except BaseException as e:
+            finish(e)
+            raise
+        finally:
+            _current.reset(token)
+            finish()
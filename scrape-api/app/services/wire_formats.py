@@ -0,0 +1,206 @@
+"""
+抓取结果的线上格式
+
+/scrape/{platform} 按请求的 Accept 头协商响应格式，默认仍为 JSON：
+1. application/json：ScrapeResponse（见 serialization.py）
+2. application/vnd.apache.arrow.stream：Arrow IPC stream，一个 record batch，
+   列与 JobPostingDTO 字段一一对应（JOB_SCHEMA）；platform / count / scraped_at 等响应字段
+   写入 schema metadata（值为字符串）
+3. application/msgpack：与 JSON 结构相同的 MessagePack（datetime 为 ISO 8601 字符串）
+
+pyarrow / msgpack 为可选依赖，未安装时不参与协商（回退到 JSON）。
+timings 只在 JSON 中返回，耗时分解对所有格式都通过 Server-Timing 头提供
+"""
+
+import functools
+from typing import Dict, List, Optional, Tuple
+
+from app.models.job_posting_dto import JobPostingDTO, ScrapeResponse
+
+JSON_MEDIA_TYPE = "application/json"
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# 接受的别名 → 响应使用的 media type
+_ALIASES = {
+    "application/x-msgpack": MSGPACK_MEDIA_TYPE,
+    "application/vnd.msgpack": MSGPACK_MEDIA_TYPE,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def arrow_available() -> bool:
+    """检查 Arrow 依赖（pyarrow）是否已安装"""
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def msgpack_available() -> bool:
+    """检查 MessagePack 依赖（msgpack）是否已安装"""
+    try:
+        import msgpack  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def available_media_types() -> Tuple[str, ...]:
+    """可协商的 media type（JSON 在前，q 值相同时优先）"""
+    media_types = [JSON_MEDIA_TYPE]
+    if arrow_available():
+        media_types.append(ARROW_MEDIA_TYPE)
+    if msgpack_available():
+        media_types.append(MSGPACK_MEDIA_TYPE)
+    return tuple(media_types)
+
+
+def _parse_accept(header: str) -> Dict[str, float]:
+    """解析 Accept 头（media range → q 值，忽略 q 以外的参数）"""
+    preferences: Dict[str, float] = {}
+    for part in header.split(","):
+        media_range, _, params = part.partition(";")
+        media_range = media_range.strip().lower()
+        if not media_range:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        preferences[_ALIASES.get(media_range, media_range)] = quality
+    return preferences
+
+
+def negotiate(accept: Optional[str]) -> str:
+    """
+    根据 Accept 头选择响应格式
+
+    明确列出的类型优先于 type/* 和 */*；q 值相同时按 JSON、Arrow、MessagePack 的顺序。
+    Accept 为空、只包含不支持的类型或所需依赖未安装时返回 JSON
+
+    Args:
+        accept: Accept 头
+
+    Returns:
+        str: 响应的 media type
+    """
+    if not accept:
+        return JSON_MEDIA_TYPE
+    preferences = _parse_accept(accept)
+
+    best, best_rank = JSON_MEDIA_TYPE, (0.0, 0)
+    for media_type in available_media_types():
+        if media_type in preferences:
+            rank = (preferences[media_type], 2)
+        else:
+            wildcard = preferences.get(media_type.split("/")[0] + "/*", preferences.get("*/*"))
+            if wildcard is None:
+                continue
+            rank = (wildcard, 1)
+        if rank[0] > 0 and rank > best_rank:
+            best, best_rank = media_type, rank
+    return best
+
+
+@functools.lru_cache(maxsize=None)
+def job_schema():
+    """
+    与 JobPostingDTO 字段一一对应的 Arrow schema
+
+    Returns:
+        pyarrow.Schema: 时间为 UTC 微秒时间戳。带时区的 datetime（如 SEEK 的 posted_at）
+        换算为 UTC，naive datetime（utcnow 生成的 scraped_at）按 UTC 写入；读回时均带 UTC 时区
+    """
+    import pyarrow as pa
+
+    return pa.schema([
+        pa.field("source", pa.string(), nullable=False),
+        pa.field("source_id", pa.string(), nullable=False),
+        pa.field("title", pa.string(), nullable=False),
+        pa.field("company", pa.string(), nullable=False),
+        pa.field("location_state", pa.string()),
+        pa.field("location_suburb", pa.string()),
+        pa.field("trade", pa.string()),
+        pa.field("employment_type", pa.string()),
+        pa.field("pay_range_min", pa.float64()),
+        pa.field("pay_range_max", pa.float64()),
+        pa.field("description", pa.string()),
+        pa.field("requirements", pa.string()),
+        pa.field("tags", pa.list_(pa.string())),
+        pa.field("posted_at", pa.timestamp("us", tz="UTC")),
+        pa.field("scraped_at", pa.timestamp("us", tz="UTC"), nullable=False),
+        pa.field("job_url", pa.string()),
+        pa.field("is_remote", pa.bool_()),
+        pa.field("company_url", pa.string()),
+    ])
+
+
+def _response_metadata(response: ScrapeResponse) -> Dict[str, str]:
+    """响应字段（除 jobs / timings）→ Arrow schema metadata"""
+    return {
+        "platform": getattr(response.platform, "value", response.platform),
+        "count": str(response.count),
+        "scraped_at": response.scraped_at.isoformat(),
+        "cache_hit": "true" if response.cache_hit else "false",
+        "cache_age_seconds": "" if response.cache_age_seconds is None else str(response.cache_age_seconds),
+        "truncated": "true" if response.truncated else "false",
+    }
+
+
+def encode_arrow(response: ScrapeResponse) -> bytes:
+    """
+    把抓取响应编码为 Arrow IPC stream
+
+    Args:
+        response: 抓取响应
+
+    Returns:
+        bytes: 包含一个 record batch 的 IPC stream
+    """
+    import pyarrow as pa
+
+    schema = job_schema().with_metadata(_response_metadata(response))
+    jobs: List[JobPostingDTO] = response.jobs
+    columns = {name: [getattr(job, name) for job in jobs] for name in schema.names}
+    batch = pa.RecordBatch.from_pydict(columns, schema=schema)
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        writer.write_batch(batch)
+    return sink.getvalue().to_pybytes()
+
+
+def encode_msgpack(response: ScrapeResponse) -> bytes:
+    """
+    把抓取响应编码为 MessagePack（结构与 JSON 相同，不含 timings）
+
+    Args:
+        response: 抓取响应
+
+    Returns:
+        bytes: MessagePack map
+    """
+    import msgpack
+
+    return msgpack.packb(response.model_dump(mode="json", exclude={"timings"}), use_bin_type=True)
+
+
+def encode(response: ScrapeResponse, media_type: str) -> bytes:
+    """
+    按 media type 编码二进制格式（JSON 由调用方通过 dump_json 编码）
+
+    Raises:
+        ValueError: 不支持的 media type
+    """
+    if media_type == ARROW_MEDIA_TYPE:
+        return encode_arrow(response)
+    if media_type == MSGPACK_MEDIA_TYPE:
+        return encode_msgpack(response)
+    raise ValueError(f"Unsupported media type: {media_type}")
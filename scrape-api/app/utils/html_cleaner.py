@@ -5,7 +5,6 @@ HTML 清理工具
 """
 
 from typing import Optional
-from bs4 import BeautifulSoup
 import re
 
 
@@ -43,7 +42,9 @@ def clean_html(html_str: Optional[str]) -> Optional[str]:
     if not html_str:
         return ""
 
-    # 使用 BeautifulSoup 解析 HTML
+    # 使用 BeautifulSoup 解析 HTML（首次调用时才导入，不计入应用启动的导入耗时）
+    from bs4 import BeautifulSoup
+
     soup = BeautifulSoup(html_str, 'html.parser')
 
     # 移除 script 和 style 标签（包括其内容）
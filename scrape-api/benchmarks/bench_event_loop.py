@@ -0,0 +1,86 @@
+"""
+事件循环阻塞基准测试
+
+模拟慢速上游（每次抓取阻塞 SLOW_SECONDS 秒），并发发送 N 个 /scrape/indeed 请求，
+同时轮询 /health，对比两种执行模型：
+- inline:   在事件循环中直接调用同步适配器（旧行为）
+- executor: 放到平台线程池执行（当前行为）
+
+用法:
+    python benchmarks/bench_event_loop.py [并发数] [慢速秒数]
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+# 添加项目根目录到路径
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+
+import app.adapters.base_adapter as base_adapter_module
+import app.main as main_module
+from app.adapters.indeed_adapter import IndeedAdapter
+from app.services.executor import platform_executors
+
+CONCURRENCY = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+SLOW_SECONDS = float(sys.argv[2]) if len(sys.argv) > 2 else 0.5
+
+
+def slow_scrape(self, request):
+    """模拟阻塞的上游调用"""
+    time.sleep(SLOW_SECONDS)
+    return []
+
+
+async def run_inline(platform, func, *args, **kwargs):
+    """旧行为：直接在事件循环中调用"""
+    return func(*args, **kwargs)
+
+
+async def measure(label: str):
+    transport = httpx.ASGITransport(app=main_module.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        health_latencies = []
+        done = asyncio.Event()
+
+        async def poll_health():
+            while not done.is_set():
+                start = time.perf_counter()
+                await client.get("/health")
+                health_latencies.append(time.perf_counter() - start)
+                await asyncio.sleep(0.05)
+
+        poller = asyncio.create_task(poll_health())
+        start = time.perf_counter()
+        await asyncio.gather(*[
+            client.post("/scrape/indeed", json={"keywords": "plumber", "location": "Sydney"})
+            for _ in range(CONCURRENCY)
+        ])
+        elapsed = time.perf_counter() - start
+        done.set()
+        await poller
+
+    worst_health = max(health_latencies) if health_latencies else float("nan")
+    print(
+        f"{label:<10} {CONCURRENCY} requests in {elapsed:6.2f}s "
+        f"({CONCURRENCY / elapsed:6.2f} req/s), "
+        f"/health worst={worst_health * 1000:7.1f}ms samples={len(health_latencies)}"
+    )
+
+
+async def main():
+    print(f"concurrency={CONCURRENCY}, upstream latency={SLOW_SECONDS}s, "
+          f"indeed workers={platform_executors.size_of('indeed')}")
+    with patch.object(IndeedAdapter, "scrape", slow_scrape):
+        with patch.object(base_adapter_module, "run_blocking", run_inline):
+            await measure("inline")
+        await measure("executor")
+    platform_executors.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
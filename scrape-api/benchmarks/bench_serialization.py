@@ -0,0 +1,130 @@
+"""
+响应序列化基准测试
+
+构造 N 个带长描述的职位（模拟 Indeed），对比每个响应的 CPU 时间：
+- response_model: 端点返回 ScrapeResponse，由 FastAPI 转 dict、按 response_model 重新校验、
+  再转为 JSON 兼容的 dict 后 json.dumps 编码（旧行为，/scrape/batch 和 /jobs 之前的路径）
+- model_dump_json: 端点自己 model_dump_json().encode()（中间生成 str）
+- fast: ScrapeResponse.model_construct + ModelJSONResponse（当前行为，pydantic-core 直接生成 bytes）
+
+每种方式都通过 ASGI 调用完整的 FastAPI 路由，另外单独列出纯编码耗时
+（jsonable_encoder 为未声明 response_model 时 FastAPI 的默认编码）。
+
+用法:
+    python benchmarks/bench_serialization.py [职位数] [请求数]
+"""
+
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# 添加项目根目录到路径
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+
+from app.models.job_posting_dto import JobPostingDTO, PlatformEnum, ScrapeResponse
+from app.services.serialization import ModelJSONResponse, dump_json
+
+JOBS = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+REQUESTS = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+DESCRIPTION = (
+    "We are looking for an experienced tradesperson to join our growing team. "
+    "Responsibilities include on-site installation, quoting, and client liaison. "
+) * 25  # 约 4 KB，接近 Indeed 的 Markdown 描述
+
+
+def make_jobs(count: int):
+    """构造已校验的职位（与适配器输出一致）"""
+    return [
+        JobPostingDTO(
+            source=PlatformEnum.INDEED,
+            source_id=f"job-{i}",
+            title=f"Senior Tiler {i}",
+            company="Premier Tiling Services",
+            location_state="SA",
+            location_suburb="Adelaide",
+            trade="tiler",
+            employment_type="Full Time",
+            pay_range_min=70000.0,
+            pay_range_max=90000.0,
+            description=DESCRIPTION,
+            tags=["tiling", "construction"],
+            posted_at=datetime(2025, 12, 1),
+            job_url=f"https://au.indeed.com/viewjob?jk={i}",
+        )
+        for i in range(count)
+    ]
+
+
+def build_app(jobs) -> FastAPI:
+    bench_app = FastAPI()
+
+    @bench_app.get("/response_model", response_model=ScrapeResponse)
+    async def response_model():
+        return ScrapeResponse(platform=PlatformEnum.INDEED, jobs=jobs, count=len(jobs))
+
+    @bench_app.get("/model_dump_json")
+    async def model_dump_json():
+        response = ScrapeResponse(platform=PlatformEnum.INDEED, jobs=jobs, count=len(jobs))
+        return Response(content=response.model_dump_json().encode("utf-8"), media_type="application/json")
+
+    @bench_app.get("/fast", response_model=ScrapeResponse, response_class=ModelJSONResponse)
+    async def fast():
+        return ModelJSONResponse(ScrapeResponse.model_construct(
+            platform=PlatformEnum.INDEED, jobs=jobs, count=len(jobs), scraped_at=datetime.utcnow()
+        ))
+
+    return bench_app
+
+
+async def measure_endpoints(bench_app: FastAPI):
+    transport = httpx.ASGITransport(app=bench_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        baseline = None
+        for path in ("/response_model", "/model_dump_json", "/fast"):
+            response = await client.get(path)  # 预热
+            size = len(response.content)
+            start = time.process_time()
+            for _ in range(REQUESTS):
+                await client.get(path)
+            per_response = (time.process_time() - start) / REQUESTS * 1000
+            baseline = baseline or per_response
+            print(
+                f"{path:<18} {per_response:8.2f} ms CPU/response "
+                f"({baseline / per_response:5.2f}x)  {size / 1024:8.1f} KB"
+            )
+
+
+def measure_encoders(jobs):
+    response = ScrapeResponse(platform=PlatformEnum.INDEED, jobs=jobs, count=len(jobs))
+    encoders = {
+        "jsonable_encoder": lambda: json.dumps(jsonable_encoder(response)).encode("utf-8"),
+        "model_dump_json": lambda: response.model_dump_json().encode("utf-8"),
+        "dump_json": lambda: dump_json(response),
+    }
+    for label, encode in encoders.items():
+        start = time.process_time()
+        for _ in range(REQUESTS):
+            encode()
+        print(f"{label:<18} {(time.process_time() - start) / REQUESTS * 1000:8.2f} ms CPU/encode")
+
+
+def main():
+    jobs = make_jobs(JOBS)
+    print(f"jobs={JOBS}, requests={REQUESTS}")
+    print("-- full endpoint (ASGI) --")
+    asyncio.run(measure_endpoints(build_app(jobs)))
+    print("-- encode only --")
+    measure_encoders(jobs)
+
+
+if __name__ == "__main__":
+    main()
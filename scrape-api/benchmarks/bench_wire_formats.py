@@ -0,0 +1,109 @@
+"""
+响应格式基准测试
+
+对 50 / 200 / 2000 个职位比较各格式的编码耗时和响应大小，分别使用带约 5 KB 描述的职位（Indeed）
+和不带描述的职位（SEEK 搜索结果）：
+- json:     dump_json（当前默认格式）
+- columnar: columnar.encode_columnar（?format=columnar）
+- msgpack:  wire_formats.encode_msgpack
+- arrow:    wire_formats.encode_arrow（Arrow IPC stream）
+
+另外列出 gzip 压缩后的大小（对应 Accept-Encoding: gzip 时的传输量）。
+pyarrow / msgpack 未安装时跳过对应格式。
+
+用法:
+    python benchmarks/bench_wire_formats.py [重复次数]
+"""
+
+import gzip
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 添加项目根目录到路径
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.models.job_posting_dto import JobPostingDTO, PlatformEnum, ScrapeResponse
+from app.services import wire_formats
+from app.services.columnar import encode_columnar
+from app.services.serialization import dump_json
+
+REPEAT = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+SIZES = (50, 200, 2000)
+
+STATES = ("NSW", "VIC", "QLD", "SA", "WA")
+SUBURBS = ("Sydney", "Melbourne", "Brisbane", "Adelaide", "Perth", "Parramatta", "Geelong")
+TRADES = ("tiler", "plumber", "electrician", "carpenter", None)
+COMPANIES = ("Premier Tiling Services", "Pipe Co", "Spark Electrical", "BuildRight", "Hays")
+WORDS = (
+    "experienced tradesperson team install quote client site safety licence residential commercial "
+    "project schedule materials tools vehicle overtime apprentice supervise renovation compliance "
+    "bathroom kitchen roof wiring drainage framing tiling waterproofing maintenance customer"
+).split()
+
+
+def make_response(count: int, descriptions: bool = True) -> ScrapeResponse:
+    """构造已校验的抓取响应（字段取值分布接近真实数据）"""
+    now = datetime(2025, 12, 2, 8, 0)
+    rng = random.Random(count)
+    jobs = [
+        JobPostingDTO(
+            source=PlatformEnum.INDEED,
+            source_id=f"in-{i:08x}",
+            title=f"Senior {TRADES[i % 4].title()} {i}",
+            company=COMPANIES[i % len(COMPANIES)],
+            location_state=STATES[i % len(STATES)],
+            location_suburb=SUBURBS[i % len(SUBURBS)],
+            trade=TRADES[i % len(TRADES)],
+            employment_type="Full Time" if i % 3 else "Contract",
+            pay_range_min=60000.0 + (i % 10) * 1000 if i % 2 else None,
+            pay_range_max=80000.0 + (i % 10) * 1000 if i % 2 else None,
+            description=" ".join(rng.choices(WORDS, k=600)) if descriptions else None,  # 约 5 KB
+            tags=[],
+            posted_at=now - timedelta(hours=i),
+            scraped_at=now,
+            job_url=f"https://au.indeed.com/viewjob?jk={i:016x}",
+        )
+        for i in range(count)
+    ]
+    return ScrapeResponse(platform=PlatformEnum.INDEED, jobs=jobs, count=len(jobs), scraped_at=now)
+
+
+def encoders():
+    formats = {
+        "json": lambda response: dump_json(response, exclude={"timings"}),
+        "columnar": encode_columnar,
+    }
+    if wire_formats.msgpack_available():
+        formats["msgpack"] = wire_formats.encode_msgpack
+    else:
+        print("msgpack not installed, skipping")
+    if wire_formats.arrow_available():
+        formats["arrow"] = wire_formats.encode_arrow
+    else:
+        print("pyarrow not installed, skipping")
+    return formats
+
+
+def main():
+    formats = encoders()
+    print(f"repeat={REPEAT}")
+    for descriptions in (True, False):
+        print(f"-- {'with' if descriptions else 'without'} descriptions --")
+        print(f"{'jobs':>6} {'format':<9} {'encode ms':>10} {'size KB':>10} {'gzip KB':>10}")
+        for count in SIZES:
+            response = make_response(count, descriptions)
+            for label, encode in formats.items():
+                encode(response)  # 预热（Arrow schema 等）
+                start = time.perf_counter()
+                for _ in range(REPEAT):
+                    body = encode(response)
+                elapsed = (time.perf_counter() - start) / REPEAT * 1000
+                compressed = len(gzip.compress(body, compresslevel=5))
+                print(f"{count:>6} {label:<9} {elapsed:>10.2f} {len(body) / 1024:>10.1f} {compressed / 1024:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
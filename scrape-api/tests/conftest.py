@@ -0,0 +1,105 @@
+"""
+测试公共配置
+
+进程级的共享状态（结果缓存等）在每个测试前清空，避免测试之间互相影响；
+磁盘页面缓存、限流、重试、Indeed 进程池和链路追踪默认关闭，需要的测试使用独立的实例。
+另外提供共用的测试替身：可手动推进的时钟（clock）和替换 get_adapter 的适配器（fake_adapter）
+"""
+
+import asyncio
+
+import pytest
+
+from app.config.settings import settings
+from app.models.job_posting_dto import JobPostingDTO
+from app.services import scrape_service
+from app.services.circuit_breaker import circuit_breakers
+
+
+class FakeClock:
+    """可手动推进的时钟"""
+
+    def __init__(self, start: float = 0.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+
+class FakeAdapter:
+    """按关键词返回职位或失败的适配器（记录调用次数）"""
+
+    def __init__(self, delay: float = 0.0, count: int = 2):
+        self.delay = delay
+        self.count = count
+        self.calls = 0
+
+    async def scrape_async(self, request):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if request.keywords == "broken":
+            raise RuntimeError("upstream failed")
+        return [
+            JobPostingDTO(source="seek", source_id=f"{request.keywords}-{i}", title=request.keywords, company="ABC")
+            for i in range(self.count)
+        ]
+
+
+@pytest.fixture
+def clock_start():
+    """clock 的起始时间（需要墙钟的测试模块覆盖该 fixture）"""
+    return 0.0
+
+
+@pytest.fixture
+def clock(clock_start):
+    """可手动推进的时钟（clock.now += 秒数）"""
+    return FakeClock(clock_start)
+
+
+@pytest.fixture
+def fake_adapter(monkeypatch):
+    """替换 scrape_service.get_adapter，所有平台返回同一个 FakeAdapter"""
+    adapter = FakeAdapter()
+    monkeypatch.setattr(scrape_service, "get_adapter", lambda platform: adapter)
+    return adapter
+
+
+@pytest.fixture(autouse=True)
+def reset_scrape_state():
+    """清空结果缓存和熔断器状态"""
+    scrape_service.result_cache.clear()
+    circuit_breakers.reset()
+    yield
+    scrape_service.result_cache.clear()
+    circuit_breakers.reset()
+
+
+@pytest.fixture(autouse=True)
+def disable_page_cache(monkeypatch):
+    """关闭全局磁盘页面缓存"""
+    monkeypatch.setattr(settings, "page_cache_enabled", False)
+
+
+@pytest.fixture(autouse=True)
+def disable_rate_limit(monkeypatch):
+    """关闭全局限流（避免测试按真实速率等待）"""
+    monkeypatch.setattr(settings, "rate_limit_enabled", False)
+
+
+@pytest.fixture(autouse=True)
+def disable_retry(monkeypatch):
+    """关闭上游调用重试（失败场景的测试只期望一次调用）"""
+    monkeypatch.setattr(settings, "retry_enabled", False)
+
+
+@pytest.fixture(autouse=True)
+def disable_indeed_process_pool(monkeypatch):
+    """在测试进程内调用 JobSpy（测试中替换的 scrape_jobs 不会进入子进程）"""
+    monkeypatch.setattr(settings, "indeed_process_workers", 0)
+
+
+@pytest.fixture(autouse=True)
+def disable_tracing(monkeypatch):
+    """关闭链路追踪（避免测试写入 trace 文件）"""
+    monkeypatch.setattr(settings, "tracing_enabled", False)
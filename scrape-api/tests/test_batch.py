@@ -0,0 +1,153 @@
+"""
+测试 batch.py 模块和 /scrape/batch 端点
+
+测试批量抓取：结果顺序、单任务失败隔离、全局和平台并发上限
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+
+from app.exceptions import ScraperTimeoutError
+from app.main import app
+from app.models.job_posting_dto import BatchScrapeSpec, JobPostingDTO
+from app.services import scrape_service
+from app.services.batch import BatchScheduler
+
+
+def make_job(platform, source_id):
+    """创建测试用职位"""
+    return JobPostingDTO(source=platform, source_id=source_id, title="Tiler", company="ABC")
+
+
+def spec(platform, keywords="tiler", location="Adelaide"):
+    """创建批量任务"""
+    return BatchScrapeSpec(platform=platform, keywords=keywords, location=location)
+
+
+@pytest.mark.asyncio
+async def test_batch_results_in_request_order():
+    """测试结果按请求顺序返回（即使完成顺序不同）"""
+    async def fake_scrape(platform, request):
+        await asyncio.sleep(0.03 if request.keywords == "slow" else 0)
+        return [make_job(platform, request.keywords)]
+
+    scheduler = BatchScheduler(max_concurrency=4, platform_limits={})
+    with patch.object(scrape_service, "scrape", fake_scrape):
+        response = await scheduler.run([spec("seek", "slow"), spec("indeed", "fast")])
+
+    assert [result.index for result in response.results] == [0, 1]
+    assert response.results[0].jobs[0].source_id == "slow"
+    assert response.results[1].platform == "indeed"
+    assert response.total_jobs == 2
+    assert response.succeeded == 2
+    assert response.failed == 0
+
+
+@pytest.mark.asyncio
+async def test_batch_isolates_failures():
+    """测试单个任务失败不影响其他任务"""
+    async def fake_scrape(platform, request):
+        if request.location == "Perth":
+            raise ScraperTimeoutError("timed out", platform=platform)
+        return [make_job(platform, "1")]
+
+    scheduler = BatchScheduler(max_concurrency=4, platform_limits={})
+    with patch.object(scrape_service, "scrape", fake_scrape):
+        response = await scheduler.run([spec("seek", location="Perth"), spec("seek")])
+
+    failed, ok = response.results
+    assert failed.error == "[seek] timed out"
+    assert failed.error_type == "ScraperTimeoutError"
+    assert failed.count == 0
+    assert ok.error is None
+    assert ok.count == 1
+    assert response.failed == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_respects_concurrency_limits():
+    """测试全局和平台并发上限"""
+    in_flight = {"total": 0, "seek": 0, "indeed": 0}
+    peak = dict(in_flight)
+
+    async def fake_scrape(platform, request):
+        in_flight["total"] += 1
+        in_flight[platform] += 1
+        for key in peak:
+            peak[key] = max(peak[key], in_flight[key])
+        await asyncio.sleep(0.02)
+        in_flight["total"] -= 1
+        in_flight[platform] -= 1
+        return []
+
+    scheduler = BatchScheduler(max_concurrency=3, platform_limits={"seek": 2, "indeed": 1})
+    specs = [spec("seek") for _ in range(6)] + [spec("indeed") for _ in range(3)]
+    with patch.object(scrape_service, "scrape", fake_scrape):
+        response = await scheduler.run(specs)
+
+    assert response.succeeded == 9
+    assert peak == {"total": 3, "seek": 2, "indeed": 1}
+    assert max(result.queued_ms for result in response.results) > 0
+
+
+@pytest.mark.asyncio
+async def test_batch_platform_backlog_does_not_starve_others():
+    """测试一个平台的积压不会占住全局槽位"""
+    started = []
+
+    async def fake_scrape(platform, request):
+        started.append(platform)
+        await asyncio.sleep(0.02)
+        return []
+
+    scheduler = BatchScheduler(max_concurrency=2, platform_limits={"seek": 1, "indeed": 1})
+    specs = [spec("seek") for _ in range(4)] + [spec("indeed")]
+    with patch.object(scrape_service, "scrape", fake_scrape):
+        await scheduler.run(specs)
+
+    # indeed 任务应在第一批启动，而不是等 seek 全部完成
+    assert "indeed" in started[:2]
+
+
+def test_batch_endpoint():
+    """测试 /scrape/batch 端点"""
+    async def fake_scrape(platform, request):
+        return [make_job(platform, f"{platform}-{request.location}")]
+
+    client = TestClient(app)
+    payload = {"specs": [
+        {"platform": "seek", "keywords": "tiler", "location": "Adelaide"},
+        {"platform": "indeed", "keywords": "tiler", "location": "Sydney", "max_results": 10},
+    ]}
+    with patch.object(scrape_service, "scrape", fake_scrape):
+        response = client.post("/scrape/batch", json=payload)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total_jobs"] == 2
+    assert [r["jobs"][0]["source_id"] for r in body["results"]] == ["seek-Adelaide", "indeed-Sydney"]
+
+
+def test_batch_endpoint_rejects_too_many_specs():
+    """测试超出 batch_max_specs 时返回 422"""
+    from app.config.settings import settings
+
+    client = TestClient(app)
+    payload = {"specs": [{"platform": "seek", "keywords": "tiler", "location": "Adelaide"}] * 3}
+    with patch.object(settings, "batch_max_specs", 2):
+        response = client.post("/scrape/batch", json=payload)
+
+    assert response.status_code == 422
+
+
+def test_batch_endpoint_rejects_unknown_platform():
+    """测试不支持的平台返回 422"""
+    client = TestClient(app)
+    payload = {"specs": [{"platform": "linkedin", "keywords": "tiler", "location": "Adelaide"}]}
+
+    response = client.post("/scrape/batch", json=payload)
+
+    assert response.status_code == 422
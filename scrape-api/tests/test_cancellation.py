@@ -0,0 +1,194 @@
+"""
+测试 cancellation.py 模块
+
+测试调用方断开时取消抓取：断开检测、single-flight 的共享调用、线程池中的检查点和浪费的上游请求计数
+"""
+
+import asyncio
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.exceptions import RequestCancelledError
+from app.main import app
+from app.models.job_posting_dto import ScrapeRequest
+from app.services import metrics, scrape_service
+from app.services.cancellation import check_cancelled, run_until_disconnect
+from app.services.executor import PlatformExecutors
+from app.services.single_flight import SingleFlight
+
+
+def sample(name, **labels):
+    """读取指标当前值（不存在时为 0）"""
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class FakeRequest:
+    """只提供 receive() 的请求：disconnected 被设置后返回 http.disconnect"""
+
+    def __init__(self):
+        self.disconnected = asyncio.Event()
+
+    async def receive(self):
+        await self.disconnected.wait()
+        return {"type": "http.disconnect"}
+
+
+class SlowAdapter:
+    """发出一次上游请求后一直等待的适配器"""
+
+    def __init__(self):
+        self.started = asyncio.Event()
+        self.cancelled = False
+
+    async def scrape_async(self, request):
+        with metrics.timed(metrics.UPSTREAM_FETCH_SECONDS, "seek"):
+            await asyncio.sleep(0)
+        self.started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return []
+
+
+@pytest.mark.asyncio
+async def test_run_until_disconnect():
+    """测试正常完成时返回结果，断开时取消抓取并抛出 RequestCancelledError"""
+    assert await run_until_disconnect(FakeRequest(), asyncio.sleep(0, result="done")) == "done"
+
+    request = FakeRequest()
+    cancelled = False
+
+    async def work():
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    asyncio.get_running_loop().call_later(0.01, request.disconnected.set)
+    with pytest.raises(RequestCancelledError):
+        await run_until_disconnect(request, work(), "seek")
+    assert cancelled
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cancels_when_all_waiters_leave():
+    """测试最后一个等待者被取消时取消共享的调用"""
+    flights = SingleFlight()
+    started = asyncio.Event()
+    cancelled = False
+
+    async def work():
+        nonlocal cancelled
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    first = asyncio.ensure_future(flights.do("key", work))
+    second = asyncio.ensure_future(flights.do("key", work))
+    await started.wait()
+
+    first.cancel()
+    await asyncio.sleep(0.01)
+    assert not cancelled
+
+    second.cancel()
+    await asyncio.gather(first, second, return_exceptions=True)
+    await asyncio.sleep(0)
+    assert cancelled
+    assert flights.stats()["cancelled"] == 1
+    assert flights.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_executor_cancellation_reaches_thread():
+    """测试线程池中的调用在检查点发现取消"""
+    executors = PlatformExecutors({"seek": 1})
+    started = threading.Event()
+    stopped = threading.Event()
+
+    def blocking():
+        started.set()
+        try:
+            while True:
+                check_cancelled("seek")
+                threading.Event().wait(0.005)
+        except RequestCancelledError:
+            stopped.set()
+
+    task = asyncio.ensure_future(executors.run("seek", blocking))
+    await asyncio.to_thread(started.wait, 1)
+    task.cancel()
+
+    assert await asyncio.to_thread(stopped.wait, 1)
+    check_cancelled("seek")  # 取消标记只绑定到工作线程的上下文
+    executors.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_fetch_records_wasted_upstream_calls():
+    """测试所有调用方断开后，已发出的上游请求计为浪费"""
+    adapter = SlowAdapter()
+    before = sample("scrape_wasted_upstream_calls_total", platform="seek")
+    request = ScrapeRequest(keywords="tiler", location="Adelaide", max_results=10)
+
+    with patch.object(scrape_service, "get_adapter", lambda platform: adapter):
+        task = asyncio.ensure_future(scrape_service.fetch("seek", request))
+        await adapter.started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+
+    assert adapter.cancelled
+    assert sample("scrape_wasted_upstream_calls_total", platform="seek") == before + 1
+    assert scrape_service.result_cache.get(scrape_service.request_key("seek", request)) is None
+
+
+@pytest.mark.asyncio
+async def test_scrape_endpoint_cancels_on_disconnect():
+    """测试 /scrape/seek 在调用方断开时取消抓取，记录 cancelled 并返回 499"""
+    adapter = SlowAdapter()
+    disconnected = asyncio.Event()
+    body = json.dumps({"keywords": "plumber", "location": "Sydney", "max_results": 5}).encode()
+    requests = [{"type": "http.request", "body": body, "more_body": False}]
+    messages = []
+    scope = {
+        "type": "http", "method": "POST", "path": "/scrape/seek", "raw_path": b"/scrape/seek",
+        "query_string": b"", "root_path": "", "scheme": "http", "http_version": "1.1",
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        "client": ("test", 1), "server": ("test", 80),
+    }
+
+    async def receive():
+        if requests:
+            return requests.pop()
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        messages.append(message)
+
+    cancelled_before = sample("scrape_requests_total", platform="seek", endpoint="scrape", outcome="cancelled")
+    wasted_before = sample("scrape_wasted_upstream_calls_total", platform="seek")
+
+    with patch.object(scrape_service, "get_adapter", lambda platform: adapter):
+        call = asyncio.ensure_future(app(scope, receive, send))
+        await asyncio.wait_for(adapter.started.wait(), 1)
+        disconnected.set()
+        await asyncio.wait_for(call, 1)
+
+    assert adapter.cancelled
+    assert messages[0]["status"] == 499
+    assert sample("scrape_requests_total", platform="seek", endpoint="scrape", outcome="cancelled") == cancelled_before + 1
+    assert sample("scrape_wasted_upstream_calls_total", platform="seek") == wasted_before + 1
@@ -0,0 +1,234 @@
+"""
+测试 circuit_breaker.py 模块
+
+测试失败率触发熔断、快速失败、半开探测、异常分类，以及 /health 和端点的熔断状态
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+
+from app.adapters.seek_adapter import SeekAdapter
+from app.config.settings import settings
+from app.exceptions import (
+    CircuitOpenError,
+    DeadlineExceededError,
+    PlatformException,
+    RateLimitException,
+    ScraperDataError,
+    ScraperNotFoundError,
+    ScraperTimeoutError,
+)
+from app.main import app
+from app.models.job_posting_dto import ScrapeRequest
+from app.services import scrape_service
+from app.services.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    circuit_breakers,
+    is_upstream_failure,
+)
+
+
+def make_breaker(clock, **overrides):
+    """创建测试用熔断器（窗口 4，至少 2 次调用，失败率 50%）"""
+    options = dict(failure_rate_threshold=0.5, window_size=4, min_calls=2, open_seconds=10)
+    options.update(overrides)
+    return CircuitBreaker("seek", clock=clock, **options)
+
+
+def fail(breaker, times=1):
+    """记录若干次失败"""
+    for _ in range(times):
+        breaker.before_call()
+        breaker.on_failure()
+
+
+def test_is_upstream_failure():
+    """测试按异常分类判断是否计入失败率"""
+    assert is_upstream_failure(ScraperTimeoutError("t"))
+    assert is_upstream_failure(RateLimitException("r"))
+    assert is_upstream_failure(PlatformException("s", status_code=503))
+    assert is_upstream_failure(PlatformException("f", status_code=403))
+    assert not is_upstream_failure(PlatformException("c", status_code=400))
+    assert not is_upstream_failure(ScraperNotFoundError("nf", status_code=404))
+    assert not is_upstream_failure(ScraperDataError("d"))
+    assert not is_upstream_failure(CircuitOpenError("o"))
+
+
+def test_opens_after_failure_rate_threshold(clock):
+    """测试达到最小调用数和失败率后熔断"""
+    breaker = make_breaker(clock)
+
+    fail(breaker)
+    assert breaker.state == CLOSED  # 调用数不足
+
+    fail(breaker)
+    assert breaker.state == OPEN
+    assert breaker.times_opened == 1
+
+
+def test_successes_keep_circuit_closed(clock):
+    """测试失败率低于阈值时保持关闭"""
+    breaker = make_breaker(clock, failure_rate_threshold=0.75)
+    for _ in range(3):
+        breaker.before_call()
+        breaker.on_success()
+    fail(breaker)
+
+    assert breaker.state == CLOSED
+
+
+def test_open_circuit_fails_fast(clock):
+    """测试熔断期间直接抛出 CircuitOpenError"""
+    breaker = make_breaker(clock)
+    fail(breaker, 2)
+    clock.now += 4
+
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.before_call()
+
+    assert exc_info.value.retry_after == 6
+    assert exc_info.value.platform == "seek"
+    assert breaker.rejected == 1
+
+
+def test_half_open_probe_success_closes(clock):
+    """测试半开状态只放行探测请求，成功后关闭"""
+    breaker = make_breaker(clock)
+    fail(breaker, 2)
+    clock.now += 10
+
+    assert breaker.state == HALF_OPEN
+    breaker.before_call()  # 探测请求
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()  # 探测名额已满
+
+    breaker.on_success()
+    assert breaker.state == CLOSED
+    breaker.before_call()
+
+
+def test_half_open_probe_failure_reopens(clock):
+    """测试探测失败后重新熔断"""
+    breaker = make_breaker(clock)
+    fail(breaker, 2)
+    clock.now += 10
+
+    fail(breaker)
+
+    assert breaker.state == OPEN
+    assert breaker.times_opened == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_releases_slot(clock):
+    """测试探测请求被取消时释放探测名额"""
+    breaker = make_breaker(clock)
+    fail(breaker, 2)
+    clock.now += 10
+
+    async def slow():
+        await asyncio.sleep(1)
+
+    probe = asyncio.ensure_future(breaker.call(slow))
+    await asyncio.sleep(0)
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+
+
+def test_deadline_during_probe_keeps_half_open(clock):
+    """测试探测请求因截止时间中止时不恢复熔断器，只释放探测名额"""
+    breaker = make_breaker(clock)
+    fail(breaker, 2)
+    clock.now += 10
+
+    def out_of_time():
+        raise DeadlineExceededError("Request deadline exceeded", platform="seek")
+
+    with pytest.raises(DeadlineExceededError):
+        breaker.call_sync(out_of_time)
+
+    assert breaker.state == HALF_OPEN
+    breaker.before_call()  # 探测名额已释放
+
+
+@pytest.mark.asyncio
+async def test_call_ignores_non_failures(clock):
+    """测试 404 等非上游故障不计入失败率"""
+    breaker = make_breaker(clock)
+
+    async def not_found():
+        raise ScraperNotFoundError("missing", status_code=404)
+
+    for _ in range(4):
+        with pytest.raises(ScraperNotFoundError):
+            await breaker.call(not_found)
+
+    assert breaker.state == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_seek_adapter_fails_fast_when_open(monkeypatch):
+    """测试 SEEK 连续失败后熔断，之后的请求不再访问上游"""
+    monkeypatch.setattr(settings, "circuit_min_calls", 2)
+    monkeypatch.setattr(settings, "circuit_window_size", 4)
+    calls = 0
+
+    def handler(request):
+        nonlocal calls
+        calls += 1
+        return httpx.Response(503)
+
+    adapter = SeekAdapter(http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    request = ScrapeRequest(keywords="plumber", location="Sydney")
+
+    for _ in range(2):
+        with pytest.raises(PlatformException):
+            await adapter.scrape_async(request)
+    with pytest.raises(CircuitOpenError):
+        await adapter.scrape_async(request)
+
+    assert calls == 2
+    assert circuit_breakers.states()["seek"] == OPEN
+
+
+def test_health_reports_circuits():
+    """测试 /health 报告熔断状态，熔断时 status 为 degraded"""
+    client = TestClient(app)
+
+    healthy = client.get("/health").json()
+    assert healthy["status"] == "ok"
+    assert healthy["circuits"] == {"indeed": "closed", "seek": "closed"}
+
+    breaker = circuit_breakers.get("seek")
+    for _ in range(breaker.min_calls):
+        breaker.on_failure()
+
+    degraded = client.get("/health")
+    assert degraded.status_code == 200
+    assert degraded.json()["status"] == "degraded"
+    assert degraded.json()["circuits"]["seek"] == "open"
+
+
+def test_endpoint_returns_503_when_open():
+    """测试熔断时端点返回 503 和 Retry-After"""
+    class OpenAdapter:
+        async def scrape_async(self, request):
+            raise CircuitOpenError("circuit open", platform="seek", retry_after=12)
+
+    client = TestClient(app)
+    with patch.object(scrape_service, "get_adapter", lambda platform: OpenAdapter()):
+        response = client.post("/scrape/seek", json={"keywords": "plumber", "location": "Sydney"})
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "12"
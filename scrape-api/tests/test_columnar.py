@@ -0,0 +1,106 @@
+"""
+测试 columnar.py 模块
+
+测试列式紧凑 JSON 的列编码选择、与 pydantic 模型的往返转换和 ?format=columnar
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import httpx
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+
+from app.adapters.seek_adapter import SeekAdapter
+from app.main import app
+from app.models.job_posting_dto import JobPostingDTO, PlatformEnum, ScrapeResponse
+from app.services import scrape_service
+from app.services.columnar import decode_jobs, encode_columnar
+from app.services.serialization import dump_json
+
+STATES = ("NSW", "VIC", "SA")
+COMPANIES = ("ABC Tiling", "Pipe Co", "Hays")
+
+
+def make_response(count: int = 200) -> ScrapeResponse:
+    """构造 SEEK 风格的响应（无描述，地点 / 公司重复）"""
+    now = datetime(2025, 12, 2, 8, 0)
+    jobs = [
+        JobPostingDTO(
+            source=PlatformEnum.SEEK,
+            source_id=str(80000000 + i),
+            title=f"Tiler {i}",
+            company=COMPANIES[i % len(COMPANIES)],
+            location_state=STATES[i % len(STATES)],
+            location_suburb=None if i % 4 == 0 else "Adelaide",
+            trade="tiler",
+            employment_type="Full Time",
+            pay_range_min=70000.0 if i % 2 else None,
+            posted_at=now - timedelta(hours=i),
+            scraped_at=now,
+            job_url=f"https://www.seek.com.au/job/{80000000 + i}",
+        )
+        for i in range(count)
+    ]
+    return ScrapeResponse(platform=PlatformEnum.SEEK, jobs=jobs, count=len(jobs), scraped_at=now)
+
+
+def test_column_encodings():
+    """测试默认值列省略、常量列、字典编码列和普通列"""
+    response = make_response(6)
+
+    body = json.loads(encode_columnar(response))
+    columns = body["jobs"]["columns"]
+
+    assert body["format"] == "columnar"
+    assert body["platform"] == "seek"
+    assert body["count"] == 6
+    assert body["jobs"]["length"] == 6
+    assert "description" not in columns
+    assert "tags" not in columns
+    assert columns["source"] == {"const": "seek"}
+    assert columns["scraped_at"] == {"const": "2025-12-02T08:00:00"}
+    assert columns["location_state"] == {"dict": ["NSW", "VIC", "SA"], "codes": [0, 1, 2, 0, 1, 2]}
+    assert columns["location_suburb"] == {"dict": ["Adelaide"], "codes": [None, 0, 0, 0, None, 0]}
+    assert columns["source_id"] == [str(80000000 + i) for i in range(6)]
+    assert columns["pay_range_min"] == [None, 70000.0, None, 70000.0, None, 70000.0]
+
+
+def test_round_trip():
+    """测试解码后的职位与原模型一致"""
+    response = make_response(50)
+
+    body = json.loads(encode_columnar(response))
+
+    assert [JobPostingDTO(**row) for row in decode_jobs(body["jobs"])] == response.jobs
+    assert decode_jobs(json.loads(encode_columnar(make_response(0)))["jobs"]) == []
+
+
+def test_columnar_is_smaller():
+    """测试重复字段较多时列式格式明显小于 JSON"""
+    response = make_response(200)
+
+    assert len(encode_columnar(response)) * 2 < len(dump_json(response))
+
+
+def test_scrape_endpoint_columnar():
+    """测试 ?format=columnar 返回列式 JSON 和 timings，无效的 format 返回 422"""
+    payload = {"data": [{"id": "1", "title": "Plumber"}, {"id": "2", "title": "Tiler"}], "totalCount": 2}
+    adapter = SeekAdapter(http_client=httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json=payload))
+    ))
+    client = TestClient(app)
+    body = {"keywords": "plumber", "location": "Sydney", "max_results": 2}
+
+    with patch.object(scrape_service, "get_adapter", lambda platform: adapter):
+        response = client.post("/scrape/seek", params={"format": "columnar"}, json=body)
+        invalid = client.post("/scrape/seek", params={"format": "csv"}, json=body)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    data = response.json()
+    assert data["format"] == "columnar"
+    assert data["count"] == 2
+    assert data["jobs"]["columns"]["title"] == ["Plumber", "Tiler"]
+    assert data["timings"]["upstream_requests"] == 1
+    assert invalid.status_code == 422
@@ -0,0 +1,168 @@
+"""
+测试 compression.py 模块
+
+测试 Accept-Encoding 协商、压缩下限、流式响应逐块压缩和 /scrape/seek 的压缩响应
+"""
+
+import asyncio
+import gzip
+import json
+import zlib
+
+import httpx
+import pytest
+from unittest.mock import patch
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.adapters.seek_adapter import SeekAdapter
+from app.config.settings import settings
+from app.main import app
+from app.services import compression, scrape_service
+from app.services.compression import CompressionMiddleware, choose_encoding, parse_accept_encoding
+
+BIG_BODY = json.dumps({"jobs": [{"description": "Wall and floor tiling. " * 20}] * 20}).encode()
+
+
+def make_app() -> FastAPI:
+    """带压缩中间件的测试应用"""
+    test_app = FastAPI()
+    test_app.add_middleware(CompressionMiddleware)
+
+    @test_app.get("/big")
+    async def big():
+        return Response(content=BIG_BODY, media_type="application/json")
+
+    @test_app.get("/small")
+    async def small():
+        return Response(content=b'{"ok":true}', media_type="application/json")
+
+    @test_app.get("/binary")
+    async def binary():
+        return Response(content=BIG_BODY, media_type="application/octet-stream")
+
+    @test_app.get("/stream")
+    async def stream():
+        async def lines():
+            for i in range(3):
+                yield json.dumps({"id": i}).encode() + b"\n"
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    return test_app
+
+
+async def call(test_app, path: str, accept_encoding: str):
+    """直接调用 ASGI 应用，返回所有发送的消息"""
+    messages = []
+    scope = {
+        "type": "http", "method": "GET", "path": path, "raw_path": path.encode(),
+        "query_string": b"", "root_path": "", "scheme": "http", "http_version": "1.1",
+        "headers": [(b"accept-encoding", accept_encoding.encode())],
+        "client": ("test", 1), "server": ("test", 80),
+    }
+
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if requests:
+            return requests.pop()
+        await asyncio.Event().wait()  # 客户端不断开
+
+    async def send(message):
+        messages.append(message)
+
+    await test_app(scope, receive, send)
+    return messages
+
+
+def response_headers(messages) -> dict:
+    return {name.decode(): value.decode() for name, value in messages[0]["headers"]}
+
+
+def test_parse_accept_encoding():
+    """测试 q 值解析"""
+    assert parse_accept_encoding("gzip, zstd;q=0.8, br;q=bad") == {"gzip": 1.0, "zstd": 0.8, "br": 0.0}
+    assert parse_accept_encoding(None) == {}
+
+
+def test_choose_encoding(monkeypatch):
+    """测试按 q 值和可用编码选择（q 值相同时优先 zstd）"""
+    monkeypatch.setattr(compression, "zstd_available", lambda: True)
+    assert choose_encoding("gzip, zstd") == "zstd"
+    assert choose_encoding("gzip, zstd;q=0.5") == "gzip"
+    assert choose_encoding("*") == "zstd"
+
+    monkeypatch.setattr(compression, "zstd_available", lambda: False)
+    assert choose_encoding("zstd, gzip;q=0.1") == "gzip"
+    assert choose_encoding("zstd") is None
+    assert choose_encoding("gzip;q=0, identity") is None
+    assert choose_encoding(None) is None
+
+
+def test_compresses_large_responses_only():
+    """测试超过下限的 JSON 压缩，小响应、二进制和不接受压缩的请求原样返回（可压缩的类型仍带 Vary）"""
+    test_app = make_app()
+
+    messages = asyncio.run(call(test_app, "/big", "gzip"))
+    headers = response_headers(messages)
+    assert headers["content-encoding"] == "gzip"
+    assert headers["vary"] == "Accept-Encoding"
+    assert int(headers["content-length"]) == len(messages[1]["body"]) < len(BIG_BODY)
+    assert gzip.decompress(messages[1]["body"]) == BIG_BODY
+
+    for path, accept, vary in (("/small", "gzip", True), ("/binary", "gzip", False), ("/big", "identity", True)):
+        messages = asyncio.run(call(test_app, path, accept))
+        headers = response_headers(messages)
+        assert "content-encoding" not in headers
+        assert (headers.get("vary") == "Accept-Encoding") is vary
+
+
+def test_streaming_chunks_are_flushed():
+    """测试流式响应逐块压缩，每块到达时即可解压出完整的行"""
+    messages = asyncio.run(call(make_app(), "/stream", "gzip"))
+    headers = response_headers(messages)
+    assert headers["content-encoding"] == "gzip"
+    assert "content-length" not in headers
+
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    lines = []
+    for message in messages[1:]:
+        chunk = decompressor.decompress(message["body"])
+        if chunk:
+            lines.append(json.loads(chunk))
+    assert lines == [{"id": 0}, {"id": 1}, {"id": 2}]
+    assert decompressor.eof
+
+
+def test_zstd_round_trip(monkeypatch):
+    """测试 zstd 压缩（需要 zstandard）"""
+    zstandard = pytest.importorskip("zstandard")
+    monkeypatch.setattr(compression, "zstd_available", lambda: True)
+
+    messages = asyncio.run(call(make_app(), "/big", "zstd, gzip"))
+
+    assert response_headers(messages)["content-encoding"] == "zstd"
+    assert zstandard.ZstdDecompressor().decompressobj().decompress(messages[1]["body"]) == BIG_BODY
+
+
+def test_scrape_endpoint_compressed(monkeypatch):
+    """测试 /scrape/seek 的压缩响应保留 Server-Timing，可关闭压缩"""
+    monkeypatch.setattr(settings, "compression_min_size", 100)
+    payload = {"data": [{"id": str(i), "title": f"Plumber {i}"} for i in range(10)], "totalCount": 10}
+    adapter = SeekAdapter(http_client=httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json=payload))
+    ))
+    client = TestClient(app)
+    body = {"keywords": "plumber", "location": "Sydney", "max_results": 10}
+
+    with patch.object(scrape_service, "get_adapter", lambda platform: adapter):
+        response = client.post("/scrape/seek", json=body, headers={"Accept-Encoding": "gzip"})
+        monkeypatch.setattr(settings, "compression_enabled", False)
+        plain = client.post("/scrape/seek", json=body, headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "fetch;dur=" in response.headers["Server-Timing"]
+    assert response.json()["count"] == 10
+    assert "Content-Encoding" not in plain.headers
+    assert plain.json()["count"] == 10
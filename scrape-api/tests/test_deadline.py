@@ -0,0 +1,165 @@
+"""
+测试 deadline.py 模块
+
+测试请求截止时间：预算的嵌套和解析、上游调用超时、重试让位于截止时间，
+以及 SEEK 抓取在预算用尽时返回部分结果（truncated，不写入缓存；流式端点在结尾行标记）
+"""
+
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.adapters.seek_adapter import SeekAdapter
+from app.exceptions import DeadlineExceededError, ScraperTimeoutError
+from app.main import app
+from app.models.job_posting_dto import BatchScrapeSpec, ScrapeRequest
+from app.services import deadline, scrape_service
+from app.services.batch import BatchScheduler
+from app.services.retry import Retrier
+
+
+async def slow_pages_handler(request):
+    """第 1 页立即返回，之后的页在请求超时前都不返回（超时时抛出 ReadTimeout，同真实的传输层）"""
+    page = int(request.url.params["page"])
+    if page > 1 and request.url.params["keywords"] != "fast":
+        await asyncio.sleep(request.extensions["timeout"]["read"])
+        raise httpx.ReadTimeout("timed out", request=request)
+    start = (page - 1) * 50
+    return httpx.Response(200, json={
+        "data": [{"id": str(i), "title": f"Plumber {i}"} for i in range(start, start + 50)],
+        "totalCount": 200
+    })
+
+
+def slow_adapter(platform):
+    """get_adapter 替身：使用 slow_pages_handler 的 SeekAdapter"""
+    return SeekAdapter(http_client=httpx.AsyncClient(transport=httpx.MockTransport(slow_pages_handler)))
+
+
+def test_for_request_takes_earlier_deadline():
+    """测试单次抓取的截止时间取请求头和 deadline_ms 中较早的一个，截断时同时标记外层"""
+    assert deadline.for_request() is None
+    assert deadline.for_request(500).remaining() == pytest.approx(0.5, abs=0.05)
+
+    with deadline.scope(deadline.Deadline(0.2)) as outer:
+        assert deadline.for_request(5000).remaining() == pytest.approx(0.2, abs=0.05)
+        inner = deadline.for_request(50)
+        assert inner.remaining() == pytest.approx(0.05, abs=0.02)
+
+        inner.mark_exceeded()
+        assert outer.exceeded
+    assert deadline.current() is None
+
+
+def test_parse_header():
+    """测试 X-Request-Deadline 解析：空值表示未设置，非正数或非数字时抛出 ValueError"""
+    assert deadline.parse_header(None) is None
+    assert deadline.parse_header(" ") is None
+    assert deadline.parse_header("250").remaining() == pytest.approx(0.25, abs=0.05)
+    for value in ("0", "-5", "soon"):
+        with pytest.raises(ValueError):
+            deadline.parse_header(value)
+
+
+def test_timeout_bounded_by_remaining_budget():
+    """测试上游调用超时不超过剩余预算，预算用尽时抛出 DeadlineExceededError 并记录截断"""
+    assert deadline.timeout(30.0) == 30.0
+
+    with deadline.scope(deadline.Deadline(0.5)) as current:
+        assert deadline.timeout(30.0) <= 0.5
+        assert deadline.timeout(0.1) == 0.1
+
+        current.expires_at = time.monotonic()
+        with pytest.raises(DeadlineExceededError):
+            deadline.timeout(30.0, "seek")
+        assert deadline.truncated()
+
+
+def test_retry_skipped_when_wait_exceeds_deadline(monkeypatch):
+    """测试下一次退避等待超过剩余预算时不重试"""
+    from app.config.settings import settings
+
+    monkeypatch.setattr(settings, "retry_enabled", True)
+    retrier = Retrier(rng=lambda: 1.0)
+    error = ScraperTimeoutError("timed out", platform="seek")
+    started = time.monotonic()
+
+    assert retrier._next_delay("seek", 1, error, started) is not None
+    with deadline.scope(deadline.Deadline(0.01)):
+        assert retrier._next_delay("seek", 1, error, started) is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_returns_partial_results_when_deadline_exceeded():
+    """测试预算用尽时返回已取得的页，truncated 为 True 且不写入缓存"""
+    request = ScrapeRequest(keywords="plumber", location="Sydney", max_results=200, deadline_ms=200)
+
+    with patch.object(scrape_service, "get_adapter", slow_adapter):
+        started = time.monotonic()
+        outcome = await scrape_service.fetch("seek", request)
+
+    assert time.monotonic() - started < 1
+    assert outcome.truncated
+    assert [job.source_id for job in outcome.jobs] == [str(i) for i in range(50)]
+    assert scrape_service.result_cache.get(scrape_service.request_key("seek", request)) is None
+
+
+@pytest.mark.asyncio
+async def test_batch_specs_truncated_independently():
+    """测试批量抓取中只有超出自身预算的任务被标记为 truncated"""
+    scheduler = BatchScheduler(max_concurrency=2, platform_limits={"seek": 2})
+    specs = [
+        BatchScrapeSpec(platform="seek", keywords="plumber", location="Sydney", max_results=200, deadline_ms=200),
+        BatchScrapeSpec(platform="seek", keywords="fast", location="Sydney", max_results=200, deadline_ms=5000),
+    ]
+
+    with patch.object(scrape_service, "get_adapter", slow_adapter):
+        response = await scheduler.run(specs)
+
+    slow, fast = response.results
+    assert slow.truncated and slow.count == 50
+    assert not fast.truncated and fast.count == 200
+
+
+def test_scrape_endpoint_deadline_header():
+    """测试 /scrape/seek 按 X-Request-Deadline 返回部分结果，无效的请求头返回 400"""
+    client = TestClient(app)
+    payload = {"keywords": "plumber", "location": "Sydney", "max_results": 200}
+
+    with patch.object(scrape_service, "get_adapter", slow_adapter):
+        response = client.post("/scrape/seek", json=payload, headers={"X-Request-Deadline": "200"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["truncated"] is True
+    assert body["count"] == 50
+
+    response = client.post("/scrape/seek", json=payload, headers={"X-Request-Deadline": "0"})
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("headers, body", [
+    ({"X-Request-Deadline": "200"}, {}),
+    ({}, {"deadline_ms": 200}),
+])
+def test_stream_endpoint_deadline(headers, body):
+    """测试流式端点预算用尽时停止抓取剩余页，结尾行 truncated 为 True"""
+    client = TestClient(app)
+    payload = {"keywords": "plumber", "location": "Sydney", "max_results": 200, **body}
+
+    with patch.object(scrape_service, "get_adapter", slow_adapter):
+        started = time.monotonic()
+        response = client.post("/scrape/seek/stream", json=payload, headers=headers)
+
+    assert time.monotonic() - started < 1
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    trailer = lines[-1]["trailer"]
+    assert len(lines) - 1 == trailer["count"] == 50
+    assert trailer["truncated"] is True
+    assert trailer["completed"] is True
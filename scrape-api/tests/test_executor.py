@@ -0,0 +1,116 @@
+"""
+测试 executor.py 模块
+
+测试按平台划分的线程池：并发执行、容量限制、事件循环不被阻塞
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+from app.services.executor import PlatformExecutors
+
+
+@pytest.fixture
+def executors():
+    """创建测试用的执行器集合（seek: 2 线程, indeed: 1 线程）"""
+    pool = PlatformExecutors(sizes={"seek": 2, "indeed": 1}, default_size=1)
+    yield pool
+    pool.shutdown(wait=True)
+
+
+@pytest.mark.asyncio
+async def test_run_returns_result(executors):
+    """测试返回阻塞函数的结果"""
+    result = await executors.run("seek", lambda x, y=0: x + y, 1, y=2)
+    assert result == 3
+
+
+@pytest.mark.asyncio
+async def test_run_propagates_exception(executors):
+    """测试异常原样抛出"""
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        await executors.run("seek", fail)
+
+
+@pytest.mark.asyncio
+async def test_run_in_platform_thread(executors):
+    """测试在平台专用线程中执行"""
+    name = await executors.run("indeed", lambda: threading.current_thread().name)
+    assert name.startswith("indeed-worker")
+
+
+@pytest.mark.asyncio
+async def test_event_loop_not_blocked(executors):
+    """测试阻塞调用执行期间事件循环仍能处理其他协程"""
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    task = asyncio.create_task(ticker())
+    await executors.run("seek", time.sleep, 0.2)
+    task.cancel()
+
+    assert ticks >= 5
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_within_pool_size(executors):
+    """测试池大小范围内的调用并发执行（seek: 2 线程）"""
+    start = time.perf_counter()
+    await asyncio.gather(
+        executors.run("seek", time.sleep, 0.2),
+        executors.run("seek", time.sleep, 0.2),
+    )
+    assert time.perf_counter() - start < 0.35
+
+
+@pytest.mark.asyncio
+async def test_pool_is_bounded(executors):
+    """测试超出池大小的调用排队执行（indeed: 1 线程）"""
+    start = time.perf_counter()
+    await asyncio.gather(
+        executors.run("indeed", time.sleep, 0.15),
+        executors.run("indeed", time.sleep, 0.15),
+    )
+    assert time.perf_counter() - start >= 0.3
+
+
+@pytest.mark.asyncio
+async def test_platforms_are_isolated(executors):
+    """测试一个平台占满不影响另一个平台"""
+    slow = asyncio.ensure_future(executors.run("indeed", time.sleep, 0.3))
+    start = time.perf_counter()
+    await executors.run("seek", lambda: None)
+    assert time.perf_counter() - start < 0.1
+    await slow
+
+
+@pytest.mark.asyncio
+async def test_contextvars_propagate(executors):
+    """测试 contextvars 传递到工作线程"""
+    var = contextvars.ContextVar("request_id", default=None)
+    var.set("abc")
+
+    assert await executors.run("seek", var.get) == "abc"
+
+
+@pytest.mark.asyncio
+async def test_stats_and_shutdown(executors):
+    """测试 stats() 和 shutdown() 之后重新创建"""
+    await executors.run("seek", lambda: None)
+    assert executors.stats()["seek"]["max_workers"] == 2
+
+    executors.shutdown(platform="seek")
+    assert "seek" not in executors.stats()
+
+    assert await executors.run("seek", lambda: 42) == 42
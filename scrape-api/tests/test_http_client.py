@@ -0,0 +1,58 @@
+"""
+测试 http_client.py 模块
+
+测试共享 HTTP 客户端的创建、复用、关闭和 HTTP/2 回退
+"""
+
+import pytest
+from unittest.mock import patch
+
+from app.config.settings import settings
+from app.services import http_client
+
+
+@pytest.mark.asyncio
+async def test_get_http_client_is_shared():
+    """测试多次获取返回同一个客户端"""
+    first = http_client.get_http_client()
+    second = http_client.get_http_client()
+
+    assert first is second
+
+    await http_client.close_http_client()
+
+
+@pytest.mark.asyncio
+async def test_close_http_client_recreates():
+    """测试关闭后重新获取会创建新客户端"""
+    first = http_client.get_http_client()
+    await http_client.close_http_client()
+
+    assert first.is_closed
+
+    second = http_client.get_http_client()
+    assert second is not first
+    assert not second.is_closed
+
+    await http_client.close_http_client()
+
+
+@pytest.mark.asyncio
+async def test_build_http_client_http2_fallback():
+    """测试未安装 h2 时回退到 HTTP/1.1"""
+    with patch.object(settings, "http2_enabled", True), \
+            patch.object(http_client, "http2_available", return_value=False):
+        client = http_client.build_http_client()
+
+    assert client._transport._pool._http2 is False
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_build_http_client_uses_settings():
+    """测试连接池限制来自 Settings"""
+    with patch.object(settings, "http_max_connections", 7):
+        client = http_client.build_http_client()
+
+    assert client._transport._pool._max_connections == 7
+    await client.aclose()
@@ -0,0 +1,68 @@
+"""
+测试 import_timing.py 模块
+
+测试 -X importtime 输出解析，以及应用启动时的导入耗时预算和重量级依赖的按需加载
+"""
+
+import pytest
+
+from app.config.settings import settings
+from app.services.import_timing import measure, parse_importtime
+
+# 应用启动时导入的模块（适配器在启动时由注册表发现）
+STARTUP_MODULES = ["app.main", "app.adapters.indeed_adapter", "app.adapters.seek_adapter"]
+
+# 只应在首次使用时加载的依赖
+LAZY_MODULES = {"bs4", "jobspy", "pandas", "numpy", "pyarrow", "msgpack", "zstandard"}
+
+# 纯解析函数，不应依赖 app.services（追踪 span 在适配器的调用处创建）
+UTILS_MODULES = [
+    "app.utils.html_cleaner",
+    "app.utils.location_parser",
+    "app.utils.salary_parser",
+    "app.utils.trade_extractor",
+]
+
+
+@pytest.fixture(scope="module")
+def startup_report():
+    return measure(STARTUP_MODULES)
+
+
+def test_parse_importtime():
+    """测试解析自身 / 累计耗时和嵌套深度，跳过表头和其他输出"""
+    output = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       203 |        203 |   _io",
+        "import time:       120 |        120 |     app.config",
+        "import time:     34301 |     709153 | app.main",
+        "Traceback (most recent call last):",
+    ])
+
+    records = parse_importtime(output)
+
+    assert [(r.module, r.self_us, r.cumulative_us, r.depth) for r in records] == [
+        ("_io", 203, 203, 1),
+        ("app.config", 120, 120, 2),
+        ("app.main", 34301, 709153, 0),
+    ]
+
+
+def test_heavy_dependencies_are_lazy(startup_report):
+    """测试启动时不导入 JobSpy / pandas / BeautifulSoup 和可选的响应格式依赖"""
+    assert "app.main" in startup_report.loaded
+    assert not LAZY_MODULES & startup_report.loaded
+
+
+def test_startup_import_within_budget(startup_report):
+    """测试启动导入耗时不超过 import_time_budget_ms"""
+    assert startup_report.records
+    assert startup_report.total_ms <= settings.import_time_budget_ms, startup_report.render()
+
+
+def test_utils_do_not_import_services():
+    """测试 app/utils 的解析函数不导入 app.services（以及其依赖的配置和日志）"""
+    loaded = measure(UTILS_MODULES, runs=1).loaded
+
+    assert not {module for module in loaded if module.startswith("app.services")}
+    assert "app.config.settings" not in loaded
@@ -0,0 +1,164 @@
+"""
+测试 job_queue.py 模块和 /jobs 端点
+
+测试任务提交、进度、结果、失败、队列上限、结果过期
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.job_posting_dto import BatchScrapeSpec, JobStatusEnum
+from app.services import scrape_service
+from app.services.job_queue import KIND_BATCH, KIND_SCRAPE, JobQueue, JobQueueFullError
+
+
+def make_spec(keywords, platform="seek"):
+    """创建测试用抓取任务"""
+    return BatchScrapeSpec(platform=platform, keywords=keywords, location="Adelaide")
+
+
+async def wait_finished(queue, record, timeout=2.0):
+    """等待任务完成"""
+    deadline = time.monotonic() + timeout
+    while not record.finished:
+        assert time.monotonic() < deadline, "job did not finish"
+        await asyncio.sleep(0.005)
+
+
+@pytest.mark.asyncio
+async def test_scrape_job_succeeds(fake_adapter):
+    """测试单个抓取任务完成后返回 ScrapeResponse"""
+    queue = JobQueue(workers=1, max_pending=10, result_ttl=60)
+    record = queue.submit([make_spec("tiler")], KIND_SCRAPE)
+    assert record.status == JobStatusEnum.QUEUED
+    await wait_finished(queue, record)
+
+    body = json.loads(record.response_bytes())
+    assert body["status"] == "succeeded"
+    assert body["progress"] == {"total": 1, "completed": 1, "failed": 0, "jobs_found": 2}
+    assert body["result"]["count"] == 2
+    assert body["result"]["platform"] == "seek"
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_scrape_job_failure(fake_adapter):
+    """测试单个抓取失败时任务为 failed"""
+    queue = JobQueue(workers=1, max_pending=10, result_ttl=60)
+    record = queue.submit([make_spec("broken")], KIND_SCRAPE)
+    await wait_finished(queue, record)
+
+    assert record.status == JobStatusEnum.FAILED
+    assert record.error_type == "RuntimeError"
+    assert json.loads(record.response_bytes())["result"] is None
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_batch_job_reports_progress(fake_adapter):
+    """测试批量任务逐个更新进度，部分失败不影响整体成功"""
+    fake_adapter.delay = 0.01
+    queue = JobQueue(workers=1, max_pending=10, result_ttl=60)
+    record = queue.submit([make_spec("tiler"), make_spec("broken"), make_spec("plumber")], KIND_BATCH)
+    await wait_finished(queue, record)
+
+    assert record.status == JobStatusEnum.SUCCEEDED
+    assert (record.completed, record.failed, record.jobs_found) == (3, 1, 4)
+    body = json.loads(record.response_bytes())
+    assert body["result"]["succeeded"] == 2
+    assert [result["index"] for result in body["result"]["results"]] == [0, 1, 2]
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_workers_limit_concurrency():
+    """测试同时执行的任务数不超过 worker 数"""
+    running = 0
+    peak = 0
+
+    class TrackingAdapter:
+        async def scrape_async(self, request):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            return []
+
+    queue = JobQueue(workers=2, max_pending=10, result_ttl=60)
+    with patch.object(scrape_service, "get_adapter", lambda platform: TrackingAdapter()):
+        records = [queue.submit([make_spec(f"kw-{i}")], KIND_SCRAPE) for i in range(5)]
+        for record in records:
+            await wait_finished(queue, record)
+
+    assert peak == 2
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_queue_full(fake_adapter):
+    """测试排队任务数达到上限时拒绝提交"""
+    fake_adapter.delay = 0.05
+    queue = JobQueue(workers=1, max_pending=2, result_ttl=60)
+    queue.submit([make_spec("a")], KIND_SCRAPE)
+    queue.submit([make_spec("b")], KIND_SCRAPE)
+    with pytest.raises(JobQueueFullError):
+        queue.submit([make_spec("c")], KIND_SCRAPE)
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_finished_jobs_expire(clock, fake_adapter):
+    """测试完成的任务在 TTL 后删除，响应只序列化一次"""
+    queue = JobQueue(workers=1, max_pending=10, result_ttl=60, clock=clock)
+    record = queue.submit([make_spec("tiler")], KIND_SCRAPE)
+    await wait_finished(queue, record)
+
+    first = record.response_bytes()
+    assert record.response_bytes() is first
+
+    clock.now += 61
+    assert queue.get(record.job_id) is None
+    await queue.stop()
+
+
+def test_jobs_endpoints(fake_adapter):
+    """测试 POST /jobs 立即返回，GET /jobs/{id} 轮询到结果"""
+    fake_adapter.delay = 0.02
+    with TestClient(app) as client:
+        submitted = client.post("/jobs", json={"platform": "seek", "keywords": "tiler", "location": "Adelaide"})
+        assert submitted.status_code == 202
+        job = submitted.json()
+        assert job["kind"] == "scrape"
+        assert job["status_url"] == f"/jobs/{job['job_id']}"
+
+        batch = client.post("/jobs", json={"specs": [
+            {"platform": "seek", "keywords": "tiler", "location": "Adelaide"},
+            {"platform": "indeed", "keywords": "plumber", "location": "Adelaide"},
+        ]}).json()
+        assert batch["kind"] == "batch"
+
+        deadline = time.monotonic() + 2
+        while True:
+            status = client.get(job["status_url"]).json()
+            if status["status"] in ("succeeded", "failed") or time.monotonic() > deadline:
+                break
+            time.sleep(0.01)
+
+        assert status["status"] == "succeeded"
+        assert status["result"]["count"] == 2
+        assert client.get("/jobs/does-not-exist").status_code == 404
+
+
+def test_jobs_endpoint_rejects_invalid_body():
+    """测试既不是单个抓取也不是批量抓取的请求体返回 422"""
+    client = TestClient(app)
+
+    assert client.post("/jobs", json={"keywords": "tiler"}).status_code == 422
+    assert client.post("/jobs", json={"specs": []}).status_code == 422
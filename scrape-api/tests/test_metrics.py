@@ -0,0 +1,106 @@
+"""
+测试 metrics.py 模块和 /metrics 端点
+
+测试请求计数、阶段耗时、上游字节数、去重和转换失败计数
+"""
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.adapters.seek_adapter import SeekAdapter
+from app.main import app
+from app.models.job_posting_dto import ScrapeRequest
+from app.services import metrics
+
+
+def sample(name, **labels):
+    """读取指标当前值（不存在时为 0）"""
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_request_timer_records_once():
+    """测试 RequestTimer 只记录一次请求数、耗时和职位数"""
+    before = sample("scrape_requests_total", platform="seek", endpoint="test", outcome="success")
+    jobs_before = sample("scrape_jobs_returned_total", platform="seek", endpoint="test")
+
+    timer = metrics.RequestTimer("seek", "test")
+    timer.finish(metrics.SUCCESS, 3)
+    timer.finish(metrics.ERROR)
+
+    assert sample("scrape_requests_total", platform="seek", endpoint="test", outcome="success") == before + 1
+    assert sample("scrape_requests_total", platform="seek", endpoint="test", outcome="error") == 0
+    assert sample("scrape_jobs_returned_total", platform="seek", endpoint="test") == jobs_before + 3
+
+
+@pytest.mark.asyncio
+async def test_seek_adapter_records_stages():
+    """测试 SEEK 抓取记录上游耗时、字节数、解析、转换、去重和转换失败"""
+    payload = {
+        "data": [
+            {"id": "1", "title": "Plumber"},
+            {"id": "1", "title": "Plumber"},  # 重复
+            {"id": "2"},  # 缺少标题，转换失败
+        ],
+        "totalCount": 3,
+    }
+    adapter = SeekAdapter(http_client=httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json=payload))
+    ))
+
+    fetch_before = sample("scrape_upstream_fetch_seconds_count", platform="seek")
+    bytes_before = sample("scrape_upstream_bytes_total", platform="seek")
+    validation_before = sample("scrape_validation_seconds_count", platform="seek")
+    transform_before = sample("scrape_transform_seconds_count", platform="seek")
+    duplicates_before = sample("scrape_duplicates_removed_total", platform="seek")
+    failures_before = sample(
+        "scrape_transform_failures_total", platform="seek", exception="ScraperValidationError"
+    )
+
+    jobs = await adapter.scrape_async(ScrapeRequest(keywords="plumber", location="Sydney", max_results=3))
+
+    assert len(jobs) == 1
+    assert sample("scrape_upstream_fetch_seconds_count", platform="seek") == fetch_before + 1
+    assert sample("scrape_upstream_bytes_total", platform="seek") > bytes_before
+    assert sample("scrape_validation_seconds_count", platform="seek") == validation_before + 1
+    assert sample("scrape_transform_seconds_count", platform="seek") == transform_before + 2
+    assert sample("scrape_duplicates_removed_total", platform="seek") == duplicates_before + 1
+    assert sample(
+        "scrape_transform_failures_total", platform="seek", exception="ScraperValidationError"
+    ) == failures_before + 1
+
+
+def test_scrape_endpoint_records_request_metrics(fake_adapter):
+    """测试 /scrape/seek 记录请求结果、返回职位数和序列化耗时"""
+    success_before = sample("scrape_requests_total", platform="seek", endpoint="scrape", outcome="success")
+    error_before = sample("scrape_requests_total", platform="seek", endpoint="scrape", outcome="error")
+    jobs_before = sample("scrape_jobs_returned_total", platform="seek", endpoint="scrape")
+    serialization_before = sample("scrape_serialization_seconds_count", platform="seek", endpoint="scrape")
+
+    client = TestClient(app)
+    ok = client.post("/scrape/seek", json={"keywords": "tiler", "location": "Adelaide"})
+    failed = client.post("/scrape/seek", json={"keywords": "broken", "location": "Adelaide"})
+
+    assert ok.status_code == 200
+    assert ok.json()["count"] == 2
+    assert failed.status_code == 500
+    assert sample("scrape_requests_total", platform="seek", endpoint="scrape", outcome="success") == success_before + 1
+    assert sample("scrape_requests_total", platform="seek", endpoint="scrape", outcome="error") == error_before + 1
+    assert sample("scrape_jobs_returned_total", platform="seek", endpoint="scrape") == jobs_before + 2
+    assert sample(
+        "scrape_serialization_seconds_count", platform="seek", endpoint="scrape"
+    ) == serialization_before + 1
+
+
+def test_metrics_endpoint():
+    """测试 /metrics 返回 Prometheus 文本格式"""
+    client = TestClient(app)
+    metrics.RequestTimer("indeed", "scrape").finish(metrics.SUCCESS, 1)
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'scrape_requests_total{endpoint="scrape",outcome="success",platform="indeed"}' in response.text
+    assert "scrape_request_duration_seconds_bucket" in response.text
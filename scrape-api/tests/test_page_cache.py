@@ -0,0 +1,290 @@
+"""
+测试 page_cache.py 模块
+
+测试磁盘页面缓存：读写、TTL、按大小淘汰、跨实例共享、页面存放时间的报告，
+以及 SEEK / Indeed 适配器的缓存命中
+"""
+
+import json
+import threading
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.adapters import indeed_adapter
+from app.adapters.indeed_adapter import IndeedAdapter
+from app.adapters.seek_adapter import SeekAdapter
+from app.config.settings import settings
+from app.models.job_posting_dto import ScrapeRequest
+from app.services import page_cache as page_cache_module
+from app.services import scrape_service
+from app.services.page_cache import PageCache, params_key
+from app.services.timings import collect
+
+
+@pytest.fixture
+def clock_start():
+    """页面缓存记录墙钟时间"""
+    return 1_700_000_000.0
+
+
+def make_cache(tmp_path, clock=None, **overrides):
+    """创建使用临时数据库的页面缓存"""
+    options = dict(
+        path=str(tmp_path / "cache" / "pages.sqlite3"),
+        max_bytes=1024 * 1024,
+        ttls={"seek": 60, "indeed": 300},
+    )
+    if clock is not None:
+        options["clock"] = clock
+    options.update(overrides)
+    return PageCache(**options)
+
+
+def test_params_key_ignores_order():
+    """测试参数键与参数顺序无关"""
+    assert params_key({"a": 1, "b": "x"}) == params_key({"b": "x", "a": 1})
+    assert params_key({"a": 1}) != params_key({"a": 2})
+
+
+def test_set_and_get(tmp_path):
+    """测试写入后读取，目录自动创建"""
+    cache = make_cache(tmp_path)
+    cache.set("seek", "key", 1, b'{"data": []}')
+    cache.set("seek", "key", 2, '{"data": [2]}')
+
+    assert cache.get("seek", "key", 1) == b'{"data": []}'
+    assert cache.get("seek", "key", 2) == b'{"data": [2]}'
+    assert cache.get("seek", "key", 3) is None
+    assert cache.get("indeed", "key", 1) is None
+    assert cache.hits == 2
+    assert cache.misses == 2
+
+
+def test_expired_page_is_removed(tmp_path, clock):
+    """测试超过平台 TTL 后未命中"""
+    cache = make_cache(tmp_path, clock)
+    cache.set("seek", "key", 1, b"seek")
+    cache.set("indeed", "key", 1, b"indeed")
+
+    clock.now += 120
+
+    assert cache.get("seek", "key", 1) is None
+    assert cache.get("indeed", "key", 1) == b"indeed"
+    assert cache.stats()["pages"] == 1
+
+
+def test_hit_age_recorded_in_request_timings(tmp_path, clock):
+    """测试命中的页的存放时间（最旧一页）累加到当前请求的耗时分解"""
+    cache = make_cache(tmp_path, clock)
+    cache.set("seek", "key", 1, b"old")
+    clock.now += 40
+    cache.set("seek", "key", 2, b"new")
+    clock.now += 5
+
+    with collect() as timings:
+        cache.get("seek", "key", 1)
+        cache.get("seek", "key", 2)
+
+    assert timings.page_cache_hits == 2
+    assert timings.page_cache_age == 45
+
+
+def test_bypass_skips_reads(tmp_path):
+    """测试 bypass() 内不读取缓存，仍可写入"""
+    cache = make_cache(tmp_path)
+    cache.set("seek", "key", 1, b"old")
+
+    with page_cache_module.bypass():
+        assert cache.get("seek", "key", 1) is None
+        cache.set("seek", "key", 1, b"new")
+
+    assert cache.get("seek", "key", 1) == b"new"
+
+
+def test_evicts_least_recently_accessed(tmp_path, clock):
+    """测试总大小超过上限时淘汰最久未访问的页"""
+    cache = make_cache(tmp_path, clock, max_bytes=250)
+
+    cache.set("seek", "key", 1, b"a" * 100)
+    clock.now += 1
+    cache.set("seek", "key", 2, b"b" * 100)
+    clock.now += 1
+    cache.get("seek", "key", 1)  # 第 1 页变为最近访问
+    clock.now += 1
+    cache.set("seek", "key", 3, b"c" * 100)
+
+    assert cache.get("seek", "key", 1) is not None
+    assert cache.get("seek", "key", 2) is None
+    assert cache.get("seek", "key", 3) is not None
+    assert cache.evictions == 1
+    assert cache.stats()["bytes"] == 200
+
+
+def test_oversized_page_not_cached(tmp_path):
+    """测试单页超过上限时不缓存"""
+    cache = make_cache(tmp_path, max_bytes=10)
+    cache.set("seek", "key", 1, b"x" * 11)
+
+    assert cache.get("seek", "key", 1) is None
+
+
+def test_shared_between_instances(tmp_path):
+    """测试同一个数据库文件在不同实例（不同 worker / 重启后）之间共享"""
+    writer = make_cache(tmp_path)
+    writer.set("seek", "key", 1, b"payload")
+    writer.close()
+
+    reader = make_cache(tmp_path)
+    assert reader.get("seek", "key", 1) == b"payload"
+
+    mode = reader._connect().execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode.lower() == "wal"
+
+
+def test_concurrent_writes_from_threads(tmp_path):
+    """测试多个线程并发写入（每个线程独立连接）"""
+    cache = make_cache(tmp_path)
+
+    def write(worker):
+        for page in range(20):
+            cache.set("seek", f"worker-{worker}", page, b"x" * 10)
+
+    threads = [threading.Thread(target=write, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert cache.errors == 0
+    assert cache.stats()["pages"] == 80
+
+
+def test_read_failure_falls_back(tmp_path):
+    """测试数据库无法打开时返回未命中而不是抛出异常"""
+    blocker = tmp_path / "blocker"
+    blocker.write_text("not a directory")
+    cache = PageCache(path=str(blocker / "pages.sqlite3"), max_bytes=1024, ttls={})
+
+    assert cache.get("seek", "key", 1) is None
+    cache.set("seek", "key", 1, b"payload")
+
+    assert cache.errors == 2
+
+
+@pytest.mark.asyncio
+async def test_seek_adapter_uses_page_cache(tmp_path):
+    """测试 SEEK 适配器命中页面缓存时不访问上游"""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json={
+            "data": [{"id": "1", "title": "Plumber"}],
+            "totalCount": 1
+        })
+
+    cache = make_cache(tmp_path)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    request = ScrapeRequest(keywords="plumber", location="Sydney")
+
+    first = await SeekAdapter(http_client=client, page_cache=cache).scrape_async(request)
+    # 新实例模拟重启后的进程
+    second = await SeekAdapter(http_client=client, page_cache=cache).scrape_async(request)
+
+    assert len(calls) == 1
+    assert [job.source_id for job in first] == [job.source_id for job in second] == ["1"]
+    assert cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_seek_adapter_ignores_invalid_cached_page(tmp_path):
+    """测试缓存内容无效时回退到访问上游"""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json={"data": [], "totalCount": 0})
+
+    cache = make_cache(tmp_path)
+    adapter = SeekAdapter(http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), page_cache=cache)
+    params = adapter._build_params("plumber", 50, "Sydney", page=1)
+    _, key, page = adapter._page_cache_slot(params)
+    cache.set("seek", key, page, b"not json")
+
+    await adapter._call_seek_api_async(params)
+
+    assert len(calls) == 1
+
+
+class FakeFrame:
+    """模拟 JobSpy 返回的 DataFrame（只实现适配器用到的方法）"""
+
+    def __init__(self, records):
+        self.records = records
+
+    def __len__(self):
+        return len(self.records)
+
+    def iterrows(self):
+        return enumerate(self.records)
+
+    def to_json(self, orient, date_format):
+        return json.dumps(self.records)
+
+
+def test_indeed_adapter_uses_page_cache(tmp_path, monkeypatch):
+    """测试 Indeed 适配器缓存 JobSpy 原始结果"""
+    calls = []
+
+    def fake_scrape_jobs(**kwargs):
+        calls.append(kwargs)
+        return FakeFrame([{"id": "in-1", "title": "Tiler", "company": "ABC", "location": "Adelaide, SA"}])
+
+    cache = make_cache(tmp_path)
+    monkeypatch.setattr(indeed_adapter, "scrape_jobs", fake_scrape_jobs)
+    monkeypatch.setattr(indeed_adapter, "get_page_cache", lambda: cache)
+    request = ScrapeRequest(keywords="tiler", location="Adelaide")
+
+    first = IndeedAdapter().scrape(request)
+    second = IndeedAdapter().scrape(request)
+
+    assert len(calls) == 1
+    assert [job.source_id for job in first] == [job.source_id for job in second] == ["in-1"]
+
+
+def test_get_page_cache_respects_setting(tmp_path, monkeypatch):
+    """测试全局页面缓存按配置创建"""
+    monkeypatch.setattr(page_cache_module, "_page_cache", None)
+    assert page_cache_module.get_page_cache() is None
+
+    monkeypatch.setattr(settings, "page_cache_enabled", True)
+    monkeypatch.setattr(settings, "page_cache_path", str(tmp_path / "global.sqlite3"))
+    cache = page_cache_module.get_page_cache()
+
+    assert cache is page_cache_module.get_page_cache()
+    assert cache.path == str(tmp_path / "global.sqlite3")
+    page_cache_module.close_page_cache()
+
+
+@pytest.mark.asyncio
+async def test_fetch_reports_page_cache_age(tmp_path, clock):
+    """测试由缓存页组成的结果报告 cache_hit 和页面的存放时间，结果缓存条目相应提前过期"""
+    cache = make_cache(tmp_path, clock)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json={
+        "data": [{"id": "1", "title": "Plumber"}],
+        "totalCount": 1
+    })))
+    request = ScrapeRequest(keywords="plumber", location="Sydney")
+
+    with patch.object(scrape_service, "get_adapter", lambda platform: SeekAdapter(http_client=client, page_cache=cache)):
+        fresh = await scrape_service.fetch("seek", request)
+        scrape_service.result_cache.clear()
+        clock.now += 50
+        cached = await scrape_service.fetch("seek", request)
+
+    assert not fresh.cache_hit and fresh.cache_age_seconds is None
+    assert cached.cache_hit
+    assert cached.cache_age_seconds == 50
+    assert scrape_service.result_cache.get(scrape_service.request_key("seek", request)).age >= 50
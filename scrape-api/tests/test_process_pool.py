@@ -0,0 +1,171 @@
+"""
+测试 process_pool.py 模块
+
+测试 worker 进程执行、按代回收、超时、请求截止时间，以及 Indeed 适配器通过进程池抓取
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.adapters import indeed_adapter
+from app.adapters.indeed_adapter import IndeedAdapter
+from app.exceptions import DeadlineExceededError, ScraperTimeoutError
+from app.models.job_posting_dto import ScrapeRequest
+from app.services import deadline, process_pool
+from app.services.process_pool import ProcessPool, worker_pid
+
+
+def wait_until(predicate, timeout=5.0):
+    """轮询直到 predicate() 为真（超时返回 False）"""
+    expires_at = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > expires_at:
+            return False
+        time.sleep(0.05)
+    return True
+
+
+def pid_exists(pid):
+    """进程是否存在"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+def make_pool(**overrides):
+    """创建测试用进程池（单进程）"""
+    options = dict(name="test", workers=1, max_jobs_per_worker=0, timeout=30)
+    options.update(overrides)
+    return ProcessPool(**options)
+
+
+def test_call_runs_in_worker_process():
+    """测试调用在独立进程中执行，同一代复用同一进程"""
+    pool = make_pool()
+    try:
+        first = pool.call(worker_pid)
+        second = pool.call(worker_pid)
+    finally:
+        pool.shutdown()
+
+    assert first == second
+    assert first != process_pool.os.getpid()
+    assert pool.stats()["calls"] == 2
+    assert pool.stats()["generation"] == 1
+
+
+def test_workers_recycled_after_max_jobs():
+    """测试达到 max_jobs 后换一代进程池"""
+    pool = make_pool(max_jobs_per_worker=2)
+    try:
+        pids = [pool.call(worker_pid) for _ in range(3)]
+    finally:
+        pool.shutdown()
+
+    assert pids[0] == pids[1]
+    assert pids[2] != pids[0]
+    assert pool.stats()["recycles"] == 1
+    assert pool.stats()["generation"] == 2
+
+
+def test_timeout_replaces_pool():
+    """测试超时抛出 ScraperTimeoutError 并更换进程池"""
+    pool = make_pool(timeout=0.2)
+    try:
+        with pytest.raises(ScraperTimeoutError):
+            pool.call(time.sleep, 2)
+        assert pool.stats()["failures"] == 1
+        assert pool.stats()["recycles"] == 1
+    finally:
+        pool.shutdown(wait=False)
+
+
+def test_timeout_terminates_stuck_worker():
+    """测试超时后卡住的 worker 进程被终止，新进程池使用新的进程"""
+    pool = make_pool(timeout=0.5)
+    try:
+        stuck_pid = pool.call(worker_pid)
+        with pytest.raises(ScraperTimeoutError):
+            pool.call(time.sleep, 30)
+
+        assert wait_until(lambda: not pid_exists(stuck_pid))
+        assert pool.call(worker_pid) != stuck_pid
+    finally:
+        pool.shutdown(wait=False)
+
+
+def test_timeout_spares_concurrent_calls():
+    """测试一次调用超时不影响同一代中正在执行的其他调用，卡住的进程在它们结束后才被终止"""
+    pool = make_pool(workers=2, timeout=2)
+    try:
+        with ThreadPoolExecutor(max_workers=2) as threads:
+            stuck = threads.submit(pool.call, time.sleep, 30)
+            time.sleep(1)
+            healthy = threads.submit(pool.call, time.sleep, 1.5)
+            assert wait_until(lambda: len(pool._executor._processes) == 2)
+            processes = list(pool._executor._processes.values())
+
+            with pytest.raises(ScraperTimeoutError):
+                stuck.result()
+            assert all(process.is_alive() for process in processes)
+            assert healthy.result() is None
+
+        assert wait_until(lambda: not any(process.is_alive() for process in processes))
+        assert pool.stats()["failures"] == 1
+        assert pool.call(worker_pid) not in {process.pid for process in processes}
+    finally:
+        pool.shutdown(wait=False)
+
+
+def test_request_deadline_keeps_pool():
+    """测试请求的截止时间先到时抛出 DeadlineExceededError，不计失败、不更换进程池"""
+    pool = make_pool(timeout=30)
+    try:
+        with deadline.scope(deadline.Deadline(0.2)):
+            with pytest.raises(DeadlineExceededError):
+                pool.call(time.sleep, 2)
+        assert pool.stats()["failures"] == 0
+        assert pool.stats()["recycles"] == 0
+    finally:
+        pool.shutdown(wait=False)
+
+
+def test_disabled_when_no_workers():
+    """测试 indeed_process_workers=0 时不创建进程池"""
+    assert process_pool.get_indeed_process_pool() is None
+
+
+class FakePool:
+    """在当前进程内返回 JSON records 的进程池"""
+
+    def __init__(self, records):
+        self.records = records
+        self.calls = []
+
+    def call(self, func, *args):
+        self.calls.append((func, args))
+        return json.dumps(self.records)
+
+
+def test_indeed_adapter_uses_process_pool(monkeypatch):
+    """测试启用进程池时适配器从 worker 结果（JSON records）转换职位"""
+    pool = FakePool([
+        {"id": "in-1", "title": "Tiler", "company": "ABC", "location": "Adelaide, SA", "job_type": "fulltime"},
+        {"id": "in-2", "title": "Plumber", "company": "XYZ", "location": "Sydney, NSW"},
+    ])
+    monkeypatch.setattr(indeed_adapter, "get_indeed_process_pool", lambda: pool)
+    monkeypatch.setattr(indeed_adapter, "scrape_jobs", None)  # API 进程内不需要 JobSpy
+
+    jobs = IndeedAdapter().scrape(ScrapeRequest(keywords="tiler", location="Adelaide", max_results=10))
+
+    assert [job.source_id for job in jobs] == ["in-1", "in-2"]
+    func, (query,) = pool.calls[0]
+    assert func is process_pool.scrape_jobs_serialized
+    assert query["search_term"] == "tiler"
+    assert query["results_wanted"] == 10
@@ -0,0 +1,168 @@
+"""
+测试 profiler.py 模块和 /admin/profile 端点
+
+测试管理令牌校验、cProfile / 采样剖析的输出格式和剖析器互斥
+"""
+
+import marshal
+import re
+import threading
+
+import httpx
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+
+from app.adapters.seek_adapter import SeekAdapter
+from app.config.settings import settings
+from app.main import app
+from app.services import scrape_service
+from app.services.profiler import (
+    MODE_SAMPLE,
+    ProfilerBusyError,
+    ProfileSession,
+    SamplingProfiler,
+    validate_options,
+)
+
+ADMIN_HEADERS = {"X-Admin-Token": "secret"}
+SCRAPE_BODY = {"keywords": "plumber", "location": "Sydney", "max_results": 2}
+
+
+@pytest.fixture
+def admin_token(monkeypatch):
+    """启用管理端点"""
+    monkeypatch.setattr(settings, "admin_token", "secret")
+
+
+@pytest.fixture
+def seek_adapter():
+    """使用模拟 SEEK API 的适配器"""
+    payload = {
+        "data": [{"id": "1", "title": "Plumber"}, {"id": "2", "title": "Tiler"}],
+        "totalCount": 2,
+    }
+    adapter = SeekAdapter(http_client=httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json=payload))
+    ))
+    with patch.object(scrape_service, "get_adapter", lambda platform: adapter):
+        yield adapter
+
+
+def busy_loop(stop: threading.Event):
+    """持续占用 CPU 的线程函数"""
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def test_validate_options():
+    """测试剖析参数校验"""
+    validate_options("cprofile", "pstats", "tottime")
+    validate_options("sample", "collapsed")
+
+    with pytest.raises(ValueError):
+        validate_options("perf", "text")
+    with pytest.raises(ValueError):
+        validate_options("cprofile", "collapsed")
+    with pytest.raises(ValueError):
+        validate_options("cprofile", "text", "bogus")
+
+
+def test_sampling_profiler_records_busy_threads():
+    """测试采样剖析记录忙碌线程的调用栈，跳过空闲线程"""
+    stop = threading.Event()
+    idle = threading.Event()
+    busy = threading.Thread(target=busy_loop, args=(stop,), name="busy-worker")
+    waiting = threading.Thread(target=idle.wait, name="idle-worker")
+    busy.start()
+    waiting.start()
+
+    try:
+        profiler = SamplingProfiler(interval=0.001)
+        for _ in range(5):
+            profiler.sample()
+    finally:
+        stop.set()
+        idle.set()
+        busy.join()
+        waiting.join()
+
+    collapsed = profiler.collapsed()
+    assert re.search(r"^busy-worker;.*busy_loop \(test_profiler\.py:\d+\).* \d+$", collapsed, re.MULTILINE)
+    assert "idle-worker" not in collapsed
+    assert "busy_loop" in profiler.text(limit=100)
+
+
+def test_profile_session_is_exclusive():
+    """测试同一时间只允许一个剖析"""
+    with ProfileSession(MODE_SAMPLE, interval=0.01):
+        with pytest.raises(ProfilerBusyError):
+            with ProfileSession():
+                pass
+
+    with ProfileSession():
+        pass
+
+
+def test_admin_endpoints_require_token(monkeypatch):
+    """测试未配置令牌时端点不存在，令牌错误时拒绝"""
+    client = TestClient(app)
+
+    assert client.get("/admin/profile", params={"seconds": 0.01}).status_code == 404
+
+    monkeypatch.setattr(settings, "admin_token", "secret")
+    assert client.get("/admin/profile", params={"seconds": 0.01}).status_code == 403
+    assert client.get(
+        "/admin/profile", params={"seconds": 0.01}, headers={"X-Admin-Token": "wrong"}
+    ).status_code == 403
+
+
+def test_profile_scrape_cprofile_text(admin_token, seek_adapter):
+    """测试 cProfile 剖析一次 SEEK 抓取，报告包含 _transform_job"""
+    client = TestClient(app)
+
+    response = client.post(
+        "/admin/profile/seek",
+        json=SCRAPE_BODY,
+        params={"sort": "tottime", "limit": 500},
+        headers=ADMIN_HEADERS,
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert response.headers["X-Profile-Jobs"] == "2"
+    assert "_transform_job" in response.text
+    assert "Ordered by: internal time" in response.text
+
+
+def test_profile_scrape_pstats_file(admin_token, seek_adapter):
+    """测试 format=pstats 返回可被 pstats 读取的原始数据"""
+    client = TestClient(app)
+
+    response = client.post(
+        "/admin/profile/seek", json=SCRAPE_BODY, params={"format": "pstats"}, headers=ADMIN_HEADERS
+    )
+
+    assert response.status_code == 200
+    assert "seek-scrape.pstats" in response.headers["Content-Disposition"]
+    stats = marshal.loads(response.content)
+    assert any(func[2] == "_transform_job" for func in stats)
+
+
+def test_profile_window_and_invalid_options(admin_token, monkeypatch):
+    """测试按时间剖析、参数校验和时长上限"""
+    monkeypatch.setattr(settings, "profile_max_seconds", 1.0)
+    client = TestClient(app)
+
+    response = client.get(
+        "/admin/profile",
+        params={"seconds": 0.05, "mode": "sample", "format": "collapsed"},
+        headers=ADMIN_HEADERS,
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+
+    assert client.get(
+        "/admin/profile", params={"seconds": 0.05, "format": "collapsed"}, headers=ADMIN_HEADERS
+    ).status_code == 400
+    assert client.get("/admin/profile", params={"seconds": 5}, headers=ADMIN_HEADERS).status_code == 400
@@ -0,0 +1,201 @@
+"""
+测试 rate_limiter.py 模块
+
+测试令牌桶的突发 / 补充 / 等待时间计算、取消后重新计算等待、截止时间、按平台配置创建、适配器调用前取令牌
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.adapters.seek_adapter import SeekAdapter
+from app.config.settings import settings
+from app.exceptions import DeadlineExceededError
+from app.models.job_posting_dto import ScrapeRequest
+from app.services import deadline, rate_limiter
+from app.services.rate_limiter import RateLimiters, TokenBucket, throttle, throttle_sync
+
+
+def test_burst_is_immediate(clock):
+    """测试突发上限内的请求无需等待"""
+    bucket = TokenBucket(rate=1.0, burst=3, clock=clock)
+
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.throttled == 0
+
+
+def test_wait_grows_with_debt(clock):
+    """测试令牌用完后等待时间按欠额递增"""
+    bucket = TokenBucket(rate=2.0, burst=1, clock=clock)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+    assert bucket.throttled == 2
+    assert bucket.total_wait_seconds == pytest.approx(1.5)
+    assert bucket.max_wait_seconds == pytest.approx(1.0)
+
+
+def test_tokens_refill_up_to_burst(clock):
+    """测试令牌按速率补充，且不超过桶容量"""
+    bucket = TokenBucket(rate=1.0, burst=2, clock=clock)
+    bucket.reserve()
+    bucket.reserve()
+
+    clock.now += 10
+
+    assert bucket.stats()["tokens"] == 2
+    assert bucket.reserve() == 0.0
+
+
+def test_invalid_rate():
+    """测试速率必须为正"""
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0, burst=1)
+
+
+@pytest.mark.asyncio
+async def test_acquire_paces_concurrent_callers():
+    """测试并发调用方被均匀分散"""
+    bucket = TokenBucket(rate=50.0, burst=1)
+    started = time.monotonic()
+
+    waits = await asyncio.gather(*[bucket.acquire() for _ in range(4)])
+
+    elapsed = time.monotonic() - started
+    assert sorted(waits)[0] == 0.0
+    assert elapsed >= 0.05
+    assert bucket.throttled == 3
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_refunds_token(clock):
+    """测试等待中被取消时归还令牌"""
+    bucket = TokenBucket(rate=1.0, burst=1, clock=clock)
+    bucket.reserve()
+
+    waiter = asyncio.ensure_future(bucket.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    clock.now += 1
+    assert bucket.reserve() == 0.0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_moves_later_waiters_up():
+    """测试排在前面的等待方被取消后，后面的等待方提前取得令牌"""
+    bucket = TokenBucket(rate=5.0, burst=1)
+    bucket.reserve()
+
+    first = asyncio.ensure_future(bucket.acquire())
+    second = asyncio.ensure_future(bucket.acquire())
+    await asyncio.sleep(0)
+    started = time.monotonic()
+    first.cancel()
+
+    waited = await second
+
+    assert time.monotonic() - started < 0.35
+    assert waited == pytest.approx(0.2, abs=0.05)
+
+
+def test_cancelled_waiter_wakes_sync_waiters():
+    """测试异步等待方被取消后，线程中阻塞等待的调用方同样提前取得令牌"""
+    bucket = TokenBucket(rate=5.0, burst=1)
+    bucket.reserve()
+
+    async def cancel_first():
+        first = asyncio.ensure_future(bucket.acquire())
+        await asyncio.sleep(0)
+        second = asyncio.get_running_loop().run_in_executor(None, bucket.acquire_sync)
+        await asyncio.sleep(0.05)
+        first.cancel()
+        return await second
+
+    started = time.monotonic()
+    asyncio.run(cancel_first())
+
+    assert time.monotonic() - started < 0.35
+
+
+@pytest.fixture
+def slow_seek_bucket(monkeypatch):
+    """SEEK 每 10 秒一个令牌（不允许突发）"""
+    monkeypatch.setattr(settings, "rate_limit_enabled", True)
+    monkeypatch.setattr(settings, "seek_request_delay", 10)
+    monkeypatch.setattr(settings, "seek_rate_limit_burst", 1)
+    monkeypatch.setattr(rate_limiter, "rate_limiters", RateLimiters())
+
+
+@pytest.mark.asyncio
+async def test_throttle_respects_deadline(slow_seek_bucket):
+    """测试需要等待的时间超过剩余预算时立即抛出 DeadlineExceededError，不占用令牌"""
+    with deadline.scope(deadline.Deadline(0.5)) as current:
+        assert await throttle("seek") == 0.0
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceededError):
+            await throttle("seek")
+
+    assert time.monotonic() - started < 0.1
+    assert current.exceeded
+    assert rate_limiter.rate_limiters.get("seek").stats()["tokens"] == pytest.approx(0, abs=0.01)
+
+
+def test_throttle_sync_respects_deadline(slow_seek_bucket):
+    """测试同步版本同样不等待超过剩余预算"""
+    with deadline.scope(deadline.Deadline(0.5)) as current:
+        throttle_sync("seek")
+        with pytest.raises(DeadlineExceededError):
+            throttle_sync("seek")
+
+    assert current.exceeded
+
+
+def test_registry_builds_from_settings(monkeypatch):
+    """测试按 {platform}_request_delay / _rate_limit_burst 创建令牌桶"""
+    monkeypatch.setattr(settings, "rate_limit_enabled", True)
+    monkeypatch.setattr(settings, "seek_request_delay", 0.5)
+    monkeypatch.setattr(settings, "seek_rate_limit_burst", 4)
+    monkeypatch.setattr(settings, "indeed_request_delay", 0)
+    limiters = RateLimiters()
+
+    seek = limiters.get("seek")
+
+    assert seek.rate == 2.0
+    assert seek.burst == 4
+    assert limiters.get("seek") is seek
+    assert limiters.get("indeed") is None
+    assert set(limiters.stats()) == {"seek"}
+
+
+def test_registry_disabled():
+    """测试关闭限流时不创建令牌桶"""
+    assert RateLimiters().get("seek") is None
+
+
+@pytest.mark.asyncio
+async def test_seek_adapter_acquires_token_per_page(monkeypatch):
+    """测试 SEEK 适配器每次上游请求前取令牌"""
+    monkeypatch.setattr(settings, "rate_limit_enabled", True)
+    monkeypatch.setattr(settings, "seek_request_delay", 0.001)
+    monkeypatch.setattr(rate_limiter, "rate_limiters", RateLimiters())
+
+    def handler(request):
+        page = int(request.url.params["page"])
+        return httpx.Response(200, json={
+            "data": [{"id": f"{page}-{i}", "title": "Plumber"} for i in range(10)],
+            "totalCount": 30
+        })
+
+    adapter = SeekAdapter(http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(settings, "seek_page_size", 10)
+
+    jobs = await adapter.scrape_async(ScrapeRequest(keywords="plumber", location="Sydney", max_results=30))
+
+    assert len(jobs) == 30
+    assert rate_limiter.rate_limiters.get("seek").acquired == 3
@@ -0,0 +1,116 @@
+"""
+测试 registry.py 模块
+
+测试适配器注册表：自动发现、单实例、启动预热、关闭
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.adapters.base_adapter import BaseJobAdapter
+from app.adapters.indeed_adapter import IndeedAdapter
+from app.adapters.registry import AdapterRegistry, discover_adapter_classes
+from app.adapters.seek_adapter import SeekAdapter
+from app.exceptions import ScraperConfigurationError
+from app.main import app
+from app.models.job_posting_dto import PlatformEnum
+
+
+class FakeAdapter(BaseJobAdapter):
+    """记录生命周期调用的适配器"""
+
+    def __init__(self, name="fake", fail_warmup=False):
+        self.name = name
+        self.fail_warmup = fail_warmup
+        self.calls = []
+        super().__init__()
+
+    @property
+    def platform_name(self) -> str:
+        return self.name
+
+    def scrape(self, request):
+        return []
+
+    async def warmup(self):
+        self.calls.append("warmup")
+        if self.fail_warmup:
+            raise RuntimeError("warm-up failed")
+
+    async def aclose(self):
+        self.calls.append("aclose")
+
+
+def test_discover_adapter_classes():
+    """测试发现 app.adapters 下的所有适配器（不包括测试中定义的子类）"""
+    classes = discover_adapter_classes()
+
+    assert SeekAdapter in classes
+    assert IndeedAdapter in classes
+    assert FakeAdapter not in classes
+
+
+def test_get_returns_shared_instance():
+    """测试同一平台返回同一个实例"""
+    registry = AdapterRegistry()
+
+    assert registry.get("seek") is registry.get("seek")
+    assert isinstance(registry.get(PlatformEnum.INDEED), IndeedAdapter)
+    assert set(registry.platforms) >= {"seek", "indeed"}
+
+
+def test_get_unknown_platform():
+    """测试不支持的平台抛出 ScraperConfigurationError"""
+    registry = AdapterRegistry()
+
+    with pytest.raises(ScraperConfigurationError):
+        registry.get("linkedin")
+
+
+@pytest.mark.asyncio
+async def test_startup_warms_and_shutdown_closes():
+    """测试启动时预热、关闭时释放"""
+    registry = AdapterRegistry()
+    fake = FakeAdapter()
+    registry._load()
+    registry.register(fake)
+
+    await registry.startup()
+    assert fake.calls == ["warmup"]
+
+    await registry.shutdown()
+    assert fake.calls == ["warmup", "aclose"]
+
+
+@pytest.mark.asyncio
+async def test_startup_survives_warmup_failure():
+    """测试单个适配器预热失败不影响其他适配器"""
+    registry = AdapterRegistry()
+    registry._load()
+    broken = FakeAdapter("broken", fail_warmup=True)
+    healthy = FakeAdapter("healthy")
+    registry.register(broken)
+    registry.register(healthy)
+
+    await registry.startup()
+
+    assert healthy.calls == ["warmup"]
+    assert registry.get("broken") is broken
+
+
+@pytest.mark.asyncio
+async def test_builtin_adapters_warmup_without_network():
+    """测试内置适配器的预热不访问上游"""
+    registry = AdapterRegistry()
+    await registry.startup()
+    await registry.shutdown()
+
+
+def test_app_lifespan_uses_registry():
+    """测试应用启动后端点使用注册表中的适配器"""
+    from app.adapters.registry import adapter_registry
+
+    with TestClient(app) as client:
+        seek = adapter_registry.get("seek")
+        assert client.get("/health").status_code == 200
+        assert adapter_registry.get("seek") is seek
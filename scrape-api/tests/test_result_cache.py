@@ -0,0 +1,246 @@
+"""
+测试 result_cache.py 模块和抓取服务的缓存行为
+
+测试 TTL、LRU 淘汰（条目数 / 字节数）、stale-while-revalidate、响应中的缓存信息
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+
+from app.config.settings import settings
+from app.main import app
+from app.models.job_posting_dto import JobPostingDTO, ScrapeRequest
+from app.services import scrape_service
+from app.services.result_cache import ResultCache, estimate_size
+
+
+def make_jobs(count, description=""):
+    """创建测试用职位列表"""
+    return [
+        JobPostingDTO(source="seek", source_id=str(i), title="Tiler", company="ABC", description=description)
+        for i in range(count)
+    ]
+
+
+def make_cache(clock, **overrides):
+    """创建测试用缓存"""
+    options = dict(
+        max_entries=10,
+        max_bytes=1024 * 1024,
+        ttls={"seek": 60, "indeed": 300},
+        stale_ttl=30,
+        clock=clock,
+    )
+    options.update(overrides)
+    return ResultCache(**options)
+
+
+def test_get_fresh_entry(clock):
+    """测试 TTL 内命中"""
+    cache = make_cache(clock)
+    cache.set("key", "seek", make_jobs(2))
+
+    clock.now += 10
+    lookup = cache.get("key")
+
+    assert lookup is not None
+    assert len(lookup.jobs) == 2
+    assert lookup.age == 10
+    assert lookup.stale is False
+    assert cache.hits == 1
+
+
+def test_get_stale_entry(clock):
+    """测试超过 TTL 但在 stale 窗口内返回 stale"""
+    cache = make_cache(clock)
+    cache.set("key", "seek", make_jobs(1))
+
+    clock.now += 70
+    lookup = cache.get("key")
+
+    assert lookup.stale is True
+    assert cache.stale_hits == 1
+
+
+def test_get_expired_entry(clock):
+    """测试超过 TTL + stale 窗口后未命中并删除"""
+    cache = make_cache(clock)
+    cache.set("key", "seek", make_jobs(1))
+
+    clock.now += 100
+
+    assert cache.get("key") is None
+    assert len(cache) == 0
+    assert cache.size_bytes == 0
+
+
+def test_per_platform_ttl(clock):
+    """测试按平台配置 TTL"""
+    cache = make_cache(clock, stale_ttl=0)
+    cache.set("seek-key", "seek", make_jobs(1))
+    cache.set("indeed-key", "indeed", make_jobs(1))
+
+    clock.now += 120
+
+    assert cache.get("seek-key") is None
+    assert cache.get("indeed-key") is not None
+
+
+def test_evict_by_entry_count(clock):
+    """测试超过条目数时淘汰最久未使用的条目"""
+    cache = make_cache(clock, max_entries=2)
+    cache.set("a", "seek", make_jobs(1))
+    cache.set("b", "seek", make_jobs(1))
+    cache.get("a")  # a 变为最近使用
+    cache.set("c", "seek", make_jobs(1))
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+    assert cache.evictions == 1
+
+
+def test_evict_by_bytes(clock):
+    """测试超过字节上限时淘汰"""
+    jobs = make_jobs(1, description="x" * 1000)
+    size = estimate_size(jobs)
+    cache = make_cache(clock, max_bytes=size * 2)
+
+    cache.set("a", "seek", jobs)
+    cache.set("b", "seek", jobs)
+    cache.set("c", "seek", jobs)
+
+    assert len(cache) == 2
+    assert cache.size_bytes == size * 2
+    assert cache.get("a") is None
+
+
+def test_oversized_entry_not_cached(clock):
+    """测试单个条目超过上限时不缓存"""
+    cache = make_cache(clock, max_bytes=100)
+    cache.set("a", "seek", make_jobs(5))
+
+    assert len(cache) == 0
+
+
+def test_returned_list_is_a_copy(clock):
+    """测试返回的列表与缓存内部列表相互独立"""
+    cache = make_cache(clock)
+    cache.set("a", "seek", make_jobs(2))
+
+    cache.get("a").jobs.clear()
+
+    assert len(cache.get("a").jobs) == 2
+
+
+class CountingAdapter:
+    """记录调用次数的适配器"""
+
+    def __init__(self, delay=0.0):
+        self.calls = 0
+        self.delay = delay
+
+    async def scrape_async(self, request):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return make_jobs(self.calls)
+
+
+@pytest.mark.asyncio
+async def test_fetch_serves_from_cache():
+    """测试第二次相同请求命中缓存"""
+    adapter = CountingAdapter()
+    request = ScrapeRequest(keywords="tiler", location="Adelaide")
+
+    with patch.object(scrape_service, "get_adapter", lambda platform: adapter):
+        first = await scrape_service.fetch("seek", request)
+        second = await scrape_service.fetch("seek", request)
+
+    assert adapter.calls == 1
+    assert first.cache_hit is False
+    assert second.cache_hit is True
+    assert second.cache_age_seconds is not None
+    assert len(second.jobs) == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_stale_while_revalidate(clock):
+    """测试 stale 命中返回旧数据，并只触发一次后台刷新"""
+    adapter = CountingAdapter(delay=0.01)
+    request = ScrapeRequest(keywords="tiler", location="Adelaide")
+    cache = make_cache(clock)
+
+    with patch.object(scrape_service, "get_adapter", lambda platform: adapter), \
+            patch.object(scrape_service, "result_cache", cache):
+        await scrape_service.fetch("seek", request)
+        clock.now += 70  # 进入 stale 窗口
+
+        stale_results = await asyncio.gather(
+            scrape_service.fetch("seek", request),
+            scrape_service.fetch("seek", request),
+        )
+        assert all(result.stale and result.cache_hit for result in stale_results)
+        assert len(stale_results[0].jobs) == 1
+
+        await asyncio.gather(*scrape_service._background_tasks)
+        refreshed = await scrape_service.fetch("seek", request)
+
+    assert adapter.calls == 2
+    assert refreshed.stale is False
+    assert len(refreshed.jobs) == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_does_not_cache_errors():
+    """测试失败的抓取不写入缓存"""
+    class FailingAdapter:
+        calls = 0
+
+        async def scrape_async(self, request):
+            FailingAdapter.calls += 1
+            raise RuntimeError("upstream failed")
+
+    request = ScrapeRequest(keywords="tiler", location="Adelaide")
+    with patch.object(scrape_service, "get_adapter", lambda platform: FailingAdapter()):
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await scrape_service.fetch("seek", request)
+
+    assert FailingAdapter.calls == 2
+
+
+def test_fetch_cache_disabled():
+    """测试关闭缓存后每次都抓取"""
+    adapter = CountingAdapter()
+    request = ScrapeRequest(keywords="tiler", location="Adelaide")
+
+    async def run():
+        await scrape_service.fetch("seek", request)
+        return await scrape_service.fetch("seek", request)
+
+    with patch.object(scrape_service, "get_adapter", lambda platform: adapter), \
+            patch.object(settings, "result_cache_enabled", False):
+        outcome = asyncio.run(run())
+
+    assert adapter.calls == 2
+    assert outcome.cache_hit is False
+
+
+def test_endpoint_reports_cache_hit():
+    """测试 /scrape/seek 响应中包含缓存信息"""
+    adapter = CountingAdapter()
+    client = TestClient(app)
+    payload = {"keywords": "tiler", "location": "Adelaide"}
+
+    with patch.object(scrape_service, "get_adapter", lambda platform: adapter):
+        first = client.post("/scrape/seek", json=payload).json()
+        second = client.post("/scrape/seek", json=payload).json()
+
+    assert first["cache_hit"] is False
+    assert first["cache_age_seconds"] is None
+    assert second["cache_hit"] is True
+    assert second["cache_age_seconds"] >= 0
+    assert second["scraped_at"] == first["scraped_at"]
@@ -0,0 +1,214 @@
+"""
+测试 retry.py 模块
+
+测试异常分类、Retry-After 解析、指数退避 + 抖动、总时间预算，以及 SEEK 单页重试
+"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.adapters.seek_adapter import SeekAdapter
+from app.config.settings import settings
+from app.exceptions import (
+    PlatformException,
+    RateLimitException,
+    ScraperDataError,
+    ScraperNetworkError,
+    ScraperNotFoundError,
+    ScraperTimeoutError,
+    classify_http_error,
+)
+from app.models.job_posting_dto import ScrapeRequest
+from app.services.retry import Retrier, classify_retryable, parse_retry_after
+
+
+@pytest.fixture
+def retry_settings(monkeypatch):
+    """启用重试，等待时间缩短到毫秒级"""
+    monkeypatch.setattr(settings, "retry_enabled", True)
+    monkeypatch.setattr(settings, "retry_base_delay", 0.001)
+    monkeypatch.setattr(settings, "retry_max_delay", 0.01)
+    monkeypatch.setattr(settings, "retry_budget_seconds", 5.0)
+    monkeypatch.setattr(settings, "retry_timeout_attempts", 2)
+    monkeypatch.setattr(settings, "retry_server_error_attempts", 3)
+    monkeypatch.setattr(settings, "retry_rate_limit_attempts", 3)
+
+
+def test_classify_retryable():
+    """测试按异常类别判断是否重试"""
+    assert classify_retryable(ScraperTimeoutError("t")) == "timeout"
+    assert classify_retryable(ScraperNetworkError("n")) == "network"
+    assert classify_retryable(RateLimitException("r")) == "rate_limit"
+    assert classify_retryable(PlatformException("s", status_code=503)) == "server_error"
+    assert classify_retryable(PlatformException("c", status_code=400)) is None
+    assert classify_retryable(ScraperNotFoundError("nf", status_code=404)) is None
+    assert classify_retryable(ScraperDataError("d")) is None
+    assert classify_retryable(ValueError("v")) is None
+
+
+def test_parse_retry_after():
+    """测试解析秒数和 HTTP 日期格式的 Retry-After"""
+    future = datetime.now(timezone.utc) + timedelta(seconds=120)
+
+    assert parse_retry_after("30") == 30
+    assert parse_retry_after(5) == 5
+    assert 110 <= parse_retry_after(format_datetime(future, usegmt=True)) <= 120
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_classify_http_error_keeps_retry_after():
+    """测试 429 异常携带 retry_after"""
+    error = classify_http_error(429, "seek", retry_after=7)
+
+    assert isinstance(error, RateLimitException)
+    assert error.retry_after == 7
+
+
+def test_backoff_is_capped_and_jittered(retry_settings, monkeypatch):
+    """测试退避时间按指数增长、有上限、乘以随机因子"""
+    monkeypatch.setattr(settings, "retry_base_delay", 1.0)
+    monkeypatch.setattr(settings, "retry_max_delay", 4.0)
+    retrier = Retrier(rng=lambda: 0.5)
+    error = ScraperTimeoutError("t")
+
+    assert retrier.backoff(1, error) == 0.5
+    assert retrier.backoff(2, error) == 1.0
+    assert retrier.backoff(3, error) == 2.0
+    assert retrier.backoff(5, error) == 2.0  # 上限 4 * 0.5
+
+
+def test_backoff_honors_retry_after(retry_settings):
+    """测试 429 至少等待 retry_after"""
+    retrier = Retrier(rng=lambda: 0.5)
+
+    assert retrier.backoff(1, RateLimitException("r", retry_after=3)) == 3.0
+
+
+@pytest.mark.asyncio
+async def test_retries_until_success(retry_settings):
+    """测试 5xx 后重试成功"""
+    retrier = Retrier()
+    calls = 0
+
+    async def flaky():
+        nonlocal calls
+        calls += 1
+        if calls < 3:
+            raise PlatformException("boom", platform="seek", status_code=502)
+        return "ok"
+
+    assert await retrier.call("seek", flaky) == "ok"
+    assert calls == 3
+    assert retrier.stats()["seek"] == {"retries": {"server_error": 2}, "recovered": 1, "exhausted": 0}
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_attempts(retry_settings):
+    """测试达到类别的最大尝试次数后抛出最后一个异常"""
+    retrier = Retrier()
+    calls = 0
+
+    async def timeout():
+        nonlocal calls
+        calls += 1
+        raise ScraperTimeoutError(f"timeout {calls}", platform="seek")
+
+    with pytest.raises(ScraperTimeoutError, match="timeout 2"):
+        await retrier.call("seek", timeout)
+    assert calls == 2
+    assert retrier.stats()["seek"]["exhausted"] == 1
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_error_raises_immediately(retry_settings):
+    """测试不可重试的异常不重试"""
+    retrier = Retrier()
+    calls = 0
+
+    async def not_found():
+        nonlocal calls
+        calls += 1
+        raise ScraperNotFoundError("missing", status_code=404)
+
+    with pytest.raises(ScraperNotFoundError):
+        await retrier.call("seek", not_found)
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_budget_stops_retries(retry_settings, monkeypatch):
+    """测试 retry_after 超出总时间预算时直接放弃"""
+    monkeypatch.setattr(settings, "retry_budget_seconds", 1.0)
+    retrier = Retrier()
+    calls = 0
+
+    async def limited():
+        nonlocal calls
+        calls += 1
+        raise RateLimitException("slow down", retry_after=60)
+
+    with pytest.raises(RateLimitException):
+        await retrier.call("seek", limited)
+    assert calls == 1
+
+
+def test_call_sync(retry_settings):
+    """测试同步调用重试"""
+    retrier = Retrier()
+    attempts = iter([ScraperNetworkError("reset"), "ok"])
+
+    def flaky():
+        result = next(attempts)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    assert retrier.call_sync("seek", flaky) == "ok"
+
+
+@pytest.mark.asyncio
+async def test_disabled_does_not_retry():
+    """测试关闭重试时只调用一次"""
+    calls = 0
+
+    async def fail():
+        nonlocal calls
+        calls += 1
+        raise ScraperTimeoutError("t")
+
+    with pytest.raises(ScraperTimeoutError):
+        await Retrier().call("seek", fail)
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_seek_adapter_retries_single_page(retry_settings, monkeypatch):
+    """测试 SEEK 某一页 503 / 429 时只重试该页"""
+    monkeypatch.setattr(settings, "seek_page_size", 10)
+    retrier = Retrier()
+    calls = {}
+
+    def handler(request):
+        page = int(request.url.params["page"])
+        calls[page] = calls.get(page, 0) + 1
+        if page == 2 and calls[page] == 1:
+            return httpx.Response(503)
+        if page == 3 and calls[page] == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={
+            "data": [{"id": f"{page}-{i}", "title": "Plumber"} for i in range(10)],
+            "totalCount": 30
+        })
+
+    adapter = SeekAdapter(http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    with patch("app.adapters.seek_adapter.retrier", retrier):
+        jobs = await adapter.scrape_async(ScrapeRequest(keywords="plumber", location="Sydney", max_results=30))
+
+    assert len(jobs) == 30
+    assert calls == {1: 1, 2: 2, 3: 2}
+    assert retrier.stats()["seek"]["retries"] == {"server_error": 1, "rate_limit": 1}
@@ -8,6 +8,7 @@
 - 边缘情况处理
 """
 
+import json
 import pytest
 from datetime import datetime
 from unittest.mock import Mock, patch
@@ -338,6 +339,7 @@ def test_scrape_success(mock_get):
         ],
         "totalCount": 1
     }
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
     mock_get.return_value = mock_response
 
     adapter = SeekAdapter()
@@ -359,6 +361,7 @@ def test_scrape_empty_results(mock_get):
         "data": [],
         "totalCount": 0
     }
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
     mock_get.return_value = mock_response
 
     adapter = SeekAdapter()
@@ -383,6 +386,7 @@ def test_scrape_partial_failures(mock_get):
         ],
         "totalCount": 4
     }
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
     mock_get.return_value = mock_response
 
     adapter = SeekAdapter()
@@ -402,6 +406,7 @@ def test_scrape_max_results_adjustment(mock_get):
     mock_response = Mock()
     mock_response.status_code = 200
     mock_response.json.return_value = {"data": [], "totalCount": 0}
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
     mock_get.return_value = mock_response
 
     adapter = SeekAdapter()
@@ -412,3 +417,382 @@ def test_scrape_max_results_adjustment(mock_get):
     # 验证调用参数（pageSize 被调整为 50）
     call_args = mock_get.call_args
     assert call_args[1]['params']['pageSize'] == 50
+
+
+# ========================================
+# 测试 scrape_async() - 异步抓取（使用 httpx.MockTransport）
+# ========================================
+
+import httpx
+from app.exceptions import (
+    ScraperTimeoutError,
+    ScraperNetworkError,
+    ScraperDataError,
+    ScraperNotFoundError,
+    RateLimitException,
+    PlatformException,
+)
+
+
+def make_async_adapter(handler):
+    """创建使用 MockTransport 的 SeekAdapter"""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return SeekAdapter(http_client=client)
+
+
+@pytest.mark.asyncio
+async def test_scrape_async_success():
+    """测试异步抓取成功"""
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        return httpx.Response(200, json={
+            "data": [
+                {"id": "1", "title": "Plumber", "advertiser": {"description": "ABC Plumbing"}},
+                {"id": "1", "title": "Plumber"},  # 重复
+                {"id": "2", "title": "Electrician"},
+            ],
+            "totalCount": 3
+        })
+
+    adapter = make_async_adapter(handler)
+    request = ScrapeRequest(keywords="plumber", location="Sydney")
+
+    jobs = await adapter.scrape_async(request)
+
+    assert [job.source_id for job in jobs] == ["1", "2"]
+    assert jobs[0].company == "ABC Plumbing"
+    assert requests_seen[0].url.params["keywords"] == "plumber"
+    assert requests_seen[0].url.params["where"] == "Sydney"
+
+
+@pytest.mark.asyncio
+async def test_scrape_async_reuses_client():
+    """测试多次抓取复用同一个客户端连接池"""
+    def handler(request):
+        return httpx.Response(200, json={"data": [], "totalCount": 0})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    adapter = SeekAdapter(http_client=client)
+    request = ScrapeRequest(keywords="plumber", location="Sydney")
+
+    await adapter.scrape_async(request)
+    await adapter.scrape_async(request)
+
+    assert adapter._http_client is client
+    assert not client.is_closed
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status_code,expected", [
+    (404, ScraperNotFoundError),
+    (429, RateLimitException),
+    (503, PlatformException),
+])
+async def test_scrape_async_http_errors(status_code, expected):
+    """测试 HTTP 错误码通过 classify_http_error 分类"""
+    adapter = make_async_adapter(lambda request: httpx.Response(status_code))
+
+    with pytest.raises(expected):
+        await adapter.scrape_async(ScrapeRequest(keywords="plumber", location="Sydney"))
+
+
+@pytest.mark.asyncio
+async def test_scrape_async_timeout():
+    """测试超时转换为 ScraperTimeoutError"""
+    def handler(request):
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    adapter = make_async_adapter(handler)
+
+    with pytest.raises(ScraperTimeoutError):
+        await adapter.scrape_async(ScrapeRequest(keywords="plumber", location="Sydney"))
+
+
+@pytest.mark.asyncio
+async def test_scrape_async_connection_error():
+    """测试连接失败转换为 ScraperNetworkError"""
+    def handler(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    adapter = make_async_adapter(handler)
+
+    with pytest.raises(ScraperNetworkError):
+        await adapter.scrape_async(ScrapeRequest(keywords="plumber", location="Sydney"))
+
+
+@pytest.mark.asyncio
+async def test_scrape_async_invalid_payload():
+    """测试响应缺少 data 字段时抛出 ScraperDataError"""
+    adapter = make_async_adapter(lambda request: httpx.Response(200, json={"items": []}))
+
+    with pytest.raises(ScraperDataError):
+        await adapter.scrape_async(ScrapeRequest(keywords="plumber", location="Sydney"))
+
+
+# ========================================
+# 测试分页抓取 - _plan_pages() / _iter_pages_async()
+# ========================================
+
+import asyncio
+
+
+def make_page(page, page_size=50, total_count=500, ids=None):
+    """构建某一页的 SEEK API 响应"""
+    if ids is None:
+        start = (page - 1) * page_size
+        ids = range(start, start + page_size)
+    return {
+        "data": [{"id": str(i), "title": f"Plumber {i}"} for i in ids],
+        "totalCount": total_count
+    }
+
+
+def test_plan_pages_single_page():
+    """测试结果数小于每页大小：只抓 1 页"""
+    adapter = SeekAdapter()
+    assert adapter._plan_pages(20) == (20, 1)
+
+
+def test_plan_pages_multiple_pages():
+    """测试 200 个结果：4 页 × 50"""
+    adapter = SeekAdapter()
+    assert adapter._plan_pages(200) == (50, 4)
+
+
+def test_plan_pages_capped_by_max_pages():
+    """测试页数受 seek_max_pages 限制"""
+    from app.config.settings import settings
+
+    adapter = SeekAdapter()
+    with patch.object(settings, "seek_max_pages", 2):
+        assert adapter._plan_pages(200) == (50, 2)
+
+
+def test_build_params_page():
+    """测试页码参数"""
+    adapter = SeekAdapter()
+    params = adapter._build_params("plumber", 50, "Sydney", page=3)
+
+    assert params["page"] == 3
+    assert params["where"] == "Sydney"
+
+
+@pytest.mark.asyncio
+async def test_scrape_async_paginates_in_order():
+    """测试多页结果按页码顺序合并（即使后面的页先返回）"""
+    async def handler(request):
+        page = int(request.url.params["page"])
+        # 页码越小返回越慢，验证按页码顺序合并
+        await asyncio.sleep(0.01 * (5 - page))
+        return httpx.Response(200, json=make_page(page))
+
+    adapter = make_async_adapter(handler)
+    request = ScrapeRequest(keywords="plumber", location="Sydney", max_results=200)
+
+    jobs = await adapter.scrape_async(request)
+
+    assert len(jobs) == 200
+    assert [job.source_id for job in jobs] == [str(i) for i in range(200)]
+
+
+@pytest.mark.asyncio
+async def test_scrape_async_stops_at_total_count():
+    """测试根据第 1 页的 totalCount 提前停止"""
+    pages_requested = []
+
+    def handler(request):
+        page = int(request.url.params["page"])
+        pages_requested.append(page)
+        return httpx.Response(200, json=make_page(page, total_count=60))
+
+    adapter = make_async_adapter(handler)
+    request = ScrapeRequest(keywords="plumber", location="Sydney", max_results=200)
+
+    jobs = await adapter.scrape_async(request)
+
+    assert sorted(pages_requested) == [1, 2]
+    assert len(jobs) == 100
+
+
+@pytest.mark.asyncio
+async def test_scrape_async_dedup_across_pages():
+    """测试跨页流式去重"""
+    def handler(request):
+        page = int(request.url.params["page"])
+        ids = {1: range(0, 50), 2: range(25, 75)}[page]
+        return httpx.Response(200, json=make_page(page, total_count=100, ids=ids))
+
+    adapter = make_async_adapter(handler)
+    request = ScrapeRequest(keywords="plumber", location="Sydney", max_results=100)
+
+    jobs = await adapter.scrape_async(request)
+
+    assert [job.source_id for job in jobs] == [str(i) for i in range(75)]
+
+
+@pytest.mark.asyncio
+async def test_scrape_async_truncates_to_max_results():
+    """测试结果数截断到 max_results"""
+    adapter = make_async_adapter(
+        lambda request: httpx.Response(200, json=make_page(int(request.url.params["page"]), page_size=30))
+    )
+    request = ScrapeRequest(keywords="plumber", location="Sydney", max_results=30)
+
+    jobs = await adapter.scrape_async(request)
+
+    assert len(jobs) == 30
+
+
+@pytest.mark.asyncio
+async def test_scrape_async_page_concurrency_bounded():
+    """测试同时在途的分页请求不超过 seek_page_concurrency"""
+    from app.config.settings import settings
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        return httpx.Response(200, json=make_page(int(request.url.params["page"]), page_size=20))
+
+    adapter = make_async_adapter(handler)
+    request = ScrapeRequest(keywords="plumber", location="Sydney", max_results=200)
+
+    with patch.object(settings, "seek_page_size", 20), patch.object(settings, "seek_page_concurrency", 2):
+        jobs = await adapter.scrape_async(request)
+
+    assert len(jobs) == 200
+    assert max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_scrape_async_skips_failed_page():
+    """测试第 2 页起单页失败被跳过，其他页正常返回"""
+    def handler(request):
+        page = int(request.url.params["page"])
+        if page == 2:
+            return httpx.Response(503)
+        return httpx.Response(200, json=make_page(page, total_count=150))
+
+    adapter = make_async_adapter(handler)
+    request = ScrapeRequest(keywords="plumber", location="Sydney", max_results=150)
+
+    jobs = await adapter.scrape_async(request)
+
+    ids = [job.source_id for job in jobs]
+    assert ids == [str(i) for i in range(50)] + [str(i) for i in range(100, 150)]
+
+
+@pytest.mark.asyncio
+async def test_scrape_async_first_page_failure_is_fatal():
+    """测试第 1 页失败直接抛出"""
+    adapter = make_async_adapter(lambda request: httpx.Response(503))
+    request = ScrapeRequest(keywords="plumber", location="Sydney", max_results=150)
+
+    with pytest.raises(PlatformException):
+        await adapter.scrape_async(request)
+
+
+@patch('app.adapters.seek_adapter.requests.get')
+def test_scrape_sync_paginates(mock_get):
+    """测试同步版本逐页抓取并按 totalCount 停止"""
+    def fake_get(url, params, headers, timeout):
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = make_page(params["page"], total_count=120)
+        response.content = json.dumps(response.json.return_value).encode()
+        return response
+
+    mock_get.side_effect = fake_get
+
+    adapter = SeekAdapter()
+    request = ScrapeRequest(keywords="plumber", location="Sydney", max_results=200)
+
+    jobs = adapter.scrape(request)
+
+    assert mock_get.call_count == 3
+    assert len(jobs) == 150
+
+
+@pytest.mark.asyncio
+async def test_scrape_async_stops_when_circuit_opens():
+    """测试第 1 页之后熔断打开时直接抛出 CircuitOpenError，不再把剩余页当作单页失败跳过"""
+    from app.config.settings import settings
+    from app.exceptions import CircuitOpenError
+
+    calls = 0
+
+    def handler(request):
+        nonlocal calls
+        calls += 1
+        page = int(request.url.params["page"])
+        if page > 1:
+            return httpx.Response(503)
+        return httpx.Response(200, json=make_page(page))
+
+    adapter = make_async_adapter(handler)
+    request = ScrapeRequest(keywords="plumber", location="Sydney", max_results=200)
+
+    with patch.object(settings, "circuit_min_calls", 2), patch.object(settings, "seek_page_concurrency", 1):
+        with pytest.raises(CircuitOpenError):
+            await adapter.scrape_async(request)
+
+    assert calls == 2
+
+
+@patch('app.adapters.seek_adapter.requests.get')
+def test_scrape_sync_stops_when_circuit_opens(mock_get):
+    """测试同步版本第 1 页之后熔断打开时直接抛出 CircuitOpenError"""
+    import requests
+    from app.config.settings import settings
+    from app.exceptions import CircuitOpenError
+
+    def fake_get(url, params, headers, timeout):
+        response = Mock()
+        response.headers = {}
+        if params["page"] > 1:
+            response.status_code = 503
+            response.content = b""
+            response.raise_for_status.side_effect = requests.HTTPError("503")
+            return response
+        response.status_code = 200
+        response.json.return_value = make_page(params["page"])
+        response.content = json.dumps(response.json.return_value).encode()
+        return response
+
+    mock_get.side_effect = fake_get
+
+    adapter = SeekAdapter()
+    request = ScrapeRequest(keywords="plumber", location="Sydney", max_results=200)
+
+    with patch.object(settings, "circuit_min_calls", 2):
+        with pytest.raises(CircuitOpenError):
+            adapter.scrape(request)
+
+    assert mock_get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_scrape_async_propagates_cancellation():
+    """测试请求取消时 scrape_async 原样抛出 RequestCancelledError，不包装为 ScraperException"""
+    from app.exceptions import RequestCancelledError
+
+    adapter = SeekAdapter()
+    request = ScrapeRequest(keywords="plumber", location="Sydney", max_results=200)
+
+    async def fake_call(params):
+        if params["page"] > 1:
+            raise RequestCancelledError("Request cancelled", platform="seek")
+        return make_page(params["page"])
+
+    with patch.object(adapter, "_call_seek_api_async", fake_call):
+        with pytest.raises(RequestCancelledError) as exc_info:
+            await adapter.scrape_async(request)
+
+    assert type(exc_info.value) is RequestCancelledError
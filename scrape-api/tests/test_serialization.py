@@ -0,0 +1,77 @@
+"""
+测试 serialization.py 模块
+
+测试 dump_json 与 model_dump_json 输出一致，以及 ModelJSONResponse 跳过 response_model 的二次校验
+"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.job_posting_dto import (
+    BatchScrapeResponse,
+    BatchScrapeResult,
+    JobPostingDTO,
+    PlatformEnum,
+    ScrapeResponse,
+)
+from app.services.batch import batch_scheduler
+from app.services.serialization import ModelJSONResponse, dump_json
+
+
+def make_job(source_id: str = "1") -> JobPostingDTO:
+    return JobPostingDTO(
+        source=PlatformEnum.SEEK,
+        source_id=source_id,
+        title="Tiler",
+        company="ABC Tiling",
+        description="Wall & floor tiling — 5 years' experience",
+        posted_at=datetime(2025, 12, 1, 9, 30),
+    )
+
+
+def test_dump_json_matches_model_dump_json():
+    """测试 dump_json 的输出与 model_dump_json 一致（含 exclude）"""
+    response = ScrapeResponse.model_construct(
+        platform=PlatformEnum.SEEK, jobs=[make_job()], count=1, scraped_at=datetime(2025, 12, 2)
+    )
+
+    assert dump_json(response) == response.model_dump_json().encode("utf-8")
+    assert dump_json(response, exclude={"timings"}) == response.model_dump_json(exclude={"timings"}).encode("utf-8")
+
+
+def test_model_json_response_render():
+    """测试 ModelJSONResponse 编码模型、原样返回 bytes、编码其他值"""
+    job = make_job()
+
+    assert ModelJSONResponse(job).body == dump_json(job)
+    assert ModelJSONResponse(b'{"cached":true}').body == b'{"cached":true}'
+    assert ModelJSONResponse({"count": 1}).body == b'{"count":1}'
+    assert ModelJSONResponse(job).headers["content-type"] == "application/json"
+
+
+def test_batch_endpoint_skips_response_revalidation():
+    """测试 /scrape/batch 直接编码批量结果，不再按 response_model 校验职位"""
+    result = BatchScrapeResponse(
+        results=[BatchScrapeResult(
+            index=0, platform="seek", keywords="tiler", location="Adelaide",
+            jobs=[make_job("1"), make_job("2")], count=2,
+        )],
+        total_jobs=2,
+        succeeded=1,
+        failed=0,
+        duration_ms=12.5,
+    )
+    client = TestClient(app)
+
+    with patch.object(batch_scheduler, "run", AsyncMock(return_value=result)), \
+            patch("fastapi.routing.serialize_response", AsyncMock(side_effect=AssertionError("revalidated"))):
+        response = client.post("/scrape/batch", json={
+            "specs": [{"platform": "seek", "keywords": "tiler", "location": "Adelaide"}]
+        })
+
+    assert response.status_code == 200
+    assert response.content == dump_json(result)
+    assert response.json()["results"][0]["jobs"][1]["source_id"] == "2"
@@ -0,0 +1,128 @@
+"""
+测试 single_flight.py 模块和抓取请求合并
+
+测试相同 key 的并发调用只执行一次、异常共享、统计计数
+"""
+
+import asyncio
+
+import pytest
+
+from app.models.job_posting_dto import ScrapeRequest
+from app.services import scrape_service
+from app.services.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    """测试相同 key 的并发调用只执行一次"""
+    flights = SingleFlight()
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.02)
+        return "result"
+
+    results = await asyncio.gather(*[flights.do("key", work) for _ in range(5)])
+
+    assert results == ["result"] * 5
+    assert calls == 1
+    assert flights.hits == 4
+    assert flights.misses == 1
+    assert flights.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_different_keys_run_separately():
+    """测试不同 key 分别执行"""
+    flights = SingleFlight()
+
+    async def work(value):
+        await asyncio.sleep(0.01)
+        return value
+
+    results = await asyncio.gather(
+        flights.do("a", lambda: work("a")),
+        flights.do("b", lambda: work("b")),
+    )
+
+    assert results == ["a", "b"]
+    assert flights.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_sequential_calls_are_not_coalesced():
+    """测试完成后的调用不会被合并（不是缓存）"""
+    flights = SingleFlight()
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await flights.do("key", work) == 1
+    assert await flights.do("key", work) == 2
+
+
+@pytest.mark.asyncio
+async def test_exception_shared_by_all_waiters():
+    """测试异常传递给所有等待者"""
+    flights = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("upstream failed")
+
+    results = await asyncio.gather(
+        flights.do("key", fail), flights.do("key", fail), return_exceptions=True
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert flights.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_call():
+    """测试一个等待者被取消时其他等待者仍能得到结果"""
+    flights = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    first = asyncio.ensure_future(flights.do("key", work))
+    second = asyncio.ensure_future(flights.do("key", work))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    assert await second == "done"
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+def test_request_key_normalization():
+    """测试请求键忽略大小写和多余空白"""
+    a = ScrapeRequest(keywords="Tiler ", location="Adelaide", max_results=50)
+    b = ScrapeRequest(keywords="tiler", location="  adelaide", max_results=50)
+    c = ScrapeRequest(keywords="tiler", location="adelaide", max_results=20)
+
+    assert scrape_service.request_key("seek", a) == scrape_service.request_key("seek", b)
+    assert scrape_service.request_key("seek", a) != scrape_service.request_key("indeed", a)
+    assert scrape_service.request_key("seek", a) != scrape_service.request_key("seek", c)
+
+
+@pytest.mark.asyncio
+async def test_scrape_service_coalesces_identical_requests(fake_adapter):
+    """测试 scrape_service.scrape() 合并相同的并发请求"""
+    fake_adapter.delay = 0.02
+    results = await asyncio.gather(
+        scrape_service.scrape("seek", ScrapeRequest(keywords="Tiler", location="Adelaide")),
+        scrape_service.scrape("seek", ScrapeRequest(keywords="tiler", location="adelaide")),
+    )
+
+    assert fake_adapter.calls == 1
+    assert results[0] == results[1]
+    assert results[0] is not results[1]  # 每个调用方得到独立的列表
@@ -0,0 +1,169 @@
+"""
+测试 streaming.py 模块和 /scrape/{platform}/stream 端点
+
+测试 NDJSON 流式输出：逐页输出、结尾行统计、错误处理
+"""
+
+import json
+
+import httpx
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+
+from app.adapters.base_adapter import ScrapeStats
+from app.adapters.indeed_adapter import IndeedAdapter
+from app.adapters.seek_adapter import SeekAdapter
+from app.main import app
+from app.models.job_posting_dto import JobPostingDTO
+from app.services import scrape_service
+from app.services.streaming import ndjson_lines
+
+
+def make_page(page, page_size=50, total_count=150):
+    """构建某一页的 SEEK API 响应"""
+    start = (page - 1) * page_size
+    return {
+        "data": [{"id": str(i), "title": f"Plumber {i}"} for i in range(start, start + page_size)],
+        "totalCount": total_count
+    }
+
+
+def seek_adapter_with(handler):
+    """返回使用 MockTransport 的 get_adapter 替身"""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return lambda platform: SeekAdapter(http_client=client)
+
+
+def read_ndjson(response):
+    """解析 NDJSON 响应为 (职位列表, 结尾行)"""
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    return lines[:-1], lines[-1]["trailer"]
+
+
+def test_stream_seek_pages():
+    """测试多页结果逐行输出，结尾行包含统计"""
+    handler = lambda request: httpx.Response(200, json=make_page(int(request.url.params["page"])))
+    client = TestClient(app)
+
+    with patch.object(scrape_service, "get_adapter", seek_adapter_with(handler)):
+        response = client.post("/scrape/seek/stream", json={
+            "keywords": "plumber", "location": "Sydney", "max_results": 150
+        })
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    jobs, trailer = read_ndjson(response)
+    assert [job["source_id"] for job in jobs] == [str(i) for i in range(150)]
+    assert trailer["count"] == 150
+    assert trailer["pages"] == 3
+    assert trailer["completed"] is True
+    assert trailer["truncated"] is False
+    assert trailer["errors"] == []
+
+
+def test_stream_records_page_errors_in_trailer():
+    """测试第 2 页起的失败写入结尾行"""
+    def handler(request):
+        page = int(request.url.params["page"])
+        if page == 2:
+            return httpx.Response(503)
+        return httpx.Response(200, json=make_page(page))
+
+    client = TestClient(app)
+    with patch.object(scrape_service, "get_adapter", seek_adapter_with(handler)):
+        response = client.post("/scrape/seek/stream", json={
+            "keywords": "plumber", "location": "Sydney", "max_results": 150
+        })
+
+    jobs, trailer = read_ndjson(response)
+    assert len(jobs) == 100
+    assert trailer["count"] == 100
+    assert len(trailer["errors"]) == 1
+    assert trailer["errors"][0].startswith("page 2")
+
+
+def test_stream_first_page_failure_returns_500():
+    """测试第 1 页失败返回 HTTP 500"""
+    client = TestClient(app)
+    with patch.object(scrape_service, "get_adapter", seek_adapter_with(lambda request: httpx.Response(503))):
+        response = client.post("/scrape/seek/stream", json={"keywords": "plumber", "location": "Sydney"})
+
+    assert response.status_code == 500
+
+
+def test_stream_indeed_single_page():
+    """测试不支持分页的平台作为单页输出"""
+    def fake_scrape(self, request):
+        return [JobPostingDTO(source="indeed", source_id=str(i), title="Tiler", company="ABC") for i in range(3)]
+
+    client = TestClient(app)
+    with patch.object(IndeedAdapter, "scrape", fake_scrape):
+        response = client.post("/scrape/indeed/stream", json={"keywords": "tiler", "location": "Adelaide"})
+
+    jobs, trailer = read_ndjson(response)
+    assert len(jobs) == 3
+    assert trailer["platform"] == "indeed"
+    assert trailer["pages"] == 1
+
+
+def test_stream_unknown_platform():
+    """测试不支持的平台返回 422"""
+    client = TestClient(app)
+    response = client.post("/scrape/linkedin/stream", json={"keywords": "tiler", "location": "Adelaide"})
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_ndjson_lines_emits_before_next_page():
+    """测试每页转换后立即输出，不等待后续页"""
+    events = []
+
+    async def pages():
+        events.append("page 2 requested")
+        yield [JobPostingDTO(source="seek", source_id="2", title="Tiler", company="ABC")]
+
+    first = [JobPostingDTO(source="seek", source_id="1", title="Tiler", company="ABC")]
+    stream = ndjson_lines("seek", first, pages(), ScrapeStats())
+
+    line = await stream.__anext__()
+    events.append("line 1 emitted")
+    rest = [chunk async for chunk in stream]
+
+    assert json.loads(line)["source_id"] == "1"
+    assert events == ["line 1 emitted", "page 2 requested"]
+    assert json.loads(rest[-1])["trailer"]["count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_ndjson_lines_one_chunk_per_page():
+    """测试每页作为一块输出（压缩时每页只 flush 一次），空页不输出"""
+    async def pages():
+        yield [JobPostingDTO(source="seek", source_id=str(i), title="Tiler", company="ABC") for i in (3, 4, 5)]
+        yield []
+
+    first = [JobPostingDTO(source="seek", source_id=str(i), title="Tiler", company="ABC") for i in (1, 2)]
+    chunks = [chunk async for chunk in ndjson_lines("seek", first, pages(), ScrapeStats())]
+
+    assert len(chunks) == 3
+    assert [json.loads(line)["source_id"] for line in chunks[0].splitlines()] == ["1", "2"]
+    assert [json.loads(line)["source_id"] for line in chunks[1].splitlines()] == ["3", "4", "5"]
+    assert json.loads(chunks[2])["trailer"]["count"] == 5
+
+
+@pytest.mark.asyncio
+async def test_ndjson_lines_interrupted():
+    """测试中途出错时结尾行标记 completed=False"""
+    async def pages():
+        yield [JobPostingDTO(source="seek", source_id="2", title="Tiler", company="ABC")]
+        raise RuntimeError("upstream went away")
+
+    stream = ndjson_lines("seek", [], pages(), ScrapeStats())
+    chunks = [chunk async for chunk in stream]
+    trailer = json.loads(chunks[-1])["trailer"]
+
+    assert len(chunks) == 2
+    assert trailer["completed"] is False
+    assert trailer["errors"] == ["upstream went away"]
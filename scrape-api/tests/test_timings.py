@@ -0,0 +1,87 @@
+"""
+测试 timings.py 模块
+
+测试请求耗时分解的收集、Server-Timing 头和 ScrapeResponse.timings
+"""
+
+import httpx
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+
+from app.adapters.seek_adapter import SeekAdapter
+from app.main import app
+from app.services import metrics, scrape_service
+from app.services.timings import RequestTimings, collect, current, server_timing
+
+
+def test_collect_binds_timings_to_context():
+    """测试 collect() 内的指标埋点累加到当前请求"""
+    assert current() is None
+
+    with collect() as timings:
+        with metrics.timed(metrics.UPSTREAM_FETCH_SECONDS, "seek"):
+            pass
+        metrics.record_upstream_bytes("seek", 1200)
+        metrics.record_transform("seek", 0.002)
+        metrics.record_rate_limit_wait("seek", 0.5)
+
+    assert current() is None
+    assert timings.upstream_requests == 1
+    assert timings.upstream_bytes == 1200
+    assert timings.seconds["transform"] == 0.002
+    assert timings.rate_limit_wait == 0.5
+
+
+def test_to_model_does_not_mutate_shared_timings():
+    """测试序列化耗时只加到本次输出（合并请求共享 RequestTimings）"""
+    timings = RequestTimings()
+    timings.add("fetch", 0.1)
+
+    model = timings.to_model(0.2, serialize_seconds=0.01)
+
+    assert model.fetch_ms == 100.0
+    assert model.serialize_ms == 10.0
+    assert model.total_ms == 200.0
+    assert timings.seconds["serialize"] == 0.0
+
+
+def test_server_timing_header():
+    """测试 Server-Timing 头格式"""
+    timings = RequestTimings()
+    timings.add("fetch", 0.8124)
+    timings.add_bytes(51234)
+
+    header = server_timing(timings.to_model(0.9), cache_hit=True)
+
+    assert header.startswith("fetch;dur=812.4, parse;dur=0.0, transform;dur=0.0, dedup;dur=0.0, serialize;dur=0.0")
+    assert "total;dur=900.0" in header
+    assert 'upstream;desc="requests=1 bytes=51234"' in header
+    assert header.endswith('cache;desc="hit"')
+
+
+def test_scrape_endpoint_returns_timings():
+    """测试 /scrape/seek 返回 Server-Timing 头和 timings，缓存命中时上游阶段为 0"""
+    payload = {"data": [{"id": "1", "title": "Plumber"}, {"id": "2", "title": "Tiler"}], "totalCount": 2}
+    adapter = SeekAdapter(http_client=httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json=payload))
+    ))
+    client = TestClient(app)
+    body = {"keywords": "plumber", "location": "Sydney", "max_results": 2}
+
+    with patch.object(scrape_service, "get_adapter", lambda platform: adapter):
+        first = client.post("/scrape/seek", json=body)
+        second = client.post("/scrape/seek", json=body)
+
+    assert first.status_code == 200
+    timings = first.json()["timings"]
+    assert timings["upstream_requests"] == 1
+    assert timings["upstream_bytes"] > 0
+    assert timings["transform_ms"] > 0
+    assert timings["total_ms"] >= timings["serialize_ms"]
+    assert first.json()["count"] == 2
+    assert "fetch;dur=" in first.headers["Server-Timing"]
+    assert "requests=1" in first.headers["Server-Timing"]
+
+    assert second.json()["cache_hit"] is True
+    assert second.json()["timings"]["upstream_requests"] == 0
+    assert 'cache;desc="hit"' in second.headers["Server-Timing"]
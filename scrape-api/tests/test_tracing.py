@@ -0,0 +1,127 @@
+"""
+测试 tracing.py 模块
+
+测试 traceparent 解析、采样、span 嵌套和上限、JSON lines 导出，以及中间件的端到端追踪
+"""
+
+import json
+
+import httpx
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+
+from app.adapters.seek_adapter import SeekAdapter
+from app.config.settings import settings
+from app.main import app
+from app.services import scrape_service, tracing
+from app.utils.location_parser import parse_location
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_ID = "00f067aa0ba902b7"
+
+
+@pytest.fixture
+def trace_file(tmp_path, monkeypatch):
+    """把 span 导出到临时文件，测试结束后关闭导出器"""
+    path = tmp_path / "traces.jsonl"
+    monkeypatch.setattr(settings, "trace_file_path", str(path))
+    monkeypatch.setattr(settings, "trace_sample_rate", 0.0)
+    yield path
+    tracing.exporter.close()
+
+
+def read_spans(path):
+    """写完队列并读取导出的 span"""
+    tracing.exporter.close()
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_parse_traceparent():
+    """测试 W3C traceparent 解析"""
+    assert tracing.parse_traceparent(f"00-{TRACE_ID}-{PARENT_ID}-01") == (TRACE_ID, PARENT_ID, True)
+    assert tracing.parse_traceparent(f"00-{TRACE_ID}-{PARENT_ID}-00") == (TRACE_ID, PARENT_ID, False)
+    assert tracing.parse_traceparent(f"00-{'0' * 32}-{PARENT_ID}-01") is None
+    assert tracing.parse_traceparent("garbage") is None
+    assert tracing.parse_traceparent(None) is None
+
+
+def test_unsampled_spans_are_noop(trace_file):
+    """测试不在已采样的请求内时 span() 为空操作"""
+    trace_id, root = tracing.start_trace(f"00-{TRACE_ID}-{PARENT_ID}-00", "GET /")
+
+    assert trace_id == TRACE_ID
+    assert root is None
+    assert tracing.span("child") is tracing.NOOP_SPAN
+    assert parse_location("Adelaide, SA") == ("SA", "Adelaide")
+    assert tracing.exporter.exported == 0
+
+
+def test_sampled_parent_exports_nested_spans(trace_file):
+    """测试调用方已采样时沿用 trace id，子 span 嵌套在当前 span 下"""
+    _, root = tracing.start_trace(f"00-{TRACE_ID}-{PARENT_ID}-01", "GET /")
+
+    with root:
+        with tracing.span("outer", page=1) as outer:
+            with tracing.span("inner"):
+                pass
+            outer.set(status_code=200)
+
+    spans = {span["name"]: span for span in read_spans(trace_file)}
+    assert spans["GET /"]["traceId"] == TRACE_ID
+    assert spans["GET /"]["parentSpanId"] == PARENT_ID
+    assert spans["outer"]["parentSpanId"] == spans["GET /"]["spanId"]
+    assert spans["outer"]["attributes"] == {"page": 1, "status_code": 200}
+    assert spans["inner"]["parentSpanId"] == spans["outer"]["spanId"]
+    assert tracing.current_span() is None
+
+
+def test_span_errors_and_limit(trace_file, monkeypatch):
+    """测试异常记录到 span，超过 span 上限后丢弃"""
+    monkeypatch.setattr(settings, "trace_max_spans", 2)
+    _, root = tracing.start_trace(f"00-{TRACE_ID}-{PARENT_ID}-01", "GET /")
+
+    with root:
+        with pytest.raises(ValueError):
+            with tracing.span("failing"):
+                raise ValueError("bad payload")
+        assert tracing.span("dropped") is tracing.NOOP_SPAN
+
+    spans = {span["name"]: span for span in read_spans(trace_file)}
+    assert spans["failing"]["status"] == "error"
+    assert spans["failing"]["error"] == "ValueError: bad payload"
+    assert "dropped" not in spans
+    assert root.trace.dropped == 1
+
+
+def test_middleware_traces_scrape_request(trace_file, monkeypatch):
+    """测试中间件为已采样的请求导出根 span、上游 HTTP span 和规范化函数 span"""
+    monkeypatch.setattr(settings, "tracing_enabled", True)
+    payload = {"data": [{"id": "1", "title": "Plumber", "location": "Sydney NSW"}], "totalCount": 1}
+    adapter = SeekAdapter(http_client=httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json=payload))
+    ))
+
+    client = TestClient(app)
+    with patch.object(scrape_service, "get_adapter", lambda platform: adapter):
+        response = client.post(
+            "/scrape/seek",
+            json={"keywords": "plumber", "location": "Sydney", "max_results": 1},
+            headers={"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-01"},
+        )
+        untraced = client.get("/health")
+
+    assert response.status_code == 200
+    assert response.headers["X-Trace-Id"] == TRACE_ID
+    assert len(untraced.headers["X-Trace-Id"]) == 32
+
+    spans = read_spans(trace_file)
+    names = [span["name"] for span in spans]
+    root = next(span for span in spans if span["name"] == "POST /scrape/seek")
+    http = next(span for span in spans if span["name"] == "seek.http")
+    assert root["attributes"]["http.status_code"] == 200
+    assert http["attributes"]["status_code"] == 200
+    assert http["attributes"]["bytes"] > 0
+    assert "utils.extract_trade" in names
+    assert all(span["traceId"] == TRACE_ID for span in spans)
+    assert "GET /health" not in names
@@ -0,0 +1,171 @@
+"""
+测试 wire_formats.py 模块
+
+测试 Accept 协商，以及 Arrow IPC / MessagePack 与 pydantic 模型之间的往返转换
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+
+from app.adapters.seek_adapter import SeekAdapter
+from app.main import app
+from app.models.job_posting_dto import JobPostingDTO, PlatformEnum, ScrapeResponse
+from app.services import scrape_service, wire_formats
+from app.services.wire_formats import (
+    ARROW_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    negotiate,
+)
+
+ADELAIDE = timezone(timedelta(hours=10, minutes=30))
+
+
+def make_response() -> ScrapeResponse:
+    jobs = [
+        JobPostingDTO(
+            source=PlatformEnum.SEEK,
+            source_id="1",
+            title="Tiler",
+            company="ABC Tiling",
+            location_state="SA",
+            location_suburb="Adelaide",
+            trade="tiler",
+            pay_range_min=70000,
+            pay_range_max=90000,
+            description="Wall & floor tiling — 5 years' experience",
+            tags=["tiling", "construction"],
+            posted_at=datetime(2025, 12, 1, 9, 30, tzinfo=ADELAIDE),
+            scraped_at=datetime(2025, 12, 2, 8, 0, 0, 123456, tzinfo=timezone.utc),
+            is_remote=False,
+        ),
+        JobPostingDTO(
+            source=PlatformEnum.SEEK,
+            source_id="2",
+            title="Plumber",
+            company="Pipe Co",
+            tags=[],
+            scraped_at=datetime(2025, 12, 2, 8, 0, tzinfo=timezone.utc),
+        ),
+    ]
+    return ScrapeResponse(
+        platform=PlatformEnum.SEEK,
+        jobs=jobs,
+        count=len(jobs),
+        scraped_at=datetime(2025, 12, 2, 8, 0),
+        cache_hit=True,
+        cache_age_seconds=12.5,
+    )
+
+
+@pytest.fixture
+def all_formats(monkeypatch):
+    """假定 pyarrow 和 msgpack 都已安装（只测试协商逻辑）"""
+    monkeypatch.setattr(wire_formats, "arrow_available", lambda: True)
+    monkeypatch.setattr(wire_formats, "msgpack_available", lambda: True)
+
+
+def test_negotiate(all_formats):
+    """测试 Accept 协商：明确类型优先于通配符，默认和无法满足时为 JSON"""
+    assert negotiate(None) == JSON_MEDIA_TYPE
+    assert negotiate("*/*") == JSON_MEDIA_TYPE
+    assert negotiate(ARROW_MEDIA_TYPE) == ARROW_MEDIA_TYPE
+    assert negotiate(f"{ARROW_MEDIA_TYPE}, */*;q=0.1") == ARROW_MEDIA_TYPE
+    assert negotiate("application/x-msgpack, application/json;q=0.5") == MSGPACK_MEDIA_TYPE
+    assert negotiate(f"application/json, {MSGPACK_MEDIA_TYPE}") == JSON_MEDIA_TYPE
+    assert negotiate(f"{ARROW_MEDIA_TYPE};q=0, application/*;q=0.5") == JSON_MEDIA_TYPE
+    assert negotiate("text/html") == JSON_MEDIA_TYPE
+
+
+def test_negotiate_skips_missing_dependencies(monkeypatch):
+    """测试可选依赖未安装时回退到 JSON"""
+    monkeypatch.setattr(wire_formats, "arrow_available", lambda: False)
+    monkeypatch.setattr(wire_formats, "msgpack_available", lambda: False)
+
+    assert negotiate(ARROW_MEDIA_TYPE) == JSON_MEDIA_TYPE
+    assert negotiate(MSGPACK_MEDIA_TYPE) == JSON_MEDIA_TYPE
+
+
+def test_arrow_schema_mirrors_dto():
+    """测试 Arrow schema 与 JobPostingDTO 字段一致"""
+    pytest.importorskip("pyarrow")
+
+    assert wire_formats.job_schema().names == list(JobPostingDTO.model_fields)
+
+
+def test_arrow_round_trip():
+    """测试 Arrow IPC 往返：职位和响应字段与原模型一致"""
+    pa = pytest.importorskip("pyarrow")
+    response = make_response()
+
+    with pa.ipc.open_stream(wire_formats.encode_arrow(response)) as reader:
+        table = reader.read_all()
+
+    metadata = {key.decode(): value.decode() for key, value in table.schema.metadata.items()}
+    assert metadata == {
+        "platform": "seek",
+        "count": "2",
+        "scraped_at": "2025-12-02T08:00:00",
+        "cache_hit": "true",
+        "cache_age_seconds": "12.5",
+        "truncated": "false",
+    }
+    assert [JobPostingDTO(**row) for row in table.to_pylist()] == response.jobs
+
+
+def test_arrow_datetimes_are_utc():
+    """测试 Arrow 中的时间带 UTC 时区：非 UTC 的 posted_at 换算为同一时刻，naive 的 scraped_at 按 UTC 读回"""
+    pa = pytest.importorskip("pyarrow")
+    response = make_response()
+    response.jobs[1].scraped_at = datetime(2025, 12, 2, 8, 0)
+
+    with pa.ipc.open_stream(wire_formats.encode_arrow(response)) as reader:
+        rows = reader.read_all().to_pylist()
+
+    posted_at = rows[0]["posted_at"]
+    assert posted_at.utcoffset() == timedelta(0)
+    assert posted_at == datetime(2025, 11, 30, 23, 0, tzinfo=timezone.utc)
+    assert rows[1]["scraped_at"] == datetime(2025, 12, 2, 8, 0, tzinfo=timezone.utc)
+
+
+def test_msgpack_round_trip():
+    """测试 MessagePack 往返：结构与 JSON 相同，可还原为 ScrapeResponse"""
+    msgpack = pytest.importorskip("msgpack")
+    response = make_response()
+
+    decoded = msgpack.unpackb(wire_formats.encode_msgpack(response))
+
+    assert "timings" not in decoded
+    assert ScrapeResponse.model_validate(decoded) == response
+
+
+def test_scrape_endpoint_negotiates_format():
+    """测试 /scrape/seek 按 Accept 返回 Arrow / MessagePack，默认 JSON"""
+    pa = pytest.importorskip("pyarrow")
+    msgpack = pytest.importorskip("msgpack")
+    payload = {"data": [{"id": "1", "title": "Plumber"}, {"id": "2", "title": "Tiler"}], "totalCount": 2}
+    adapter = SeekAdapter(http_client=httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json=payload))
+    ))
+    client = TestClient(app)
+    body = {"keywords": "plumber", "location": "Sydney", "max_results": 2}
+
+    with patch.object(scrape_service, "get_adapter", lambda platform: adapter):
+        default = client.post("/scrape/seek", json=body)
+        arrow = client.post("/scrape/seek", json=body, headers={"Accept": ARROW_MEDIA_TYPE})
+        packed = client.post("/scrape/seek", json=body, headers={"Accept": MSGPACK_MEDIA_TYPE})
+
+    assert default.headers["content-type"] == JSON_MEDIA_TYPE
+    assert "Accept" in default.headers["Vary"].split(", ")
+
+    assert arrow.headers["content-type"] == ARROW_MEDIA_TYPE
+    assert "serialize;dur=" in arrow.headers["Server-Timing"]
+    table = pa.ipc.open_stream(arrow.content).read_all()
+    assert table.column("title").to_pylist() == ["Plumber", "Tiler"]
+
+    assert packed.headers["content-type"] == MSGPACK_MEDIA_TYPE
+    assert [job["source_id"] for job in msgpack.unpackb(packed.content)["jobs"]] == ["1", "2"]
@@ -62,6 +62,11 @@ builder.Services.AddHttpClient<IScrapeApiClient, ScrapeApiClient>(client =>
 {
     client.BaseAddress = new Uri(scrapeApiBaseUrl);
     client.Timeout = TimeSpan.FromMinutes(5);
+})
+.ConfigurePrimaryHttpMessageHandler(() => new HttpClientHandler
+{
+    // Scrape API compresses large responses when Accept-Encoding allows it
+    AutomaticDecompression = System.Net.DecompressionMethods.GZip
 });
 
 // Repository Services